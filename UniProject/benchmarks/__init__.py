@@ -0,0 +1 @@
+"""Benchmarks - Performance measurements for the data and UI layers."""
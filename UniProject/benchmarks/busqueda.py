@@ -0,0 +1,107 @@
+"""Search benchmark - FTS5 ranked search vs. LIKE over gestion_cultivo observations.
+
+Seeds observations made of random agronomy words (the FTS index is filled by
+the triggers as rows are inserted) and times a few typical queries.
+
+Usage::
+
+    python -m benchmarks.busqueda [--rows 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+WORDS = (
+    "riego goteo aspersión fertilizante nitrógeno potasio fósforo plaga pulgón "
+    "mosca blanca hongo roya mildiu poda cosecha siembra trasplante semilla "
+    "abono compost humedad sequía helada granizo maleza herbicida rotación "
+    "invernadero acolchado surco raíz tallo hoja flor fruto tubérculo bulbo "
+    "tomate maíz trigo limón papa cebolla lechuga zanahoria pimiento calabaza"
+).split()
+RARE = "nematodo"
+
+# (description, query text, LIKE pattern)
+QUERIES = [
+    ("palabra frecuente", "riego", "%riego%"),
+    ("palabra rara", RARE, f"%{RARE}%"),
+    ("prefijo corto", "tom", "%tom%"),
+    ("dos palabras", "plaga pulgón", "%plaga%pulgón%"),
+    ("sin acentos", "limon", "%limon%"),
+]
+
+
+def seed(path, rows, seed_value=7):
+    """Create a database with rows crop management records."""
+    from data import database
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    rng = random.Random(seed_value)
+
+    def observaciones():
+        for n in range(rows):
+            words = rng.choices(WORDS, k=rng.randint(6, 20))
+            if n % 10000 == 0:
+                words.append(RARE)
+            yield (" ".join(words).capitalize() + ".",)
+
+    with database.connection() as conn:
+        conn.executemany(
+            """INSERT INTO gestion_cultivo
+               (id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones)
+               VALUES (1, 1, 1, 1, NULL, ?)""",
+            observaciones()
+        )
+
+
+def best_of(repeat, fn):
+    """Best wall time of fn() in milliseconds and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FTS5 search latency")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        seed(os.path.join(tmp, "busqueda.db"), args.rows)
+        print(f"Observaciones: {args.rows} (carga con índice: {time.perf_counter() - start:.1f} s)")
+
+        from data.database import connection
+        from services.busqueda_service import BusquedaService
+
+        BusquedaService.optimize()
+        print(f"{'consulta':<18} {'FTS5 (ms)':>10} {'LIKE (ms)':>10} {'resultados':>11}")
+        for name, text, pattern in QUERIES:
+            fts_ms, found = best_of(args.repeat, lambda: BusquedaService.search(
+                text, ["gestion_cultivo"], args.limit))
+
+            def like():
+                with connection() as conn:
+                    return conn.execute(
+                        "SELECT codigo, observaciones FROM gestion_cultivo "
+                        "WHERE observaciones LIKE ? LIMIT ?", (pattern, args.limit)
+                    ).fetchall()
+            like_ms, _ = best_of(args.repeat, like)
+            print(f"{name:<18} {fts_ms:>10.1f} {like_ms:>10.1f} {len(found):>11}")
+        if found:
+            print(f"Ejemplo: {found[0][2]}: {found[0][3]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
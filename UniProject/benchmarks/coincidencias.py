@@ -0,0 +1,90 @@
+"""Fuzzy name benchmark - BK-tree lookups vs. comparing against every name.
+
+Builds a BK-tree over crop names with varieties, then looks up misspelled
+copies (one or two edits, accents dropped) and checks that the tree finds
+exactly what a linear scan with the same distance finds.
+
+Usage::
+
+    python -m benchmarks.coincidencias [--names 1000] [--lookups 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+
+CROPS = ("maíz", "trigo", "tomate", "limones", "papa", "pimentón", "calabacín", "ñame", "cebolla",
+         "zanahoria", "lechuga", "brócoli", "espárrago", "acelga", "perejil", "orégano", "albahaca",
+         "frijol", "arveja", "lenteja", "garbanzo", "yuca", "camote", "cacao", "café", "plátano",
+         "banano", "naranja", "mandarina", "aguacate", "mango", "papaya", "piña", "fresa", "uva",
+         "arroz", "cebada", "avena", "sorgo", "girasol")
+VARIETIES = ("", "criollo", "híbrido", "blanco", "amarillo", "morado", "dulce", "tardío", "precoz",
+             "orgánico", "enano", "gigante", "rojo", "verde", "negro", "andino", "costeño", "silvestre",
+             "injertado", "temprano", "de riego", "de secano", "de altura", "de valle", "mejorado")
+
+
+def make_names(count):
+    """Crop names with varieties, e.g. 'maíz criollo'."""
+    names = [f"{crop} {variety}".strip() for variety in VARIETIES for crop in CROPS]
+    return names[:count]
+
+
+def misspell(word, rng):
+    """Drop, swap or change one or two letters."""
+    letters = list(word)
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(letters))
+        action = rng.random()
+        if action < 0.33 and len(letters) > 3:
+            del letters[i]
+        elif action < 0.66:
+            letters[i] = rng.choice("aeioulmnrst")
+        else:
+            letters.insert(i, rng.choice("aeioulmnrst"))
+    return "".join(letters)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BK-tree fuzzy name lookups")
+    parser.add_argument("--names", type=int, default=len(CROPS) * len(VARIETIES))
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    from services.coincidencia_service import max_distance_for
+    from utils.fuzzy import BKTree, levenshtein
+    from utils.text_utils import fold
+
+    keys = [fold(nombre) for nombre in make_names(args.names)]
+    rng = random.Random(3)
+    queries = [fold(misspell(rng.choice(keys), rng)) for _ in range(args.lookups)]
+
+    start = time.perf_counter()
+    tree = BKTree(keys)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    tree_results = [tree.search(q, max_distance_for(q)) for q in queries]
+    tree_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    start = time.perf_counter()
+    scan_results = []
+    for q in queries:
+        limit = max_distance_for(q)
+        scan_results.append(sorted((d, k) for k in keys if (d := levenshtein(q, k)) <= limit))
+    scan_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    found = sum(1 for r in tree_results if r)
+    print(f"Nombres: {len(tree)} (árbol en {build_ms:.1f} ms)")
+    print(f"Búsquedas: {len(queries)}, con sugerencias: {found}")
+    print(f"BK-tree:         {tree_us:8.1f} µs/búsqueda")
+    print(f"Recorrido total: {scan_us:8.1f} µs/búsqueda")
+    if tree_results != scan_results:
+        print("ERROR: el BK-tree no encuentra lo mismo que el recorrido total")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""Cold start profile - Import and startup phase timings for the entry points.
+
+Starts main.py and the legacy ContabilidadAgricola.py headless (offscreen Qt)
+in fresh interpreters under ``-X importtime`` and records, up to the first
+interactive window:
+
+* import time per module (self and cumulative, as ``-X importtime`` prints it),
+* initialize_db, stylesheet application and each screen constructor,
+* the total time until the window has been shown and painted.
+
+The report is written as JSON so runs from different commits can be diffed,
+and each phase can be checked against a budget file.
+
+Usage::
+
+    python -m benchmarks.cold_start [--entry main] [--repeat 3]
+        [--output cold_start.json] [--budget benchmarks/cold_start_budget.json]
+        [--compare previous.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET = os.path.join(PROJECT_DIR, "benchmarks", "cold_start_budget.json")
+ENTRIES = ("main", "ContabilidadAgricola")
+TOP_IMPORTS = 25
+
+# Runs inside the child interpreter; prints the phase timings as JSON.
+_CHILD = r'''
+import time
+start = time.perf_counter()
+import json
+import sys
+
+phases = {}
+screens = {}
+
+
+def ms(since):
+    return (time.perf_counter() - since) * 1000
+
+
+def timed_init(cls, label):
+    original = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        begin = time.perf_counter()
+        original(self, *args, **kwargs)
+        if type(self) is cls:
+            screens[label] = screens.get(label, 0.0) + ms(begin)
+
+    cls.__init__ = __init__
+
+
+def timed_stylesheet(cls):
+    original = cls.setStyleSheet
+
+    def setStyleSheet(self, sheet):
+        begin = time.perf_counter()
+        original(self, sheet)
+        phases["stylesheet_ms"] = phases.get("stylesheet_ms", 0.0) + ms(begin)
+
+    cls.setStyleSheet = setStyleSheet
+
+
+entry, all_screens = sys.argv[1], sys.argv[2] == "1"
+
+begin = time.perf_counter()
+from PyQt5.QtWidgets import QApplication, QWidget
+phases["import_qt_ms"] = ms(begin)
+
+begin = time.perf_counter()
+if entry == "main":
+    import main as module
+    from ui.screens import registry
+    init_db = module.initialize_db
+
+    # Time building each screen on first show, including its module import
+    original_getitem = registry.ScreenRegistry.__getitem__
+
+    def __getitem__(self, name):
+        if self.is_loaded(name):
+            return original_getitem(self, name)
+        begin = time.perf_counter()
+        screen = original_getitem(self, name)
+        screens[name] = ms(begin)
+        return screen
+
+    registry.ScreenRegistry.__getitem__ = __getitem__
+else:
+    import ContabilidadAgricola
+    import screens as module
+    from db import inicializar_db as init_db
+    for name, value in list(vars(module).items()):
+        if (isinstance(value, type) and issubclass(value, QWidget)
+                and value is not module.MainWindow and value.__module__ == module.__name__):
+            timed_init(value, name)
+phases["import_entry_ms"] = ms(begin)
+timed_stylesheet(module.MainWindow)
+
+begin = time.perf_counter()
+init_db()
+phases["initialize_db_ms"] = ms(begin)
+
+begin = time.perf_counter()
+app = QApplication(sys.argv)
+phases["qapplication_ms"] = ms(begin)
+
+begin = time.perf_counter()
+window = module.MainWindow()
+phases["window_ms"] = ms(begin)
+
+begin = time.perf_counter()
+window.show()
+app.processEvents()
+window.repaint()
+phases["show_ms"] = ms(begin)
+phases["interactive_ms"] = ms(start)
+
+if all_screens and entry == "main":
+    window.screens.load_all()
+
+print(json.dumps({"phases": phases, "screens": screens}))
+'''
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` lines into (module, self_us, cumulative_us, depth)."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def _project_modules():
+    """Top-level module names that belong to this project."""
+    names = set()
+    for item in os.listdir(PROJECT_DIR):
+        path = os.path.join(PROJECT_DIR, item)
+        if item.endswith(".py"):
+            names.add(item[:-3])
+        elif os.path.isfile(os.path.join(path, "__init__.py")):
+            names.add(item)
+    return names
+
+
+def run_once(entry, all_screens=False):
+    """Start one entry point in a fresh interpreter; return its raw timings."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=PROJECT_DIR)
+    with tempfile.TemporaryDirectory() as tmp:
+        # Legacy modules open cultivos.db relative to the working directory
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _CHILD, entry, "1" if all_screens else "0"],
+            capture_output=True, text=True, env=env, cwd=tmp,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"{entry} failed to start:\n{result.stderr[-2000:]}")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data["imports"] = parse_importtime(result.stderr)
+    return data
+
+
+def profile_entry(entry, repeat=3, all_screens=False):
+    """Profile an entry point; every timing is the best of repeat runs."""
+    runs = [run_once(entry, all_screens) for _ in range(repeat)]
+    phases = {key: min(run["phases"].get(key, 0.0) for run in runs)
+              for key in runs[0]["phases"]}
+    screens = {key: min(run["screens"].get(key, 0.0) for run in runs)
+               for key in runs[0]["screens"]}
+
+    best = min(runs, key=lambda run: run["phases"]["interactive_ms"])
+    project = _project_modules()
+    imports = best["imports"]
+    phases["imports_total_ms"] = sum(i[1] for i in imports) / 1000
+    phases["project_imports_ms"] = sum(
+        i[1] for i in imports if i[0].split(".")[0] in project
+    ) / 1000
+    phases["screens_ms"] = sum(screens.values())
+    top = sorted(imports, key=lambda i: i[1], reverse=True)[:TOP_IMPORTS]
+    return {
+        "phases": {key: round(value, 2) for key, value in phases.items()},
+        "screens": {key: round(value, 2) for key, value in screens.items()},
+        "imports": [
+            {"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000,
+             "depth": depth}
+            for name, self_us, cumulative_us, depth in top
+        ],
+    }
+
+
+def check_budget(report, budget):
+    """Return (entry, phase, value, limit) for every phase over its budget."""
+    over = []
+    for entry, limits in budget.items():
+        phases = report["entries"].get(entry, {}).get("phases", {})
+        for phase, limit in limits.items():
+            value = phases.get(phase)
+            if value is not None and value > limit:
+                over.append((entry, phase, value, limit))
+    return over
+
+
+def compare(report, previous):
+    """Return (entry, phase, before, after) for phases present in both reports."""
+    rows = []
+    for entry, data in report["entries"].items():
+        old = previous.get("entries", {}).get(entry, {}).get("phases", {})
+        for phase, value in data["phases"].items():
+            if phase in old:
+                rows.append((entry, phase, old[phase], value))
+    return rows
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.cold_start",
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument("--entry", choices=ENTRIES + ("all",), default="all")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--all-screens", action="store_true",
+                        help="Construir también todas las pantallas de main.py tras el login")
+    parser.add_argument("--output", default="cold_start.json", help="Ruta del informe JSON")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET, help="Presupuesto por fase (JSON)")
+    parser.add_argument("--compare", help="Informe anterior con el que comparar")
+    args = parser.parse_args(argv)
+
+    entries = ENTRIES if args.entry == "all" else (args.entry,)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "entries": {entry: profile_entry(entry, args.repeat, args.all_screens) for entry in entries},
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    for entry, data in report["entries"].items():
+        print(f"{entry}:")
+        for phase, value in data["phases"].items():
+            print(f"    {phase:<22} {value:9.1f} ms")
+        for screen, value in data["screens"].items():
+            print(f"    pantalla {screen:<32} {value:6.1f} ms")
+    print(f"Informe escrito en {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"Comparación con {args.compare} ({previous.get('commit')}):")
+        for entry, phase, before, after in compare(report, previous):
+            print(f"    {entry}.{phase:<22} {before:9.1f} -> {after:9.1f} ms ({after - before:+.1f})")
+
+    over = []
+    if args.budget and os.path.exists(args.budget):
+        with open(args.budget, encoding="utf-8") as f:
+            over = check_budget(report, json.load(f))
+    for entry, phase, value, limit in over:
+        print(f"FUERA DE PRESUPUESTO: {entry}.{phase} = {value:.1f} ms (límite {limit} ms)")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
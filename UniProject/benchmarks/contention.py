@@ -0,0 +1,116 @@
+"""Contention benchmark - Concurrent readers and writers on one database file.
+
+Each reader and writer runs in its own process, the way two operators run
+separate copies of the application against the same cultivos.db.
+
+Usage::
+
+    python -m benchmarks.contention [--profiles safe desktop] [--readers 4]
+                                    [--writers 2] [--seconds 5] [--rows 2000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+
+def _seed(path, rows):
+    """Create a fresh database with rows hectareas."""
+    from data import database
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    HectareaRepository.upsert_many(
+        (n, "maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 20) for n in range(1, rows + 1)
+    )
+    database.close_pool()
+
+
+def _worker(role, path, profile, seconds, rows, results):
+    """Run reads or writes until the deadline and report counts and latencies."""
+    from data import database
+    from data.repositories.hectarea_repo import HectareaRepository
+    from data.repositories.catalogo_repo import CatalogoRepository
+
+    database.DATABASE_PATH = path
+    database.set_pragma_profile(profile)
+    rng = random.Random(os.getpid())
+    ops = locked = 0
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        numero = rng.randint(1, rows)
+        start = time.perf_counter()
+        try:
+            if role == "reader":
+                HectareaRepository.get_by_numero(numero)
+                CatalogoRepository.get_all_gestion_cultivo()
+            else:
+                HectareaRepository.update(numero, "trigo", "2024-01-01", "2024-04-30",
+                                          "2024-05-30", "Franco", rng.randint(10, 30))
+                CatalogoRepository.create_gestion_cultivo(1, 1, 1, 1, "", "benchmark")
+            ops += 1
+            latencies.append(time.perf_counter() - start)
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) and "busy" not in str(e):
+                raise
+            locked += 1
+    database.close_pool()
+    results.put((role, ops, locked, latencies))
+
+
+def run(profile, readers, writers, seconds, rows):
+    """Run one contention round for a PRAGMA profile and return a summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "contention.db")
+        _seed(path, rows)
+        results = multiprocessing.Queue()
+        roles = ["reader"] * readers + ["writer"] * writers
+        procs = [
+            multiprocessing.Process(target=_worker, args=(role, path, profile, seconds, rows, results))
+            for role in roles
+        ]
+        for p in procs:
+            p.start()
+        collected = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    summary = {"profile": profile}
+    for role in ("reader", "writer"):
+        entries = [c for c in collected if c[0] == role]
+        lat = sorted(l for c in entries for l in c[3])
+        ops = sum(c[1] for c in entries)
+        summary[role] = {
+            "ops_per_s": ops / seconds,
+            "locked": sum(c[2] for c in entries),
+            "p95_ms": lat[int(len(lat) * 0.95)] * 1000 if lat else None,
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent reader/writer benchmark")
+    parser.add_argument("--profiles", nargs="+", default=["safe", "desktop"])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"{'perfil':<12} {'rol':<7} {'ops/s':>10} {'bloqueos':>9} {'p95 ms':>9}")
+    for profile in args.profiles:
+        summary = run(profile, args.readers, args.writers, args.seconds, args.rows)
+        for role in ("reader", "writer"):
+            r = summary[role]
+            p95 = f"{r['p95_ms']:.2f}" if r["p95_ms"] is not None else "-"
+            print(f"{profile:<12} {role:<7} {r['ops_per_s']:>10.1f} {r['locked']:>9} {p95:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Date parsing benchmark - utils.date_utils against plain strptime/strftime.
+
+Usage::
+
+    python -m benchmarks.date_parsing [--values 200000] [--distinct 2000]
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta
+
+
+def strptime_parse(value):
+    """The previous parse_date: strptime on every call."""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def strftime_format(value):
+    """The previous format_date: strftime on every call."""
+    return value.strftime("%Y-%m-%d")
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ISO date parsing and formatting")
+    parser.add_argument("--values", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=2000,
+                        help="Fechas distintas entre los valores (como al listar hectáreas)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from utils import date_utils
+
+    base = date(2020, 1, 1)
+    texts = [(base + timedelta(days=n % args.distinct)).isoformat() for n in range(args.values)]
+    unique = [(base + timedelta(days=n)).isoformat() for n in range(args.values)]
+    dates = [strptime_parse(t) for t in texts]
+
+    def run(func, values):
+        for value in values:
+            func(value)
+
+    def uncached(values):
+        for value in values:
+            date_utils.parse_iso.__wrapped__(value)
+
+    cases = (
+        ("strptime, fechas repetidas", run, strptime_parse, texts),
+        ("parse_date, fechas repetidas", run, date_utils.parse_date, texts),
+        ("strptime, fechas distintas", run, strptime_parse, unique),
+        ("parse_iso sin caché, distintas", uncached, unique),
+        ("strftime", run, strftime_format, dates),
+        ("format_date", run, date_utils.format_date, dates),
+    )
+    print(f"Valores: {args.values} ({args.distinct} fechas distintas)")
+    for label, func, *call_args in cases:
+        seconds = best_of(args.repeat, func, *call_args)
+        print(f"{label:<32} {seconds / args.values * 1e9:8.0f} ns/valor")
+
+    loop = best_of(args.repeat, lambda: [strptime_parse(t) for t in texts])
+    bulk = best_of(args.repeat, date_utils.to_datetime64, texts)
+    print(f"{'lista con strptime':<32} {loop * 1000:8.1f} ms")
+    print(f"{'to_datetime64':<32} {bulk * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
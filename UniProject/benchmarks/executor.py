@@ -0,0 +1,106 @@
+"""Executor benchmark - Frame pacing while a slow query runs.
+
+Runs a query of about two seconds on the GUI thread and then through the
+query executor while a 60 fps timer ticks, and reports the gaps between
+frames.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.executor [--seconds 2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+FRAME_MS = 1000 / 60
+
+_SLOW_QUERY = """
+    WITH RECURSIVE serie(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM serie LIMIT ?)
+    SELECT SUM(x) FROM serie
+"""
+
+
+def slow_query(rows):
+    """Run a CPU-bound query over rows generated values."""
+    from data import database
+
+    with database.connection() as conn:
+        return conn.execute(_SLOW_QUERY, (rows,)).fetchone()[0]
+
+
+def calibrate(seconds):
+    """Find how many generated rows take about the requested time."""
+    rows = 100000
+    while True:
+        start = time.perf_counter()
+        slow_query(rows)
+        elapsed = time.perf_counter() - start
+        if elapsed > 0.2:
+            return int(rows * seconds / elapsed)
+        rows *= 4
+
+
+def measure_frames(app, start_query, is_done):
+    """Tick a 60 fps timer until the query finishes; return frame gaps in ms."""
+    from PyQt5.QtCore import QTimer
+
+    ticks = []
+    timer = QTimer()
+    timer.setInterval(int(FRAME_MS))
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start()
+    ticks.append(time.perf_counter())
+    start_query()
+    while not is_done():
+        app.processEvents()
+        time.sleep(0.001)
+    timer.stop()
+    ticks.append(time.perf_counter())
+    return [(b - a) * 1000 for a, b in zip(ticks, ticks[1:])]
+
+
+def report(label, gaps):
+    late = sum(1 for gap in gaps if gap > FRAME_MS * 1.5)
+    print(f"{label}: {len(gaps)} cuadros, peor intervalo {max(gaps):.0f} ms, "
+          f"{late} cuadros tardíos")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame pacing with a slow query")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from data import database
+    from ui.executor import QueryExecutor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = os.path.join(tmp, "executor.db")
+        database.initialize_db()
+        app = QApplication.instance() or QApplication(sys.argv)
+        rows = calibrate(args.seconds)
+
+        done = []
+        gaps = measure_frames(app, lambda: done.append(slow_query(rows)), lambda: done)
+        report("Consulta en el hilo de la interfaz", gaps)
+
+        executor = QueryExecutor()
+        done = []
+        gaps = measure_frames(
+            app, lambda: executor.submit("lenta", slow_query, rows, on_result=done.append),
+            lambda: done
+        )
+        report("Consulta con QueryExecutor", gaps)
+        stats = executor.stats()["lenta"]
+        print(f"Latencia de la llamada: {stats['last_ms']:.0f} ms "
+              f"(espera en cola {stats['wait_ms']:.1f} ms)")
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
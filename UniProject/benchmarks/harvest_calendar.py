@@ -0,0 +1,66 @@
+"""Harvest calendar benchmark - Range queries over recurring harvests.
+
+Builds a HarvestCalendar for many hectareas and times range queries of
+growing length, reporting peak memory while the events are streamed.
+
+Usage::
+
+    python -m benchmarks.harvest_calendar [--rows 1000000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import date
+
+import numpy as np
+
+
+CROPS = ["maíz", "trigo", "tomate", "limones", "papa"]
+
+
+def make_calendar(rows, seed=3):
+    """Calendar for random hectareas sown over three years."""
+    from core.harvest_calendar import HarvestCalendar
+
+    rng = np.random.default_rng(seed)
+    base = date(2022, 1, 1).toordinal()
+    primera = base + rng.integers(60, 365 * 3, rows)
+    rutinaria = primera + rng.integers(15, 60, rows)
+    return HarvestCalendar(np.arange(1, rows + 1), rng.integers(0, len(CROPS), rows),
+                           CROPS, primera, rutinaria)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Harvest calendar range queries")
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    calendar = make_calendar(args.rows)
+    print(f"Hectáreas: {args.rows}, índice construido en {time.perf_counter() - start:.2f} s")
+
+    desde = date(2025, 3, 1)
+    for years in (1, 10, 100):
+        hasta = date(desde.year + years, 3, 1)
+        start = time.perf_counter()
+        total = calendar.count(desde, hasta)
+        count_ms = (time.perf_counter() - start) * 1000
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        events = calendar.events(desde, hasta)
+        next(events)
+        first_ms = (time.perf_counter() - start) * 1000
+        # Stream one month of events to show memory does not depend on the range
+        for event in events:
+            if event.fecha.month != desde.month:
+                break
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{years:>3} años: {total:>12,} cosechas, conteo {count_ms:6.1f} ms, "
+              f"primer evento {first_ms:6.1f} ms, memoria máx. {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
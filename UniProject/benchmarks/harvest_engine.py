@@ -0,0 +1,82 @@
+"""Harvest engine benchmark - Whole-farm recomputation with core.harvest.
+
+Times compute_schedule over random sowing dates and crops (leap days
+included), then checks a sample row by row against Hectarea.
+
+Usage::
+
+    python -m benchmarks.harvest_engine [--rows 1000000] [--check 20000]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+
+CROPS = ["maíz", "trigo", "tomate", "limones", "Papa"]
+
+
+def make_inputs(rows, seed=7):
+    """Random sowing dates 2000-2030 (forcing some 29 Feb) and crop codes."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2000-01-01", "D")
+    siembra = start + rng.integers(0, 365 * 30, rows).astype("timedelta64[D]")
+    siembra[rng.random(rows) < 0.01] = np.datetime64("2024-02-29", "D")
+    crop_codes = rng.integers(0, len(CROPS), rows)
+    # A tenth of the rows carry a manually entered first harvest
+    primera = np.full(rows, np.datetime64("NaT"), dtype="datetime64[D]")
+    manual = rng.random(rows) < 0.1
+    primera[manual] = siembra[manual] + rng.integers(1, 400, manual.sum()).astype("timedelta64[D]")
+    return siembra, crop_codes, primera
+
+
+def check(siembra, crop_codes, primera, result, sample):
+    """Compare sampled rows with Hectarea; return the mismatching indexes."""
+    from core.models import Hectarea
+
+    first, routine, valid = result
+    mismatches = []
+    for i in range(min(sample, len(siembra))):
+        manual = None if np.isnat(primera[i]) else str(primera[i])
+        try:
+            h = Hectarea(i, CROPS[crop_codes[i]], str(siembra[i]), manual).to_dict()
+            expected = (True, h["primera_cosecha"], h["cosecha_rutinaria"])
+        except (ValueError, OverflowError):
+            expected = (False, "NaT", "NaT")
+        if (bool(valid[i]), str(first[i]), str(routine[i])) != expected:
+            mismatches.append(i)
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vectorized harvest schedule throughput")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--check", type=int, default=20000, help="Filas a comparar con Hectarea")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from core.harvest import compute_schedule
+
+    siembra, crop_codes, primera = make_inputs(args.rows)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = compute_schedule(siembra, crop_codes, CROPS, primera)
+        timings.append(time.perf_counter() - start)
+
+    print(f"Hectáreas: {args.rows}")
+    print(f"compute_schedule: mejor {min(timings) * 1000:.0f} ms, "
+          f"{int((~result[2]).sum())} filas inválidas (29 de febrero en limones)")
+
+    mismatches = check(siembra, crop_codes, primera, result, args.check)
+    if mismatches:
+        print(f"DIFERENCIAS con Hectarea en {len(mismatches)} filas, p. ej. {mismatches[:5]}")
+        return 1
+    print(f"{min(args.check, args.rows)} filas coinciden con Hectarea.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
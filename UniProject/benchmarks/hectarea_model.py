@@ -0,0 +1,80 @@
+"""Hectarea model benchmark - Memory per hectarea and construction throughput.
+
+Compares Hectarea objects, HectareaRecord objects and a HectareaBatch built
+from the same stored rows.
+
+Usage::
+
+    python -m benchmarks.hectarea_model [--rows 1000000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+
+CROPS = ("maíz", "trigo", "tomate", "limones", "papa")
+SOILS = ("Arenoso", "Limoso", "Franco", "Arcilloso")
+
+
+def make_rows(count):
+    """Generate stored-style rows: (numero, tipo, siembra, primera, rutinaria, suelo, temp)."""
+    base = date(2020, 1, 1)
+    rows = []
+    for n in range(count):
+        siembra = base + timedelta(days=n % 1500)
+        rows.append((
+            n + 1, CROPS[n % len(CROPS)], siembra.isoformat(),
+            (siembra + timedelta(days=90)).isoformat(),
+            (siembra + timedelta(days=120)).isoformat(),
+            SOILS[n % len(SOILS)], 15.0 + n % 20,
+        ))
+    return rows
+
+
+def measure(build, rows):
+    """Return (seconds, bytes retained) for building from rows."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build(rows)
+    seconds = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build(rows)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return seconds, retained
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hectarea memory and construction throughput")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--hectarea-rows", type=int, default=200000,
+                        help="Filas para Hectarea (más lento y pesado; se extrapola por fila)")
+    args = parser.parse_args(argv)
+
+    from core.models import Hectarea, HectareaBatch, HectareaRecord
+
+    rows = make_rows(args.rows)
+    legacy_rows = rows[:args.hectarea_rows]
+    cases = (
+        ("Hectarea", legacy_rows,
+         lambda rs: [Hectarea(n, t, s, p, r, suelo, temp) for n, t, s, p, r, suelo, temp in rs]),
+        ("HectareaRecord", rows, lambda rs: [HectareaRecord.from_row(r) for r in rs]),
+        ("HectareaBatch", rows, HectareaBatch.from_rows),
+    )
+    print(f"Filas: {args.rows}")
+    for label, case_rows, build in cases:
+        seconds, retained = measure(build, case_rows)
+        count = len(case_rows)
+        print(f"{label:<15} {retained / count:7.1f} bytes/hectárea  "
+              f"{count / seconds:12,.0f} filas/s  ({count} filas, {seconds:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
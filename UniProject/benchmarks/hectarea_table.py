@@ -0,0 +1,64 @@
+"""Hectarea table benchmark - Time to first screen of the virtualized listing.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.hectarea_table [--rows 500000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+SEED_BATCH = 50000
+
+
+def seed(path, rows):
+    """Create a database with rows hectareas."""
+    from data import database
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    for first in range(1, rows + 1, SEED_BATCH):
+        HectareaRepository.upsert_many(
+            (n, "maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 20)
+            for n in range(first, min(first + SEED_BATCH, rows + 1))
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time to first screen of HectareaTableView")
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from ui.widgets.hectarea_table import HectareaTableView
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(os.path.join(tmp, "tabla.db"), args.rows)
+        app = QApplication.instance() or QApplication(sys.argv)
+        view = HectareaTableView()
+        view.resize(900, 600)
+        view.show()
+        app.processEvents()
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            view.refresh()
+            view.viewport().repaint()
+            app.processEvents()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        print(f"Hectáreas en la tabla: {args.rows}")
+        print(f"Filas cargadas tras la primera pantalla: {view.model().rowCount()}")
+        print(f"Primera pantalla: mejor {min(timings):.1f} ms, peor {max(timings):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Report benchmark - Time to first page and total time of the streamed report.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.informe [--rows 200000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+def seed(path, rows):
+    """Create a database with rows crop management records."""
+    from data import database
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    with database.connection() as conn:
+        conn.executemany(
+            """INSERT INTO gestion_cultivo
+               (id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones)
+               VALUES (1, 1, 1, 1, 'https://example.com/video', ?)""",
+            ((f"Observación {n}",) for n in range(rows))
+        )
+
+
+def full_build(app, area):
+    """Build the whole report with += and show it at once (previous behaviour)."""
+    from services.catalogo_service import CatalogoService
+
+    start = time.perf_counter()
+    texto = ""
+    for r in CatalogoService.get_all_gestion_cultivo():
+        texto += (f"Código: {r[0]}\nUsuario: {r[1]}\nTipo Hortaliza: {r[2]}\n"
+                  f"Tipo Suelo: {r[3]}\nClima: {r[4]}\nVideo: {r[5]}\n"
+                  f"Observaciones: {r[6]}\n" + "-" * 40 + "\n")
+    area.setPlainText(texto)
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def streamed(app, view):
+    """Stream the report; return (seconds to first chunk, total seconds, records)."""
+    from services.report_service import ReportService
+
+    first = []
+    done = []
+    start = time.perf_counter()
+    view.progress.valueChanged.connect(
+        lambda value: value and not first and first.append(time.perf_counter() - start)
+    )
+    view.loaded.connect(lambda records: done.append((time.perf_counter() - start, records)))
+    view.load(ReportService.iter_gestion_report, ReportService.count_gestion_report)
+    while not done:
+        app.processEvents()
+        time.sleep(0.001)
+    return first[0], done[0][0], done[0][1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streamed vs. full crop management report")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--skip-full", action="store_true",
+                        help="No medir el informe completo con +=")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication, QTextEdit
+    from ui.widgets.report_view import ReportView
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(os.path.join(tmp, "informe.db"), args.rows)
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        view = ReportView()
+        view.resize(900, 600)
+        view.show()
+        first, total, records = streamed(app, view)
+        print(f"Registros de gestión: {records}")
+        print(f"Informe por bloques: primera página {first * 1000:.1f} ms, total {total:.2f} s")
+
+        if not args.skip_full:
+            area = QTextEdit()
+            area.resize(900, 600)
+            area.show()
+            print(f"Informe completo con +=: {full_build(app, area):.2f} s sin responder")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Folded name benchmark - Accent-insensitive lookups vs. exact indexed lookups.
+
+Seeds a large tipo_hortaliza catalog with accented Spanish names and times
+looking names up as an operator would type them (no accents, any case):
+
+* exact: ``nombre = ?`` with the accented name (the UNIQUE index)
+* clave: ``nombre_clave = pliegue(?)`` with the unaccented input
+* like: ``nombre LIKE ?`` with the unaccented input (misses accented names)
+* scan: ``pliegue(nombre) = ?`` folding every row at query time
+
+Usage::
+
+    python -m benchmarks.nombre_clave [--rows 200000] [--lookups 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+WORDS = ("Raíces", "Tubérculos", "maíz", "Limón", "Ñame", "Pimentón", "Calabacín",
+         "Jengibre", "Brócoli", "Espárrago", "Acelga", "Perejil", "Orégano", "Albahaca")
+
+
+def make_names(rows, seed=7):
+    """Unique accented names such as 'Raíces Limón 123'."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(WORDS)} {rng.choice(WORDS)} {n}" for n in range(rows)]
+
+
+def seed(path, names):
+    """Create a database holding names in tipo_hortaliza."""
+    from data import database
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    with database.connection() as conn:
+        conn.executemany(
+            "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, '', '')",
+            ((nombre,) for nombre in names)
+        )
+
+
+def timed(conn, sql, params):
+    """Microseconds per lookup and the number of lookups that found a row."""
+    found = 0
+    start = time.perf_counter()
+    for value in params:
+        found += conn.execute(sql, (value,)).fetchone() is not None
+    return (time.perf_counter() - start) / len(params) * 1e6, found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Accent-insensitive catalog lookups")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--scan-lookups", type=int, default=20,
+                        help="Búsquedas con recorrido completo (lentas)")
+    args = parser.parse_args(argv)
+
+    from utils.text_utils import fold
+
+    names = make_names(args.rows)
+    sample = random.Random(3).sample(names, min(args.lookups, len(names)))
+    typed = [fold(nombre).upper() if i % 2 else fold(nombre) for i, nombre in enumerate(sample)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(os.path.join(tmp, "nombres.db"), names)
+        from data.database import connection
+
+        with connection() as conn:
+            results = [
+                ("exacto (nombre = ?)", timed(conn, "SELECT codigo FROM tipo_hortaliza WHERE nombre = ?", sample)),
+                ("clave (nombre_clave)", timed(
+                    conn, "SELECT codigo FROM tipo_hortaliza WHERE nombre_clave = pliegue(?)", typed)),
+                ("LIKE sin acentos", timed(conn, "SELECT codigo FROM tipo_hortaliza WHERE nombre LIKE ?",
+                                           typed[:args.scan_lookups])),
+                ("pliegue() por fila", timed(conn, "SELECT codigo FROM tipo_hortaliza WHERE pliegue(nombre) = ?",
+                                             [fold(t) for t in typed[:args.scan_lookups]])),
+            ]
+
+    print(f"Nombres: {args.rows}")
+    print(f"{'consulta':<22} {'µs/búsqueda':>12} {'encontrados':>12}")
+    for name, (micros, found) in results:
+        total = args.lookups if name.startswith(("exacto", "clave")) else args.scan_lookups
+        print(f"{name:<22} {micros:>12.1f} {found:>7}/{total}")
+    exact, folded = results[0][1][0], results[1][1][0]
+    if results[1][1][1] != len(typed) or folded > exact * 3:
+        print("ERROR: la búsqueda por clave no encuentra todo o es mucho más lenta que la exacta")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
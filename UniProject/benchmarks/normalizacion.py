@@ -0,0 +1,172 @@
+"""Normalization benchmark - hectareas with name columns vs. catalog ids.
+
+Seeds hectareas at schema version 6, where crop and soil are stored as text,
+and times the crop and soil filtered first pages the repositories issued
+then plus a full table scan. Runs migration 7 in chunks, VACUUMs, times the
+same pages through HectareaRepository.fetch_page, and checks every row
+reads back the same names. Page counts of the table and its indexes are
+reported for both. Soils are skewed so the rarest one is selective.
+
+Usage::
+
+    python -m benchmarks.normalizacion [--rows 500000] [--chunk-size 5000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+
+CROPS = ("maíz", "trigo", "tomate", "limones", "papa", "pimentón", "calabacín", "ñame", "cebolla",
+         "zanahoria", "lechuga", "brócoli", "frijol", "arveja", "yuca", "plátano", "aguacate", "café")
+VARIETIES = ("criollo", "híbrido", "blanco", "amarillo", "morado", "dulce", "tardío", "precoz",
+             "orgánico", "andino", "costeño", "de riego", "de secano", "mejorado")
+SOILS = ("Franco", "Arcilloso", "Arenoso", "Limoso", "Franco arcilloso", "Franco arenoso",
+         "Orgánico", "Calizo", "Pedregoso", "Volcánico")
+SOIL_WEIGHTS = (30, 20, 15, 12, 8, 6, 4, 3, 1.5, 0.5)
+PAGE_SIZE = 500
+
+_TEXT_PAGE = """
+    SELECT id, numero, tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria, tipo_suelo, temperatura
+    FROM hectareas WHERE numero IS NOT NULL AND {column} = ? ORDER BY numero ASC LIMIT ?
+"""
+
+
+def seed(conn, rows):
+    """Fill a version 6 database with rows hectareas named as free text."""
+    from data.migrations import migrate
+
+    migrate(conn, 6)
+    rng = random.Random(5)
+    crops = [f"{crop} {variety}" for crop in CROPS for variety in VARIETIES]
+    conn.execute("BEGIN")
+    conn.executemany(
+        """INSERT INTO hectareas
+           (numero, tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria, tipo_suelo, temperatura)
+           VALUES (?, ?, '2024-01-01', '2024-03-21', '2024-04-10', ?, ?)""",
+        ((n, rng.choice(crops), rng.choices(SOILS, SOIL_WEIGHTS)[0], rng.randint(5, 35))
+         for n in range(1, rows + 1))
+    )
+    conn.execute("COMMIT")
+    return crops
+
+
+def pages(conn):
+    """Pages used by hectareas and each of its indexes, and by the whole file."""
+    sizes = dict(conn.execute(
+        "SELECT name, COUNT(*) FROM dbstat WHERE name IN "
+        "(SELECT name FROM sqlite_master WHERE tbl_name = 'hectareas') GROUP BY name"
+    ))
+    return sizes, conn.execute("PRAGMA page_count").fetchone()[0]
+
+
+def time_ms(fetch, names, repeat):
+    """Average milliseconds of fetch(name) over names, repeated."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for name in names:
+            fetch(name)
+    return (time.perf_counter() - start) / (repeat * len(names)) * 1000
+
+
+def query(sql, params=()):
+    """Run sql on a pooled connection, as the repositories do."""
+    from data.database import connection
+
+    with connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def report(title, sizes, total):
+    print(f"{title}: {total} páginas en el archivo")
+    for name, count in sorted(sizes.items()):
+        print(f"    {name:<32} {count:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Name columns vs. catalog ids in hectareas")
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    from data import database
+    from data.migrations import migrate
+
+    scan = "SELECT AVG(temperatura) FROM hectareas"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "normalizacion.db")
+        conn = sqlite3.connect(path, isolation_level=None)
+        crops = seed(conn, args.rows)
+        crop_names = random.Random(9).sample(crops, 20)
+        conn.execute("VACUUM")
+        before = conn.execute(
+            "SELECT numero, lower(tipo_de_cultivo), tipo_suelo FROM hectareas ORDER BY numero"
+        ).fetchall()
+        text_sizes, text_total = pages(conn)
+        conn.close()
+
+        database.DATABASE_PATH = path
+        text_crop = time_ms(lambda name: query(_TEXT_PAGE.format(column="tipo_de_cultivo"), (name, PAGE_SIZE)),
+                            crop_names, args.repeat)
+        text_soil = time_ms(lambda name: query(_TEXT_PAGE.format(column="tipo_suelo"), (name, PAGE_SIZE)),
+                            SOILS, args.repeat)
+        text_rare = time_ms(lambda name: query(_TEXT_PAGE.format(column="tipo_suelo"), (name, PAGE_SIZE)),
+                            SOILS[-1:], args.repeat)
+        text_scan = time_ms(lambda _: query(scan), (None,), args.repeat)
+        database.close_pool()
+
+        chunks = []
+        last = [time.perf_counter()]
+
+        def progress(migration, moved):
+            now = time.perf_counter()
+            chunks.append(now - last[0])
+            last[0] = now
+
+        conn = sqlite3.connect(path, isolation_level=None)
+        start = time.perf_counter()
+        migrate(conn, chunk_size=args.chunk_size, progress=progress)
+        migrate_s = time.perf_counter() - start
+        # The swap (drop, rename and index build) runs after the last chunk
+        finish_s = start + migrate_s - last[0]
+        conn.execute("VACUUM")
+        id_sizes, id_total = pages(conn)
+        conn.close()
+
+        from data.repositories.hectarea_repo import HectareaRepository
+
+        id_crop = time_ms(lambda name: HectareaRepository.fetch_page(limit=PAGE_SIZE, tipo_de_cultivo=name),
+                          crop_names, args.repeat)
+        id_soil = time_ms(lambda name: HectareaRepository.fetch_page(limit=PAGE_SIZE, tipo_suelo=name),
+                          SOILS, args.repeat)
+        id_rare = time_ms(lambda name: HectareaRepository.fetch_page(limit=PAGE_SIZE, tipo_suelo=name),
+                          SOILS[-1:], args.repeat)
+        id_scan = time_ms(lambda _: query(scan), (None,), args.repeat)
+        after = [tuple(row) for row in HectareaRepository.iter_all(
+            5000, ("numero", "tipo_de_cultivo", "tipo_suelo"))]
+        database.close_pool()
+
+    print(f"Hectáreas: {args.rows}, cultivos distintos: {len(crops)}, suelos: {len(SOILS)}")
+    report("Nombres en hectareas (versión 6)", text_sizes, text_total)
+    report("Ids de catálogo (versión 7)", id_sizes, id_total)
+    print(f"Migración: {migrate_s:.2f} s en {len(chunks)} bloques de {args.chunk_size} "
+          f"(bloque más largo {max(chunks, default=0) * 1000:.0f} ms, paso final {finish_s * 1000:.0f} ms)")
+    print(f"Primera página filtrada ({PAGE_SIZE} filas):")
+    print(f"    por cultivo   nombres {text_crop:7.2f} ms   ids {id_crop:7.2f} ms")
+    print(f"    por suelo     nombres {text_soil:7.2f} ms   ids {id_soil:7.2f} ms")
+    print(f"    suelo escaso  nombres {text_rare:7.2f} ms   ids {id_rare:7.2f} ms   ({SOILS[-1]})")
+    print(f"Recorrido completo:       nombres {text_scan:7.2f} ms   ids {id_scan:7.2f} ms")
+    if before != after:
+        print("ERROR: los nombres leídos tras la migración no coinciden")
+        return 1
+    print("Todas las hectáreas conservan su cultivo y suelo.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Recalculation benchmark - Chunked set-based rewrite vs. row-by-row updates.
+
+Seeds hectareas of one crop (a tenth with hand-entered dates), changes the
+crop's cycle through CatalogoService, interrupts the job once and resumes
+it, then checks every row against Hectarea with the new cycle. The
+row-by-row time is extrapolated from HectareaRepository.update on a sample.
+
+Usage::
+
+    python -m benchmarks.recalculo [--rows 200000] [--chunk-size 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+CROP = "papa"
+
+
+def seed(path, rows):
+    """Create a database with rows hectareas of CROP; return the manual numeros."""
+    from data import database
+    from core.models import Hectarea
+    from data.repositories.catalogo_repo import CatalogoRepository
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    # CROP starts in the catalog with no cycle of its own
+    CatalogoRepository.create_tipo_cultivo(CROP, None, None)
+    rng = random.Random(7)
+    manual = set()
+    params = []
+    for numero in range(1, rows + 1):
+        siembra = (date(2020, 1, 1) + timedelta(days=rng.randrange(3650))).isoformat()
+        primera = None
+        if rng.random() < 0.1:
+            manual.add(numero)
+            # Never the computed siembra + 80 days, which would look automatic
+            primera = (date.fromisoformat(siembra) + timedelta(days=rng.randrange(81, 400))).isoformat()
+        data = Hectarea(numero, CROP, siembra, primera).to_dict()
+        params.append((numero, CROP, data["siembra"], data["primera_cosecha"],
+                       data["cosecha_rutinaria"], "Franco", 20.0))
+    HectareaRepository.upsert_many(params)
+    return manual
+
+
+def row_by_row(sample):
+    """Seconds per hectarea for read + recompute + HectareaRepository.update."""
+    from core.models import Hectarea
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    start = time.perf_counter()
+    for numero in range(1, sample + 1):
+        row = HectareaRepository.get_by_numero(numero)
+        h = Hectarea(row[1], row[2], row[3]).to_dict()
+        HectareaRepository.update(numero, row[2], row[3], h["primera_cosecha"],
+                                  h["cosecha_rutinaria"], row[6], row[7])
+    return (time.perf_counter() - start) / sample
+
+
+def verify(manual, before):
+    """Count rows that do not match Hectarea with the new cycle (or changed if manual)."""
+    from core.models import Hectarea
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    wrong = 0
+    for row in HectareaRepository.iter_all(5000):
+        numero, siembra = row["numero"], row["siembra"]
+        if numero in manual:
+            expected = before[numero]
+        else:
+            h = Hectarea(numero, CROP, siembra).to_dict()
+            expected = (h["primera_cosecha"], h["cosecha_rutinaria"])
+        wrong += (row["primera_cosecha"], row["cosecha_rutinaria"]) != expected
+    return wrong
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Harvest recalculation after a cycle change")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--sample", type=int, default=2000, help="Filas para medir fila a fila")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manual = seed(os.path.join(tmp, "recalculo.db"), args.rows)
+        from data.repositories.hectarea_repo import HectareaRepository
+        from services.catalogo_service import CatalogoService
+        from services.recalculo_service import RecalculoService
+
+        before = {row["numero"]: (row["primera_cosecha"], row["cosecha_rutinaria"])
+                  for row in HectareaRepository.iter_all(5000)}
+        cultivo_id = next(row[0] for row in CatalogoService.get_tipo_cultivo_full() if row[1] == CROP)
+        CatalogoService.update_tipo_cultivo(cultivo_id, CROP, 4, 1)
+        jobs = RecalculoService.get_pending()
+        print(f"Hectáreas: {args.rows} ({len(manual)} con fechas manuales), trabajos: {len(jobs)}")
+
+        chunks = []
+        start = time.perf_counter()
+        partial = RecalculoService.run_pending(
+            args.chunk_size, progress=lambda *a: chunks.append(a),
+            cancelled=lambda: len(chunks) >= 3,
+        )
+        resumed = RecalculoService.run_pending(args.chunk_size, progress=lambda *a: chunks.append(a))
+        elapsed = time.perf_counter() - start
+        if not (partial["success"] and resumed["success"]):
+            print(f"Error: {partial.get('error') or resumed.get('error')}")
+            return 1
+
+        tipo, procesadas, total = chunks[-1]
+        print(f"Interrumpido tras 3 bloques y reanudado: {procesadas}/{total} procesadas, "
+              f"{partial['actualizadas'] + resumed['actualizadas']} actualizadas en {elapsed:.2f} s")
+        wrong = verify(manual, before)
+        if wrong or RecalculoService.get_pending():
+            print(f"ERROR: {wrong} filas no coinciden con Hectarea")
+            return 1
+        print("Todas las filas coinciden con Hectarea; las fechas manuales no cambiaron.")
+
+        per_row = row_by_row(min(args.sample, args.rows))
+        print(f"Fila a fila (estimado): {per_row * args.rows:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Startup benchmark - Time from process start to the login screen.
+
+Each run is a fresh interpreter so module imports are included. "eager"
+builds every screen before showing the login screen, as MainWindow used
+to; "lazy" relies on the screen registry.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.startup [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+
+_RUN = """
+import time
+start = time.perf_counter()
+import sys
+from PyQt5.QtWidgets import QApplication
+from data import database
+database.DATABASE_PATH = sys.argv[1]
+import main
+database.initialize_db()
+app = QApplication(sys.argv)
+window = main.MainWindow()
+if sys.argv[2] == "eager":
+    window.screens.load_all()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start, len(window.screens.loaded()), len(sys.modules))
+"""
+
+
+def run_once(db_path, mode):
+    """Start the app in a new process; return (seconds, screens built, modules)."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run(
+        [sys.executable, "-c", _RUN, db_path, mode],
+        capture_output=True, text=True, check=True, env=env,
+    ).stdout.split()
+    return float(output[0]), int(output[1]), int(output[2])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time to login screen, eager vs. lazy screens")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "startup.db")
+        run_once(db_path, "lazy")  # create the schema outside the timings
+
+        for mode, label in (("eager", "Todas las pantallas"), ("lazy", "Registro perezoso")):
+            runs = [run_once(db_path, mode) for _ in range(args.repeat)]
+            best = min(r[0] for r in runs) * 1000
+            _, screens, modules = runs[0]
+            print(f"{label}: mejor {best:.0f} ms hasta el login "
+                  f"({screens} pantallas construidas, {modules} módulos cargados)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Suggestions benchmark - Per-keystroke cost of search-as-you-type.
+
+Seeds hectareas with varied crop and soil names plus a tipo_hortaliza
+catalog, builds the suggestion index through SugerenciaService, then types
+sample queries one character at a time into an IncrementalSearch and times
+each lookup + popup model update. The same prefixes are also timed as the
+LIKE queries a per-keystroke database search would run.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.sugerencias [--rows 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+CROPS = ("maíz", "trigo", "tomate", "limones", "papa", "pimentón", "calabacín", "ñame")
+SOILS = ("Franco", "Arcilloso", "Arenoso", "Limoso", "Orgánico")
+QUERIES = ("12", "4567", "99999", "1000000", "zz", "mai", "pim", "CALA", "Arc", "org", "ñam", "Bró", "Raí")
+
+BUDGET_MS = 5.0
+SEED_BATCH = 50000
+
+
+def seed(path, rows, names):
+    """Create a database with rows hectareas and names tipo_hortaliza rows."""
+    from data import database
+    from data.repositories.catalogo_repo import CatalogoRepository
+    from data.repositories.hectarea_repo import HectareaRepository
+
+    database.DATABASE_PATH = path
+    database.initialize_db()
+    # Hectareas only take names the catalogs hold
+    CatalogoRepository.upsert_many(
+        "tipo_cultivo", ((f"{crop} {n}", None, None) for crop in CROPS for n in range(500))
+    )
+    CatalogoRepository.upsert_many(
+        "tipo_suelo", ((f"{soil} {n}", None, None) for soil in SOILS for n in range(50))
+    )
+    rng = random.Random(7)
+    for first in range(1, rows + 1, SEED_BATCH):
+        HectareaRepository.upsert_many(
+            (n, f"{rng.choice(CROPS)} {n % 500}", "2024-01-01", "2024-03-31", "2024-04-30",
+             f"{rng.choice(SOILS)} {n % 50}", 20)
+            for n in range(first, min(first + SEED_BATCH, rows + 1))
+        )
+    with database.connection() as conn:
+        conn.executemany(
+            "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, '', '')",
+            ((f"{rng.choice(('Raíces', 'Brócoli', 'Tubérculos', 'Acelga'))} {n}",) for n in range(names))
+        )
+
+
+def like_ms(prefixes):
+    """Milliseconds per prefix for the LIKE queries a database search would run."""
+    from data.database import connection
+
+    start = time.perf_counter()
+    with connection() as conn:
+        for prefix in prefixes:
+            if prefix.isdigit():
+                conn.execute("SELECT numero FROM hectareas WHERE CAST(numero AS TEXT) LIKE ? LIMIT 20",
+                             (prefix + "%",)).fetchall()
+            else:
+                conn.execute("""SELECT DISTINCT lower(tc.nombre) FROM hectareas h
+                                JOIN tipo_cultivo tc ON tc.id = h.id_tipo_cultivo
+                                WHERE tc.nombre LIKE ? LIMIT 20""",
+                             (prefix + "%",)).fetchall()
+    return (time.perf_counter() - start) / len(prefixes) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search-as-you-type per-keystroke latency")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--names", type=int, default=20000)
+    parser.add_argument("--like-samples", type=int, default=10,
+                        help="Prefijos medidos con LIKE (lentos)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication, QLineEdit
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(os.path.join(tmp, "sugerencias.db"), args.rows, args.names)
+        app = QApplication.instance() or QApplication(sys.argv)
+        from services.sugerencia_service import SugerenciaService
+        from ui.executor import query_executor
+        from ui.widgets.search_completer import IncrementalSearch
+
+        start = time.perf_counter()
+        size = SugerenciaService.build_index()
+        build_s = time.perf_counter() - start
+
+        edit = QLineEdit()
+        edit.show()
+        edit.setFocus()
+        search = IncrementalSearch(edit, query_executor())
+        prefixes = [query[:n] for query in QUERIES for n in range(1, len(query) + 1)]
+        timings = []
+        for prefix in prefixes:
+            edit.setText(prefix)
+            search.refresh()
+            app.processEvents()
+            timings.append(search.last_ms)
+        sample = search.results()
+
+        db_ms = like_ms(prefixes[:args.like_samples])
+
+    timings.sort()
+    print(f"Entradas indexadas: {size} (construcción {build_s:.2f} s)")
+    print(f"Pulsaciones: {len(timings)}")
+    print(f"Por pulsación: mediana {timings[len(timings) // 2]:.3f} ms, "
+          f"p99 {timings[int(len(timings) * 0.99)]:.3f} ms, peor {timings[-1]:.3f} ms")
+    print(f"LIKE en la base de datos: {db_ms:.1f} ms por prefijo")
+    print(f"Ejemplo ('{QUERIES[-1]}'): {sample}")
+    if timings[-1] > BUDGET_MS:
+        print(f"ERROR: una pulsación superó {BUDGET_MS} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
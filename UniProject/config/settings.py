@@ -2,6 +2,57 @@
 
 # Database
 DATABASE_PATH = "cultivos.db"
+DB_POOL_SIZE = 5
+DB_POOL_TIMEOUT = 5.0
+DB_HEALTH_CHECK_INTERVAL = 30.0
+
+# PRAGMA profile applied to every connection handed out by data.database.
+# WAL lets operators read while another one writes; it requires the database
+# file to live on a local disk (not a network share).
+DB_PRAGMA_PROFILE = "desktop"
+DB_PRAGMA_PROFILES = {
+    "desktop": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,         # KiB (negative = size, not pages)
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,         # ms
+    },
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+}
+
+# How often open windows check for changes committed by other instances
+CHANGE_POLL_INTERVAL_MS = 1000
+
+# Worker threads screens use for database reads; keep below DB_POOL_SIZE so
+# the GUI thread can always get a connection
+QUERY_THREADS = 2
+
+# Hectareas rewritten per transaction when a crop's harvest cycle changes;
+# each chunk holds the write lock, so keep it short enough not to stall
+# other writers
+RECALCULO_CHUNK_SIZE = 2000
+
+# Search-as-you-type: quiet time after the last keystroke before suggestions
+# are refreshed, and how many the popup lists
+SUGGESTION_DEBOUNCE_MS = 150
+SUGGESTION_LIMIT = 20
 
 # Application
 APP_NAME = "Sistema de Cultivos"
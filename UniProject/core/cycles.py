@@ -0,0 +1,166 @@
+"""Harvest cycle registry - Cycle lengths per crop, loaded from tipo_cultivo.
+
+Every crop in tipo_cultivo or HARVEST_CYCLES gets a small integer id, keyed
+by fold() of its name, and the first/routine cycle lengths live in arrays
+indexed by that id, so a lookup is one dict access plus one array access.
+tipo_cultivo rows (months, see DAYS_PER_MONTH) override the built-in
+HARVEST_CYCLES; any other name maps to DEFAULT_CROP_ID, which holds
+DEFAULT_HARVEST_DAYS / DEFAULT_ROUTINE_HARVEST_DAYS. The "limones" rule
+(five calendar years, then 180 days) is part of the model and is never
+overridden by the table.
+
+The registry does not query the database itself: a loader is installed by
+the service layer and called again only after invalidate().
+"""
+
+import threading
+from array import array
+
+from utils.text_utils import fold
+from .enums import (
+    CropType, DAYS_PER_MONTH, DEFAULT_HARVEST_DAYS, DEFAULT_ROUTINE_HARVEST_DAYS, HARVEST_CYCLES,
+)
+
+
+LIMONES = fold(CropType.LIMONES.value)
+# Id of the shared entry for names that are neither in tipo_cultivo nor built in
+DEFAULT_CROP_ID = 0
+
+_BUILTIN_CYCLES = {fold(nombre): cycle for nombre, cycle in HARVEST_CYCLES.items()}
+
+
+def table_overrides(rows):
+    """Map fold() of each crop name to (meses_primera, meses_rutinaria) from tipo_cultivo rows."""
+    return {fold(row[1]): (row[2], row[3]) for row in rows if row[1]}
+
+
+def resolve_cycle(nombre, overrides):
+    """Get (first_days, routine_days) for a crop name, matched by fold().
+
+    overrides is the table_overrides() of tipo_cultivo; empty or zero months
+    fall back to HARVEST_CYCLES and then to the defaults.
+    """
+    key = fold(nombre)
+    builtin = _BUILTIN_CYCLES.get(key, {})
+    first = builtin.get("first", DEFAULT_HARVEST_DAYS)
+    routine = builtin.get("routine", DEFAULT_ROUTINE_HARVEST_DAYS)
+    if key == LIMONES:
+        return first, routine
+    meses_primera, meses_rutinaria = overrides.get(key, (None, None))
+    if meses_primera:
+        first = int(meses_primera) * DAYS_PER_MONTH
+    if meses_rutinaria:
+        routine = int(meses_rutinaria) * DAYS_PER_MONTH
+    return first, routine
+
+
+class CycleRegistry:
+    """Compiled first/routine cycle lengths keyed by interned crop id."""
+
+    def __init__(self, loader=None):
+        self._loader = loader
+        self._ids = {}
+        self.names = []
+        self.first = array("i")
+        self.routine = array("i")
+        self.limones = array("b")
+        self._overrides = {}
+        self._stale = True
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.version = 0
+        self._append(None)
+
+    def set_loader(self, loader):
+        """Install the callable returning (id, nombre, meses_primera, meses_rutinaria) rows."""
+        self._loader = loader
+        self.invalidate()
+
+    def on_reload(self, callback):
+        """Call callback() after every reload (e.g. to clear derived caches)."""
+        self._listeners.append(callback)
+
+    def invalidate(self):
+        """Reload from the loader on the next lookup."""
+        self._stale = True
+
+    def crop_id(self, nombre):
+        """Get the id of a crop name matched by fold(), or DEFAULT_CROP_ID if it is unknown.
+
+        Unknown names are not registered, so the arrays only grow with the
+        catalog and not with every name a caller passes in.
+        """
+        if self._stale:
+            self.reload()
+        return self._ids.get(fold(nombre), DEFAULT_CROP_ID)
+
+    def cycle(self, nombre):
+        """Get (first_days, routine_days) for a crop name."""
+        crop_id = self.crop_id(nombre)
+        return self.first[crop_id], self.routine[crop_id]
+
+    def first_days(self, nombre):
+        return self.first[self.crop_id(nombre)]
+
+    def routine_days(self, nombre):
+        return self.routine[self.crop_id(nombre)]
+
+    def is_limones(self, nombre):
+        """Whether a crop name follows the fixed limones rule."""
+        return bool(self.limones[self.crop_id(nombre)])
+
+    def ids_for(self, names):
+        """Get the crop id of each name, e.g. to index the arrays for a batch."""
+        if self._stale:
+            self.reload()
+        # Batches repeat a few names many times; fold each one once
+        memo = {}
+        ids = []
+        for nombre in names:
+            crop_id = memo.get(nombre)
+            if crop_id is None:
+                crop_id = memo[nombre] = self._ids.get(fold(nombre), DEFAULT_CROP_ID)
+            ids.append(crop_id)
+        return ids
+
+    def reload(self):
+        """Load tipo_cultivo through the loader and recompile every entry."""
+        with self._lock:
+            # Cleared first so an invalidate() racing with the load wins
+            self._stale = False
+            try:
+                overrides = table_overrides(self._loader() if self._loader is not None else ())
+            except Exception:
+                self._stale = True
+                raise
+            self._overrides = overrides
+            for crop_id, nombre in enumerate(self.names):
+                self._compile(nombre, crop_id)
+            for nombre in _BUILTIN_CYCLES.keys() | overrides.keys():
+                if nombre not in self._ids:
+                    self._ids[nombre] = self._append(nombre)
+            self.version += 1
+        for callback in self._listeners:
+            callback()
+
+    def _append(self, nombre):
+        """Add an entry for a folded crop name (None for the default) and get its id.
+
+        Caller holds the lock, except from __init__.
+        """
+        crop_id = len(self.names)
+        self.names.append(nombre)
+        self.first.append(0)
+        self.routine.append(0)
+        self.limones.append(0)
+        self._compile(nombre, crop_id)
+        return crop_id
+
+    def _compile(self, nombre, crop_id):
+        """Resolve the cycle lengths of one entry. Caller holds the lock."""
+        self.first[crop_id], self.routine[crop_id] = resolve_cycle(nombre, self._overrides)
+        self.limones[crop_id] = nombre == LIMONES
+
+
+# Shared registry used by Hectarea and the batch engines
+cycles = CycleRegistry()
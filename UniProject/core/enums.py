@@ -57,6 +57,9 @@ HARVEST_CYCLES = {
 DEFAULT_HARVEST_DAYS = 80
 DEFAULT_ROUTINE_HARVEST_DAYS = 20
 
+# tipo_cultivo stores cycles in months; a month counts as this many days
+DAYS_PER_MONTH = 30
+
 # Default temperatures by climate
 DEFAULT_TEMPS = {
     ClimateType.TROPICAL.value: 30,
@@ -0,0 +1,126 @@
+"""Harvest schedule engine - Vectorized harvest dates for many hectareas.
+
+Applies the same rules as Hectarea to whole arrays at once:
+
+* limones: first harvest is the sowing date five calendar years later
+  (``date.replace(year=year + 5)``), routine harvest 180 days after that;
+  supplied dates are ignored.
+* other crops: a supplied first/routine date wins, otherwise the first
+  harvest is sowing + the crop's first cycle and the routine harvest is
+  first + its routine cycle, both taken from core.cycles (tipo_cultivo,
+  then HARVEST_CYCLES, then the defaults).
+
+Where Hectarea would raise (29 February moved to a non-leap year, dates past
+year 9999) the result is NaT and the row is False in the returned mask.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from .cycles import cycles
+
+
+LIMONES_YEARS = 5
+LIMONES_ROUTINE_DAYS = 180
+
+NAT = np.datetime64("NaT", "D")
+MAX_DATE = np.datetime64("9999-12-31", "D")
+# date.toordinal() of 1970-01-01, the datetime64 epoch
+ORDINAL_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def cycle_table(crops):
+    """Build per-code lookup arrays for a crop name table.
+
+    Returns (first_days, routine_days, is_limones), each indexed by the
+    position of the crop in crops.
+    """
+    ids = cycles.ids_for(crops)
+    first = np.array([cycles.first[i] for i in ids], dtype=np.int64)
+    routine = np.array([cycles.routine[i] for i in ids], dtype=np.int64)
+    limones = np.array([cycles.limones[i] for i in ids], dtype=bool)
+    return first, routine, limones
+
+
+def ordinals_to_datetime64(ordinals):
+    """Convert date.toordinal() values to datetime64[D]; 0 becomes NaT."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    dates = (ordinals - ORDINAL_EPOCH).astype("datetime64[D]")
+    dates[ordinals == 0] = NAT
+    return dates
+
+
+def datetime64_to_ordinals(dates):
+    """Convert datetime64[D] values to date.toordinal(); NaT becomes 0."""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    ordinals = dates.astype(np.int64) + ORDINAL_EPOCH
+    ordinals[np.isnat(dates)] = 0
+    return ordinals
+
+
+def shift_years(dates, years):
+    """Move dates by whole calendar years like date.replace(year=year + years).
+
+    Returns (shifted, valid); days that do not exist in the target year
+    (29 February) are NaT and invalid.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    day = (dates - months).astype(np.int64)
+    month = months.astype(np.int64) % 12
+    target_months = (months.astype("datetime64[Y]") + years).astype("datetime64[M]") + month
+    shifted = target_months.astype("datetime64[D]") + day.astype("timedelta64[D]")
+    # Overflowing the month (29 Feb -> 1 Mar) means the day does not exist
+    valid = shifted.astype("datetime64[M]") == target_months
+    shifted[~valid] = NAT
+    return shifted, valid
+
+
+def compute_schedule(siembra, crop_codes, crops, primera=None, rutinaria=None):
+    """Compute first and routine harvest dates for arrays of hectareas.
+
+    siembra is datetime64[D]-compatible, crop_codes index into crops, and
+    primera / rutinaria optionally hold supplied dates (NaT = not supplied).
+    Returns (primera, rutinaria, valid) with datetime64[D] dates.
+    """
+    siembra = np.asarray(siembra, dtype="datetime64[D]")
+    crop_codes = np.asarray(crop_codes, dtype=np.intp)
+    first_days, routine_days, is_limones = cycle_table(crops)
+    limones = is_limones[crop_codes]
+
+    first = siembra + first_days[crop_codes].astype("timedelta64[D]")
+    if primera is not None:
+        primera = np.asarray(primera, dtype="datetime64[D]")
+        first = np.where(np.isnat(primera), first, primera)
+    valid = ~np.isnat(siembra)
+
+    if limones.any():
+        shifted, shifted_valid = shift_years(siembra[limones], LIMONES_YEARS)
+        first[limones] = shifted
+        valid[limones] &= shifted_valid
+
+    routine = first + routine_days[crop_codes].astype("timedelta64[D]")
+    routine[limones] = first[limones] + np.timedelta64(LIMONES_ROUTINE_DAYS, "D")
+    if rutinaria is not None:
+        rutinaria = np.asarray(rutinaria, dtype="datetime64[D]")
+        supplied = ~np.isnat(rutinaria) & ~limones
+        routine[supplied] = rutinaria[supplied]
+
+    # datetime/timedelta arithmetic past year 9999 raises OverflowError in Hectarea
+    valid &= (first <= MAX_DATE) & (routine <= MAX_DATE)
+    first[~valid] = NAT
+    routine[~valid] = NAT
+    return first, routine, valid
+
+
+def schedule_batch(batch):
+    """Recompute harvest dates of a HectareaBatch from its sowing dates.
+
+    Returns (primera, rutinaria, valid) as in compute_schedule.
+    """
+    return compute_schedule(
+        ordinals_to_datetime64(np.frombuffer(batch.siembra, dtype=np.int32)),
+        np.frombuffer(batch.crop_code, dtype=np.uint16),
+        batch.crops,
+    )
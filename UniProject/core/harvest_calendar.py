@@ -0,0 +1,169 @@
+"""Harvest calendar - Range queries over first and recurring routine harvests.
+
+Each hectarea contributes its first harvest once and a routine harvest every
+cycle (its routine length in core.cycles, 180 days for limones) from its stored
+cosecha_rutinaria onwards, with no end date. Nothing is expanded up front:
+hectareas that share a cycle length and phase are grouped, so one heap entry
+per group is enough to walk any date range in order and memory does not grow
+with how far ahead a query reaches.
+"""
+
+import heapq
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .harvest import cycle_table
+
+
+PRIMERA = "primera"
+RUTINARIA = "rutinaria"
+
+
+class HarvestEvent(NamedTuple):
+    """One harvest of one hectarea."""
+
+    fecha: date
+    numero: int
+    tipo_de_cultivo: str
+    cosecha: str
+
+
+@lru_cache(maxsize=4096)
+def _from_ordinal(ordinal):
+    return date.fromordinal(ordinal)
+
+
+def _to_ordinal(value):
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal()
+
+
+class _RoutineGroup:
+    """Hectareas whose routine harvests fall on the same days once started."""
+
+    __slots__ = ("period", "phase", "starts", "numeros", "crop_codes")
+
+    def __init__(self, period, phase, starts, numeros, crop_codes):
+        self.period = period
+        self.phase = phase
+        self.starts = starts
+        self.numeros = numeros
+        self.crop_codes = crop_codes
+
+    def first_on_or_after(self, ordinal):
+        """First harvest day of the group at or after ordinal."""
+        ordinal = max(ordinal, int(self.starts[0]))
+        return ordinal + (self.phase - ordinal) % self.period
+
+    def active(self, ordinal):
+        """Number of hectareas (a prefix, sorted by start) harvesting on a day."""
+        return int(self.starts.searchsorted(ordinal, "right"))
+
+
+class HarvestCalendar:
+    """Index of harvest events answering date-range queries as a sorted stream."""
+
+    def __init__(self, numeros, crop_codes, crops, primera, rutinaria):
+        """Build from parallel arrays; dates are day ordinals with 0 = missing."""
+        numeros = np.asarray(numeros, dtype=np.int64)
+        crop_codes = np.asarray(crop_codes, dtype=np.intp)
+        primera = np.asarray(primera, dtype=np.int64)
+        rutinaria = np.asarray(rutinaria, dtype=np.int64)
+        self.crops = list(crops)
+
+        has_first = primera > 0
+        order = np.lexsort((numeros[has_first], primera[has_first]))
+        self._primera = primera[has_first][order]
+        self._primera_numeros = numeros[has_first][order]
+        self._primera_crops = crop_codes[has_first][order]
+
+        _, routine_days, _ = cycle_table(self.crops)
+        has_routine = rutinaria > 0
+        starts = rutinaria[has_routine]
+        periods = routine_days[crop_codes[has_routine]]
+        phases = starts % periods
+        order = np.lexsort((starts, phases, periods))
+        starts, periods, phases = starts[order], periods[order], phases[order]
+        group_numeros = numeros[has_routine][order]
+        group_crops = crop_codes[has_routine][order]
+
+        self._groups = []
+        if len(starts):
+            breaks = np.flatnonzero((np.diff(periods) != 0) | (np.diff(phases) != 0)) + 1
+            bounds = [0, *breaks.tolist(), len(starts)]
+            for lo, hi in zip(bounds, bounds[1:]):
+                self._groups.append(_RoutineGroup(
+                    int(periods[lo]), int(phases[lo]),
+                    starts[lo:hi], group_numeros[lo:hi], group_crops[lo:hi],
+                ))
+
+    @classmethod
+    def from_batch(cls, batch):
+        """Build from a HectareaBatch using its stored harvest dates."""
+        return cls(
+            np.frombuffer(batch.numero, dtype=np.int64),
+            np.frombuffer(batch.crop_code, dtype=np.uint16),
+            batch.crops,
+            np.frombuffer(batch.primera, dtype=np.int32),
+            np.frombuffer(batch.rutinaria, dtype=np.int32),
+        )
+
+    def __len__(self):
+        """Number of hectareas with a recurring routine harvest."""
+        return sum(len(group.starts) for group in self._groups)
+
+    def events(self, desde, hasta):
+        """Yield HarvestEvent for every harvest in [desde, hasta], sorted.
+
+        Events are ordered by date, then numero, with the first harvest
+        before the routine one. desde/hasta are dates or YYYY-MM-DD strings.
+        """
+        start, end = _to_ordinal(desde), _to_ordinal(hasta)
+        heap = []
+        for index, group in enumerate(self._groups):
+            day = group.first_on_or_after(start)
+            if day <= end:
+                heap.append((day, index))
+        heapq.heapify(heap)
+
+        position = int(self._primera.searchsorted(start, "left"))
+        stop = int(self._primera.searchsorted(end, "right"))
+        crops = self.crops
+
+        while heap or position < stop:
+            day = min(heap[0][0] if heap else end + 1,
+                      int(self._primera[position]) if position < stop else end + 1)
+            todays = []
+            while position < stop and self._primera[position] == day:
+                todays.append((int(self._primera_numeros[position]), 0,
+                               crops[self._primera_crops[position]]))
+                position += 1
+            while heap and heap[0][0] == day:
+                _, index = heapq.heappop(heap)
+                group = self._groups[index]
+                active = group.active(day)
+                for numero, code in zip(group.numeros[:active].tolist(),
+                                        group.crop_codes[:active].tolist()):
+                    todays.append((numero, 1, crops[code]))
+                following = day + group.period
+                if following <= end:
+                    heapq.heappush(heap, (following, index))
+
+            todays.sort()
+            fecha = _from_ordinal(day)
+            for numero, kind, tipo in todays:
+                yield HarvestEvent(fecha, numero, tipo, RUTINARIA if kind else PRIMERA)
+
+    def count(self, desde, hasta):
+        """Count harvests in [desde, hasta] without producing the events."""
+        start, end = _to_ordinal(desde), _to_ordinal(hasta)
+        total = int(self._primera.searchsorted(end, "right") - self._primera.searchsorted(start, "left"))
+        for group in self._groups:
+            first = np.maximum(group.starts, start)
+            first = first + (group.phase - first) % group.period
+            total += int(np.maximum(0, (end - first) // group.period + 1).sum())
+        return total
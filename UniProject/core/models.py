@@ -1,7 +1,12 @@
 """Domain models for agricultural management system."""
 
-from datetime import datetime, timedelta
-from .enums import HARVEST_CYCLES, DEFAULT_HARVEST_DAYS, DEFAULT_ROUTINE_HARVEST_DAYS
+import math
+import sys
+from array import array
+from datetime import date, timedelta
+from functools import lru_cache
+from utils.date_utils import format_iso, parse_date, parse_iso
+from .cycles import cycles
 
 
 class Hectarea:
@@ -11,7 +16,7 @@ class Hectarea:
                  cosecha_rutinaria=None, tipo_suelo=None, temperatura=None):
         self.numero = numero
         self.tipo_de_cultivo = tipo_de_cultivo.lower()
-        self.siembra = datetime.strptime(siembra, "%Y-%m-%d")
+        self.siembra = parse_iso(siembra)
         self._set_harvest_dates(primera_cosecha, cosecha_rutinaria)
         self.tipo_suelo = tipo_suelo
         try:
@@ -21,9 +26,9 @@ class Hectarea:
 
     def _set_harvest_dates(self, primera_cosecha, cosecha_rutinaria):
         """Set harvest dates based on crop type and provided dates."""
-        if self.tipo_de_cultivo == "limones":
+        if cycles.is_limones(self.tipo_de_cultivo):
             self.primeracosecha = self.siembra.replace(year=self.siembra.year + 5)
-            self.cosecha_rutinaria = (self.primeracosecha + timedelta(days=180)).strftime("%Y-%m-%d")
+            self.cosecha_rutinaria = format_iso(self.primeracosecha + timedelta(days=180))
         else:
             self._set_first_harvest(primera_cosecha)
             self._set_routine_harvest(cosecha_rutinaria)
@@ -31,22 +36,16 @@ class Hectarea:
     def _set_first_harvest(self, primera_cosecha):
         """Calculate or set first harvest date."""
         if not primera_cosecha:
-            if self.tipo_de_cultivo in HARVEST_CYCLES:
-                days = HARVEST_CYCLES[self.tipo_de_cultivo]["first"]
-            else:
-                days = DEFAULT_HARVEST_DAYS
+            days = cycles.first_days(self.tipo_de_cultivo)
             self.primeracosecha = self.siembra + timedelta(days=days)
         else:
-            self.primeracosecha = datetime.strptime(primera_cosecha, "%Y-%m-%d")
+            self.primeracosecha = parse_iso(primera_cosecha)
 
     def _set_routine_harvest(self, cosecha_rutinaria):
         """Calculate or set routine harvest date."""
         if not cosecha_rutinaria:
-            if self.tipo_de_cultivo in HARVEST_CYCLES:
-                days = HARVEST_CYCLES[self.tipo_de_cultivo]["routine"]
-            else:
-                days = DEFAULT_ROUTINE_HARVEST_DAYS
-            self.cosecha_rutinaria = (self.primeracosecha + timedelta(days=days)).strftime("%Y-%m-%d")
+            days = cycles.routine_days(self.tipo_de_cultivo)
+            self.cosecha_rutinaria = format_iso(self.primeracosecha + timedelta(days=days))
         else:
             self.cosecha_rutinaria = cosecha_rutinaria
 
@@ -55,9 +54,248 @@ class Hectarea:
         return {
             "numero": self.numero,
             "tipo_de_cultivo": self.tipo_de_cultivo,
-            "siembra": self.siembra.strftime("%Y-%m-%d"),
-            "primera_cosecha": self.primeracosecha.strftime("%Y-%m-%d"),
+            "siembra": format_iso(self.siembra),
+            "primera_cosecha": format_iso(self.primeracosecha),
             "cosecha_rutinaria": self.cosecha_rutinaria,
             "tipo_suelo": self.tipo_suelo,
             "temperatura": self.temperatura,
         }
+
+
+@lru_cache(maxsize=8192)
+def compute_harvest_dates(tipo_de_cultivo, siembra, primera_cosecha=None, cosecha_rutinaria=None):
+    """Get (siembra, primera_cosecha, cosecha_rutinaria) as strings using Hectarea rules.
+
+    Memoized because a farm registers many hectareas with the same crop and
+    sowing date; raises ValueError exactly where Hectarea() would.
+    """
+    h = Hectarea(0, tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria)
+    data = h.to_dict()
+    return data["siembra"], data["primera_cosecha"], data["cosecha_rutinaria"]
+
+
+# Cached dates depend on the cycle lengths in force when they were computed
+cycles.on_reload(compute_harvest_dates.cache_clear)
+
+
+# Column order of HectareaRecord.from_row for plain tuples
+HECTAREA_FIELDS = (
+    "numero", "tipo_de_cultivo", "siembra", "primera_cosecha",
+    "cosecha_rutinaria", "tipo_suelo", "temperatura",
+)
+
+
+@lru_cache(maxsize=65536)
+def _date_ordinal(value):
+    """Convert a stored YYYY-MM-DD string to a proleptic ordinal (0 for empty or unreadable)."""
+    if not value:
+        return 0
+    try:
+        return parse_date(value).toordinal()
+    except (TypeError, ValueError):
+        # Rows edited through the legacy dialog may hold any text
+        return 0
+
+
+def _temperature(value):
+    """Convert a stored temperatura to a float (NaN for missing or non-numeric)."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+@lru_cache(maxsize=65536)
+def _ordinal_text(ordinal):
+    """Convert an ordinal back to its YYYY-MM-DD string (None for 0)."""
+    return date.fromordinal(ordinal).isoformat() if ordinal else None
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class HectareaRecord:
+    """Immutable, compact hectarea with dates held as day ordinals.
+
+    Unlike Hectarea it does not recompute harvest dates: it represents a
+    row as stored, so building one is a few lookups instead of strptime and
+    strftime calls. Crop and soil names are interned and shared.
+    """
+
+    __slots__ = ("numero", "tipo_de_cultivo", "siembra_ordinal", "primera_ordinal",
+                 "rutinaria_ordinal", "tipo_suelo", "temperatura")
+
+    def __init__(self, numero, tipo_de_cultivo, siembra_ordinal, primera_ordinal=0,
+                 rutinaria_ordinal=0, tipo_suelo=None, temperatura=None):
+        _set_numero(self, numero)
+        _set_tipo(self, _intern(tipo_de_cultivo))
+        _set_siembra(self, siembra_ordinal)
+        _set_primera(self, primera_ordinal)
+        _set_rutinaria(self, rutinaria_ordinal)
+        _set_suelo(self, _intern(tipo_suelo))
+        _set_temperatura(self, temperatura)
+
+    @classmethod
+    def from_row(cls, row):
+        """Build from a database row (sqlite3.Row or tuple in HECTAREA_FIELDS order)."""
+        if hasattr(row, "keys"):
+            row = [row[field] for field in HECTAREA_FIELDS]
+        numero, tipo, siembra, primera, rutinaria, suelo, temperatura = row
+        return cls(numero, tipo, _date_ordinal(siembra), _date_ordinal(primera),
+                   _date_ordinal(rutinaria), suelo, temperatura)
+
+    @classmethod
+    def create(cls, numero, tipo_de_cultivo, siembra, primera_cosecha=None,
+               cosecha_rutinaria=None, tipo_suelo=None, temperatura=None):
+        """Build from user input, computing harvest dates the way Hectarea does."""
+        tipo = tipo_de_cultivo.lower()
+        siembra, primera, rutinaria = compute_harvest_dates(
+            tipo, siembra, primera_cosecha, cosecha_rutinaria
+        )
+        try:
+            temperatura = float(temperatura) if temperatura not in (None, "") else None
+        except ValueError:
+            temperatura = None
+        return cls.from_row((numero, tipo, siembra, primera, rutinaria, tipo_suelo, temperatura))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _key(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, HectareaRecord):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"HectareaRecord(numero={self.numero!r}, tipo_de_cultivo={self.tipo_de_cultivo!r}, siembra={self.siembra!r})"
+
+    @property
+    def siembra(self):
+        return _ordinal_text(self.siembra_ordinal)
+
+    @property
+    def primera_cosecha(self):
+        return _ordinal_text(self.primera_ordinal)
+
+    @property
+    def cosecha_rutinaria(self):
+        return _ordinal_text(self.rutinaria_ordinal)
+
+    def to_row(self):
+        """Get the record as a tuple in HECTAREA_FIELDS order."""
+        return (self.numero, self.tipo_de_cultivo, self.siembra, self.primera_cosecha,
+                self.cosecha_rutinaria, self.tipo_suelo, self.temperatura)
+
+    def to_dict(self):
+        """Convert to the same dictionary shape as Hectarea.to_dict()."""
+        return dict(zip(HECTAREA_FIELDS, self.to_row()))
+
+
+# Slot descriptors write past the immutable __setattr__ without a name lookup
+(_set_numero, _set_tipo, _set_siembra, _set_primera, _set_rutinaria,
+ _set_suelo, _set_temperatura) = (
+    HectareaRecord.__dict__[name].__set__ for name in HectareaRecord.__slots__
+)
+
+
+class HectareaBatch:
+    """Column store for many hectareas.
+
+    Dates are day ordinals in int32 arrays (0 = missing, likewise for numero),
+    crop and soil names are small integer codes into shared name tables, and
+    temperatures are doubles with NaN for missing values. Rows come back out
+    as HectareaRecord on demand.
+    """
+
+    def __init__(self):
+        self.numero = array("q")
+        self.crop_code = array("H")
+        self.siembra = array("i")
+        self.primera = array("i")
+        self.rutinaria = array("i")
+        self.soil_code = array("H")
+        self.temperatura = array("d")
+        self.crops = []
+        self.soils = [None]
+        self._crop_codes = {}
+        self._soil_codes = {None: 0}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a batch from database rows (see HectareaRecord.from_row)."""
+        batch = cls()
+        batch.extend(rows)
+        return batch
+
+    def crop_code_for(self, nombre):
+        """Get the code of a crop name, adding it to the table if new."""
+        code = self._crop_codes.get(nombre)
+        if code is None:
+            code = self._crop_codes[nombre] = len(self.crops)
+            self.crops.append(_intern(nombre))
+        return code
+
+    def soil_code_for(self, nombre):
+        """Get the code of a soil name (0 = none), adding it if new."""
+        code = self._soil_codes.get(nombre)
+        if code is None:
+            code = self._soil_codes[nombre] = len(self.soils)
+            self.soils.append(_intern(nombre))
+        return code
+
+    def append(self, row):
+        """Add one database row."""
+        self.extend((row,))
+
+    def extend(self, rows):
+        """Add many database rows."""
+        numero, crop, soil, temp = self.numero, self.crop_code, self.soil_code, self.temperatura
+        siembra, primera, rutinaria = self.siembra, self.primera, self.rutinaria
+        crop_codes, soil_codes = self._crop_codes, self._soil_codes
+        for row in rows:
+            if hasattr(row, "keys"):
+                row = [row[field] for field in HECTAREA_FIELDS]
+            n, tipo, s, p, r, suelo, t = row
+            code = crop_codes.get(tipo)
+            crop.append(self.crop_code_for(tipo) if code is None else code)
+            code = soil_codes.get(suelo)
+            soil.append(self.soil_code_for(suelo) if code is None else code)
+            numero.append(0 if n is None else n)
+            siembra.append(_date_ordinal(s))
+            primera.append(_date_ordinal(p))
+            rutinaria.append(_date_ordinal(r))
+            temp.append(_temperature(t))
+
+    def __len__(self):
+        return len(self.numero)
+
+    def __getitem__(self, index):
+        temperatura = self.temperatura[index]
+        return HectareaRecord(
+            self.numero[index], self.crops[self.crop_code[index]], self.siembra[index],
+            self.primera[index], self.rutinaria[index], self.soils[self.soil_code[index]],
+            None if math.isnan(temperatura) else temperatura,
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        """Bytes used by the column arrays."""
+        columns = (self.numero, self.crop_code, self.siembra, self.primera,
+                   self.rutinaria, self.soil_code, self.temperatura)
+        return sum(column.itemsize * len(column) for column in columns)
@@ -0,0 +1,98 @@
+"""Change tracker - Per-table change events across processes.
+
+PRAGMA data_version on a dedicated connection changes whenever any other
+connection, in this or another process, commits to the database file. Only
+then are the trigger-maintained counters in cambios_tabla read, and
+subscribers are notified for the tables whose counter moved.
+"""
+
+import logging
+import sqlite3
+import threading
+
+from . import database
+from .migrations import TRACKED_TABLES
+
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeTracker:
+    """Polls the database for commits and publishes per-table events."""
+
+    def __init__(self):
+        self._conn = None
+        self._path = None
+        self._data_version = None
+        self._versions = {}
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, table, callback):
+        """Call callback(table) after other connections change table.
+
+        Returns a function that removes the subscription.
+        """
+        if table not in TRACKED_TABLES:
+            raise ValueError(f"Table is not tracked: {table}")
+        with self._lock:
+            self._subscribers.setdefault(table, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                callbacks = self._subscribers.get(table, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+        return unsubscribe
+
+    def poll(self):
+        """Check for changes and notify subscribers; returns the changed tables.
+
+        Costs one PRAGMA read when nothing has been committed since the last
+        poll. A callback that raises is logged and does not keep the other
+        subscribers from being notified; the change counts as delivered.
+        """
+        with self._lock:
+            conn = self._connect()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return set()
+            self._data_version = data_version
+            versions = dict(conn.execute("SELECT tabla, version FROM cambios_tabla").fetchall())
+            changed = {t for t, v in versions.items() if self._versions.get(t) != v}
+            self._versions = versions
+            callbacks = [(t, list(self._subscribers.get(t, ()))) for t in sorted(changed)]
+
+        for table, subscribers in callbacks:
+            for callback in subscribers:
+                try:
+                    callback(table)
+                except Exception:
+                    logger.exception("Change callback for %s failed", table)
+        return changed
+
+    def close(self):
+        """Close the polling connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        """Open (or reopen after DATABASE_PATH changed) the polling connection.
+
+        The first poll after connecting records the baseline without
+        reporting anything as changed.
+        """
+        if self._conn is not None and self._path == database.DATABASE_PATH:
+            return self._conn
+        if self._conn is not None:
+            self._conn.close()
+        self._path = database.DATABASE_PATH
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        self._versions = dict(self._conn.execute("SELECT tabla, version FROM cambios_tabla").fetchall())
+        return self._conn
+
+
+tracker = ChangeTracker()
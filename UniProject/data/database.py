@@ -1,157 +1,134 @@
 """Database initialization and connection management."""
 
 import sqlite3
+import threading
 from pathlib import Path
 
+from config.settings import (
+    DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_HEALTH_CHECK_INTERVAL,
+    DB_PRAGMA_PROFILE, DB_PRAGMA_PROFILES,
+)
+from utils.text_utils import fold
+from .migrations import migrate
+from .pool import ConnectionPool
+
 
 DATABASE_PATH = "cultivos.db"
+PRAGMA_PROFILE = DB_PRAGMA_PROFILE
+
+# Applied in this order: busy_timeout first so the journal_mode switch can wait
+# for the lock, then journal_mode before the rest so they see the final mode
+_PRAGMA_ORDER = ("busy_timeout", "journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+
+_pool = None
+_pool_key = None
+_pool_lock = threading.Lock()
+
+
+def apply_pragmas(conn, profile=None):
+    """Apply a named PRAGMA profile from config.settings to a raw connection."""
+    name = profile or PRAGMA_PROFILE
+    if name not in DB_PRAGMA_PROFILES:
+        raise ValueError(f"Unknown PRAGMA profile: {name}")
+    pragmas = DB_PRAGMA_PROFILES[name]
+    for pragma in _PRAGMA_ORDER:
+        if pragma in pragmas:
+            conn.execute(f"PRAGMA {pragma} = {pragmas[pragma]}").fetchall()
+
+
+def _compare_folded(a, b):
+    a, b = fold(a), fold(b)
+    return (a > b) - (a < b)
+
+
+def register_functions(conn):
+    """Register pliegue(text) and the PLIEGUE collation (utils.text_utils.fold) on a connection."""
+    conn.create_function("pliegue", 1, fold, deterministic=True)
+    conn.create_collation("PLIEGUE", _compare_folded)
+
+
+def _on_connect(conn, profile):
+    apply_pragmas(conn, profile)
+    register_functions(conn)
+
+
+def set_pragma_profile(name):
+    """Switch the PRAGMA profile; pooled connections are reopened with it."""
+    global PRAGMA_PROFILE
+    if name not in DB_PRAGMA_PROFILES:
+        raise ValueError(f"Unknown PRAGMA profile: {name}")
+    PRAGMA_PROFILE = name
+    close_pool()
+
+
+def get_pool():
+    """Get the connection pool for the current DATABASE_PATH and PRAGMA profile."""
+    global _pool, _pool_key
+    with _pool_lock:
+        key = (DATABASE_PATH, PRAGMA_PROFILE)
+        if _pool is None or _pool_key != key:
+            if _pool is not None:
+                _pool.close_all()
+            _pool = ConnectionPool(
+                DATABASE_PATH,
+                pool_size=DB_POOL_SIZE,
+                timeout=DB_POOL_TIMEOUT,
+                health_check_interval=DB_HEALTH_CHECK_INTERVAL,
+                on_connect=lambda conn, profile=PRAGMA_PROFILE: _on_connect(conn, profile),
+            )
+            _pool_key = key
+        return _pool
 
 
 def get_connection():
-    """Get a database connection."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get a pooled database connection; close() returns it to the pool."""
+    return get_pool().acquire()
+
+
+def connection():
+    """Context manager over a pooled connection that commits or rolls back."""
+    return get_pool().connection()
+
+
+def get_pool_stats():
+    """Get connection pool usage counters."""
+    return get_pool().stats.snapshot()
+
+
+def track_connections():
+    """Context manager yielding the pool stats accumulated inside the block."""
+    return get_pool().track()
+
+
+def close_pool():
+    """Close every idle pooled connection."""
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
+            _pool_key = None
+
+
+def begin_immediate(cursor):
+    """Take the write lock now, or join the transaction an enclosing block already opened."""
+    if not cursor.connection.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
+
+
+def executemany_in_savepoint(cursor, sql, params):
+    """Run executemany inside a savepoint, undoing all of it if any row fails."""
+    cursor.execute("SAVEPOINT batch")
+    try:
+        cursor.executemany(sql, params)
+    except sqlite3.DatabaseError:
+        cursor.execute("ROLLBACK TO batch")
+        cursor.execute("RELEASE batch")
+        raise
+    cursor.execute("RELEASE batch")
 
 
 def initialize_db():
-    """Initialize the database with all required tables."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Create tables
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS usuarios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE,
-            password TEXT,
-            role TEXT CHECK(role IN ('admin', 'usuario')),
-            email TEXT
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS hectareas (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            numero INTEGER,
-            tipo_de_cultivo TEXT,
-            siembra TEXT,
-            primera_cosecha TEXT,
-            cosecha_rutinaria TEXT,
-            tipo_suelo TEXT,
-            temperatura REAL
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tipo_suelo (
-            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT UNIQUE,
-            descripcion TEXT,
-            imagen TEXT
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tipo_hortaliza (
-            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT UNIQUE,
-            descripcion TEXT,
-            imagen TEXT
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS clima (
-            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT UNIQUE,
-            grados_temperatura REAL,
-            descripcion TEXT,
-            imagen TEXT
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS gestion_cultivo (
-            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
-            id_persona INTEGER,
-            id_tipo_hortaliza INTEGER,
-            id_tipo_suelo INTEGER,
-            id_clima INTEGER,
-            video TEXT,
-            observaciones TEXT,
-            FOREIGN KEY(id_persona) REFERENCES usuarios(id),
-            FOREIGN KEY(id_tipo_hortaliza) REFERENCES tipo_hortaliza(codigo),
-            FOREIGN KEY(id_tipo_suelo) REFERENCES tipo_suelo(codigo),
-            FOREIGN KEY(id_clima) REFERENCES clima(codigo)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tipo_cultivo (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT UNIQUE,
-            meses_primera INTEGER,
-            meses_rutinaria INTEGER
-        )
-    """)
-    
-    # Insert default data
-    _insert_default_data(cursor)
-    
-    # Insert default admin user
-    cursor.execute(
-        "INSERT OR IGNORE INTO usuarios (username, password, role, email) VALUES ('admin', 'admin123', 'admin', NULL)"
-    )
-    
-    conn.commit()
-    conn.close()
-
-
-def _insert_default_data(cursor):
-    """Insert default catalog data."""
-    # Default soil types
-    cursor.execute("SELECT COUNT(*) FROM tipo_suelo")
-    if cursor.fetchone()[0] == 0:
-        default_suelos = [
-            ("Arenoso", "Suelos con alta cantidad de arena.", "arenoso.jpg"),
-            ("Limoso", "Suelos con alta proporción de limo.", "limoso.jpg"),
-            ("Franco", "Suelos equilibrados.", "franco.jpg"),
-            ("Arcilloso", "Suelos con alta cantidad de arcilla.", "arcilloso.jpg")
-        ]
-        cursor.executemany(
-            "INSERT INTO tipo_suelo (nombre, descripcion, imagen) VALUES (?, ?, ?)",
-            default_suelos
-        )
-
-    # Default vegetable types
-    cursor.execute("SELECT COUNT(*) FROM tipo_hortaliza")
-    if cursor.fetchone()[0] == 0:
-        default_hortalizas = [
-            ("Bulbos", "Vegetales de forma redonda que crecen bajo tierra.", "bulbos.jpg"),
-            ("Tallos comestibles", "Vegetales con tallos comestibles.", "tallos.jpg"),
-            ("Raíces comestibles", "Vegetales con raíces comestibles.", "raices.jpg"),
-            ("Frutos", "Vegetales de tipo fruto.", "frutos.jpg"),
-            ("Hojas", "Vegetales donde se consumen las hojas.", "hojas.jpg"),
-            ("Flores", "Vegetales en los que se consumen las flores.", "flores.jpg"),
-            ("Tubérculos", "Vegetales con tubérculos comestibles.", "tuberculos.jpg")
-        ]
-        cursor.executemany(
-            "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, ?, ?)",
-            default_hortalizas
-        )
-
-    # Default climate types
-    cursor.execute("SELECT COUNT(*) FROM clima")
-    if cursor.fetchone()[0] == 0:
-        default_climas = [
-            ("Tropical", 30, "Clima cálido y húmedo.", "tropical.jpg"),
-            ("Seco", 25, "Clima árido con poca humedad.", "seco.jpg"),
-            ("Templado", 20, "Clima moderado.", "templado.jpg"),
-            ("Continental", 15, "Clima con estaciones bien marcadas.", "continental.jpg"),
-            ("Polar", 0, "Clima muy frío.", "polar.jpg")
-        ]
-        cursor.executemany(
-            "INSERT INTO clima (nombre, grados_temperatura, descripcion, imagen) VALUES (?, ?, ?, ?)",
-            default_climas
-        )
+    """Bring the database schema up to date; a single pragma read when current."""
+    with connection() as conn:
+        migrate(conn)
@@ -0,0 +1,688 @@
+"""Schema migrations - Versioned upgrades keyed on PRAGMA user_version.
+
+Each migration runs in its own transaction and bumps ``user_version`` when it
+commits, so a database that is already current costs a single pragma read.
+Migrations that rewrite a large table copy it in chunks, one transaction each,
+and resume where they stopped if interrupted.
+
+Usage::
+
+    python -m data.migrations status
+    python -m data.migrations upgrade [--to VERSION] [--chunk-size 5000]
+"""
+
+import argparse
+import json
+import sys
+
+from utils.text_utils import fold_sql
+
+
+class MigrationError(Exception):
+    """A migration found data it cannot upgrade without someone fixing it first."""
+
+    def __init__(self, message, values=()):
+        super().__init__(message)
+        self.values = list(values)
+
+
+# Rows a chunked migration moves per transaction
+BACKFILL_CHUNK_SIZE = 5000
+
+
+class Migration:
+    """A single schema upgrade step.
+
+    With a backfill the step runs as several transactions, so a large table
+    never holds the write lock for long: apply(cursor) prepares,
+    backfill(cursor, chunk_size) moves one chunk and returns how many rows
+    it moved (0 when done), and finish(cursor, chunk_size) completes the
+    step together with the user_version bump. Each phase has to be safe to
+    run again after an interruption.
+    """
+
+    def __init__(self, version, description, apply, backfill=None, finish=None):
+        self.version = version
+        self.description = description
+        self.apply = apply
+        self.backfill = backfill
+        self.finish = finish
+
+
+def _create_base_schema(cursor):
+    """Create the original tables, catalog defaults and admin user."""
+    # Create tables
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE,
+            password TEXT,
+            role TEXT CHECK(role IN ('admin', 'usuario')),
+            email TEXT
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS hectareas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            numero INTEGER,
+            tipo_de_cultivo TEXT,
+            siembra TEXT,
+            primera_cosecha TEXT,
+            cosecha_rutinaria TEXT,
+            tipo_suelo TEXT,
+            temperatura REAL
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tipo_suelo (
+            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT UNIQUE,
+            descripcion TEXT,
+            imagen TEXT
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tipo_hortaliza (
+            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT UNIQUE,
+            descripcion TEXT,
+            imagen TEXT
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS clima (
+            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT UNIQUE,
+            grados_temperatura REAL,
+            descripcion TEXT,
+            imagen TEXT
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS gestion_cultivo (
+            codigo INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_persona INTEGER,
+            id_tipo_hortaliza INTEGER,
+            id_tipo_suelo INTEGER,
+            id_clima INTEGER,
+            video TEXT,
+            observaciones TEXT,
+            FOREIGN KEY(id_persona) REFERENCES usuarios(id),
+            FOREIGN KEY(id_tipo_hortaliza) REFERENCES tipo_hortaliza(codigo),
+            FOREIGN KEY(id_tipo_suelo) REFERENCES tipo_suelo(codigo),
+            FOREIGN KEY(id_clima) REFERENCES clima(codigo)
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tipo_cultivo (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT UNIQUE,
+            meses_primera INTEGER,
+            meses_rutinaria INTEGER
+        )
+    """)
+    
+    # Insert default data
+    _insert_default_data(cursor)
+    
+    # Insert default admin user
+    cursor.execute(
+        "INSERT OR IGNORE INTO usuarios (username, password, role, email) VALUES ('admin', 'admin123', 'admin', NULL)"
+    )
+
+
+def _insert_default_data(cursor):
+    """Insert default catalog data."""
+    # Default soil types
+    cursor.execute("SELECT COUNT(*) FROM tipo_suelo")
+    if cursor.fetchone()[0] == 0:
+        default_suelos = [
+            ("Arenoso", "Suelos con alta cantidad de arena.", "arenoso.jpg"),
+            ("Limoso", "Suelos con alta proporción de limo.", "limoso.jpg"),
+            ("Franco", "Suelos equilibrados.", "franco.jpg"),
+            ("Arcilloso", "Suelos con alta cantidad de arcilla.", "arcilloso.jpg")
+        ]
+        cursor.executemany(
+            "INSERT INTO tipo_suelo (nombre, descripcion, imagen) VALUES (?, ?, ?)",
+            default_suelos
+        )
+
+    # Default vegetable types
+    cursor.execute("SELECT COUNT(*) FROM tipo_hortaliza")
+    if cursor.fetchone()[0] == 0:
+        default_hortalizas = [
+            ("Bulbos", "Vegetales de forma redonda que crecen bajo tierra.", "bulbos.jpg"),
+            ("Tallos comestibles", "Vegetales con tallos comestibles.", "tallos.jpg"),
+            ("Raíces comestibles", "Vegetales con raíces comestibles.", "raices.jpg"),
+            ("Frutos", "Vegetales de tipo fruto.", "frutos.jpg"),
+            ("Hojas", "Vegetales donde se consumen las hojas.", "hojas.jpg"),
+            ("Flores", "Vegetales en los que se consumen las flores.", "flores.jpg"),
+            ("Tubérculos", "Vegetales con tubérculos comestibles.", "tuberculos.jpg")
+        ]
+        cursor.executemany(
+            "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, ?, ?)",
+            default_hortalizas
+        )
+
+    # Default climate types
+    cursor.execute("SELECT COUNT(*) FROM clima")
+    if cursor.fetchone()[0] == 0:
+        default_climas = [
+            ("Tropical", 30, "Clima cálido y húmedo.", "tropical.jpg"),
+            ("Seco", 25, "Clima árido con poca humedad.", "seco.jpg"),
+            ("Templado", 20, "Clima moderado.", "templado.jpg"),
+            ("Continental", 15, "Clima con estaciones bien marcadas.", "continental.jpg"),
+            ("Polar", 0, "Clima muy frío.", "polar.jpg")
+        ]
+        cursor.executemany(
+            "INSERT INTO clima (nombre, grados_temperatura, descripcion, imagen) VALUES (?, ?, ?, ?)",
+            default_climas
+        )
+
+
+def _add_lookup_indexes(cursor):
+    """Index the columns repositories filter and join on."""
+    # Duplicated numeros would break the UNIQUE index; they identify hectareas
+    # to the operators, so stop and let someone fix them rather than renumber
+    cursor.execute("""
+        SELECT numero FROM hectareas WHERE numero IS NOT NULL
+        GROUP BY numero HAVING COUNT(*) > 1 ORDER BY numero
+    """)
+    duplicados = [row[0] for row in cursor.fetchall()]
+    if duplicados:
+        raise MigrationError(
+            f"Duplicated hectareas.numero values: {', '.join(map(str, duplicados))}",
+            duplicados
+        )
+
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_hectareas_numero ON hectareas(numero)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_usuarios_email ON usuarios(email)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gestion_cultivo_persona ON gestion_cultivo(id_persona)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gestion_cultivo_hortaliza ON gestion_cultivo(id_tipo_hortaliza)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gestion_cultivo_suelo ON gestion_cultivo(id_tipo_suelo)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gestion_cultivo_clima ON gestion_cultivo(id_clima)")
+
+
+# Tables whose changes are published by data.change_tracker
+TRACKED_TABLES = (
+    "usuarios", "hectareas", "tipo_suelo", "tipo_hortaliza",
+    "clima", "gestion_cultivo", "tipo_cultivo",
+)
+
+
+def _create_change_triggers(cursor, table):
+    """(Re)create the triggers that bump a table's row in cambios_tabla."""
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_cambios_{event.lower()}")
+        cursor.execute(f"""
+            CREATE TRIGGER trg_{table}_cambios_{event.lower()} AFTER {event} ON {table}
+            BEGIN
+                UPDATE cambios_tabla SET version = version + 1 WHERE tabla = '{table}';
+            END
+        """)
+
+
+def _add_change_counters(cursor):
+    """Count committed changes per table so other processes can detect them."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS cambios_tabla (
+            tabla TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO cambios_tabla (tabla, version) VALUES (?, 0)",
+        [(table,) for table in TRACKED_TABLES]
+    )
+    for table in TRACKED_TABLES:
+        _create_change_triggers(cursor, table)
+
+
+def _add_harvest_recalculation(cursor):
+    """Track harvest date rewrites owed after a crop's cycle lengths change."""
+    # origenes is a JSON list of [first_days, routine_days] cycles whose
+    # computed dates are moved to (dias_primera, dias_rutinaria); the job
+    # resumes after ultimo_numero.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS recalculo_cosechas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tipo_de_cultivo TEXT NOT NULL,
+            origenes TEXT NOT NULL,
+            dias_primera INTEGER NOT NULL,
+            dias_rutinaria INTEGER NOT NULL,
+            ultimo_numero INTEGER,
+            total INTEGER NOT NULL DEFAULT 0,
+            procesadas INTEGER NOT NULL DEFAULT 0,
+            actualizadas INTEGER NOT NULL DEFAULT 0,
+            creado TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            terminado TEXT
+        )
+    """)
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_recalculo_cosechas_pendiente
+        ON recalculo_cosechas(tipo_de_cultivo) WHERE terminado IS NULL
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_hectareas_cultivo_numero ON hectareas(tipo_de_cultivo, numero)")
+
+
+# Full-text indexes: source table -> (key column, indexed text columns, bm25 weights)
+FTS_SOURCES = {
+    "tipo_hortaliza": ("codigo", ("nombre", "descripcion"), (10.0, 1.0)),
+    "tipo_suelo": ("codigo", ("nombre", "descripcion"), (10.0, 1.0)),
+    "clima": ("codigo", ("nombre", "descripcion"), (10.0, 1.0)),
+    "gestion_cultivo": ("codigo", ("observaciones",), (1.0,)),
+}
+
+
+def _create_fts_index(cursor, table):
+    """(Re)create the external-content FTS5 index of a table and its sync triggers."""
+    key, columns, weights = FTS_SOURCES[table]
+    fts = f"fts_{table}"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+
+    for event in ("insert", "delete", "update"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_fts_{event}")
+    cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+    # remove_diacritics lets "raices" find "Raíces"; the prefix indexes keep
+    # short "tom*" queries from walking the whole term list
+    cursor.execute(f"""
+        CREATE VIRTUAL TABLE {fts} USING fts5(
+            {column_list}, content='{table}', content_rowid='{key}',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    """)
+    cursor.execute(
+        f"INSERT INTO {fts}({fts}, rank) VALUES ('rank', ?)",
+        (f"bm25({', '.join(str(w) for w in weights)})",)
+    )
+    cursor.execute(f"""
+        CREATE TRIGGER trg_{table}_fts_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{key}, {new_values});
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER trg_{table}_fts_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values});
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER trg_{table}_fts_update AFTER UPDATE ON {table}
+        BEGIN
+            INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values});
+            INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{key}, {new_values});
+        END
+    """)
+    cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _add_full_text_search(cursor):
+    """Index catalog names/descriptions and gestion_cultivo observations with FTS5."""
+    for table in FTS_SOURCES:
+        _create_fts_index(cursor, table)
+
+
+# Catalogs whose names get an accent/case-folded nombre_clave
+FOLDED_NAME_TABLES = ("tipo_hortaliza", "tipo_suelo", "clima", "tipo_cultivo")
+
+
+def _add_folded_names(cursor):
+    """Add an indexed nombre_clave (utils.text_utils.fold of nombre) to the catalogs."""
+    # A virtual generated column is computed by SQLite itself, so rows written
+    # by any connection (the legacy screens included) get the right key; the
+    # index is what stores it.
+    for table in FOLDED_NAME_TABLES:
+        cursor.execute(
+            f"ALTER TABLE {table} ADD COLUMN nombre_clave TEXT "
+            f"GENERATED ALWAYS AS ({fold_sql('nombre')}) VIRTUAL"
+        )
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_nombre_clave ON {table}(nombre_clave)")
+
+
+# hectareas name columns stored as catalog ids from version 7:
+# name column -> (catalog, catalog key, id column, SQL matching catalog row c to hectarea row h).
+# Names match on nombre_clave, ignoring accents and case, as the repositories do.
+HECTAREA_NAME_CATALOGS = {
+    "tipo_de_cultivo": ("tipo_cultivo", "id", "id_tipo_cultivo",
+                        f"c.nombre_clave = {fold_sql('h.tipo_de_cultivo')}"),
+    "tipo_suelo": ("tipo_suelo", "codigo", "id_tipo_suelo",
+                   f"c.nombre_clave = {fold_sql('h.tipo_suelo')}"),
+}
+
+_HECTAREAS_NUEVA_COLUMNS = (
+    "id", "numero", "id_tipo_cultivo", "siembra", "primera_cosecha",
+    "cosecha_rutinaria", "id_tipo_suelo", "temperatura",
+)
+
+
+def _hectarea_id_select(source):
+    """SELECT of hectareas_nueva rows from source, a subquery of hectareas rows.
+
+    Each distinct name is looked up once rather than once per row; source
+    appears three times, so its parameters must be passed three times.
+    """
+    joins = []
+    for column, (catalog, key, _, match) in HECTAREA_NAME_CATALOGS.items():
+        joins.append(f"""
+            LEFT JOIN (
+                SELECT h.{column} AS nombre,
+                       (SELECT c.{key} FROM {catalog} c WHERE {match} ORDER BY c.{key} LIMIT 1) AS id
+                FROM (SELECT DISTINCT {column} FROM {source}) h
+            ) {catalog} ON {catalog}.nombre = h.{column}
+        """)
+    return f"""
+        SELECT h.id, h.numero, tipo_cultivo.id, h.siembra, h.primera_cosecha,
+               h.cosecha_rutinaria, tipo_suelo.id, h.temperatura
+        FROM {source} h {' '.join(joins)}
+    """
+
+
+def _missing_names_insert(column, source):
+    """INSERT adding to the catalog the names in source (a subquery of hectareas rows) it lacks."""
+    catalog, _, _, match = HECTAREA_NAME_CATALOGS[column]
+    group = fold_sql(f"h.{column}")
+    return f"""
+        INSERT INTO {catalog} (nombre)
+        SELECT MIN(h.{column}) FROM (SELECT DISTINCT {column} FROM {source}) h
+        WHERE h.{column} != '' AND NOT EXISTS (SELECT 1 FROM {catalog} c WHERE {match})
+        GROUP BY {group}
+    """
+
+
+def _prepare_hectarea_ids(cursor):
+    """Create hectareas_nueva with catalog ids and keep copied rows in sync.
+
+    Rows are copied in id order; writes that other processes make to rows
+    already copied are replayed by triggers, and newer rows (higher ids)
+    are picked up by later chunks.
+    """
+    # Hectareas only take names the catalogs hold; the built-in crops have
+    # no months of their own, so their default cycles still apply
+    cursor.execute("SELECT COUNT(*) FROM tipo_cultivo")
+    if cursor.fetchone()[0] == 0:
+        cursor.executemany(
+            "INSERT INTO tipo_cultivo (nombre) VALUES (?)",
+            [("limones",), ("maíz",), ("trigo",), ("tomate",)]
+        )
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS hectareas_nueva (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            numero INTEGER,
+            id_tipo_cultivo INTEGER,
+            siembra TEXT,
+            primera_cosecha TEXT,
+            cosecha_rutinaria TEXT,
+            id_tipo_suelo INTEGER,
+            temperatura REAL,
+            FOREIGN KEY(id_tipo_cultivo) REFERENCES tipo_cultivo(id),
+            FOREIGN KEY(id_tipo_suelo) REFERENCES tipo_suelo(codigo)
+        )
+    """)
+    source = "(SELECT * FROM hectareas WHERE id = new.id)"
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_hectareas_nueva_update AFTER UPDATE ON hectareas
+        WHEN old.id <= (SELECT IFNULL(MAX(id), 0) FROM hectareas_nueva)
+        BEGIN
+            {_missing_names_insert('tipo_de_cultivo', source)};
+            {_missing_names_insert('tipo_suelo', source)};
+            DELETE FROM hectareas_nueva WHERE id = old.id;
+            INSERT INTO hectareas_nueva ({', '.join(_HECTAREAS_NUEVA_COLUMNS)}) {_hectarea_id_select(source)};
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_hectareas_nueva_delete AFTER DELETE ON hectareas
+        BEGIN
+            DELETE FROM hectareas_nueva WHERE id = old.id;
+        END
+    """)
+
+
+def _copy_hectarea_ids(cursor, chunk_size):
+    """Copy the next chunk of hectareas into hectareas_nueva; returns rows copied."""
+    cursor.execute("SELECT IFNULL(MAX(id), 0) FROM hectareas_nueva")
+    last = cursor.fetchone()[0]
+    chunk = "(SELECT * FROM hectareas WHERE id > ? ORDER BY id LIMIT ?)"
+    for column in HECTAREA_NAME_CATALOGS:
+        cursor.execute(_missing_names_insert(column, chunk), (last, chunk_size))
+    cursor.execute(
+        f"INSERT INTO hectareas_nueva ({', '.join(_HECTAREAS_NUEVA_COLUMNS)}) {_hectarea_id_select(chunk)}",
+        (last, chunk_size) * 3
+    )
+    return cursor.rowcount
+
+
+def _swap_hectarea_ids(cursor, chunk_size):
+    """Copy what is left and replace hectareas with hectareas_nueva."""
+    while _copy_hectarea_ids(cursor, chunk_size):
+        pass
+    # Dropping the table drops its indexes and triggers (the sync ones too)
+    cursor.execute("DROP TABLE hectareas")
+    cursor.execute("ALTER TABLE hectareas_nueva RENAME TO hectareas")
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_hectareas_numero ON hectareas(numero)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_hectareas_cultivo_numero ON hectareas(id_tipo_cultivo, numero)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_hectareas_suelo_numero ON hectareas(id_tipo_suelo, numero)")
+    _create_change_triggers(cursor, "hectareas")
+    for catalog, key, id_column, _ in HECTAREA_NAME_CATALOGS.values():
+        # Foreign keys are not enforced, so refuse deleting a catalog row still in use
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{catalog}_en_uso BEFORE DELETE ON {catalog}
+            WHEN EXISTS (SELECT 1 FROM hectareas WHERE {id_column} = old.{key})
+            BEGIN
+                SELECT RAISE(ABORT, 'No se puede eliminar: hay hectáreas que lo usan');
+            END
+        """)
+        # Renaming a catalog row changes what its hectareas read
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{catalog}_cambios_hectareas AFTER UPDATE OF nombre ON {catalog}
+            WHEN EXISTS (SELECT 1 FROM hectareas WHERE {id_column} = old.{key})
+            BEGIN
+                UPDATE cambios_tabla SET version = version + 1 WHERE tabla = 'hectareas';
+            END
+        """)
+
+
+def _unique_folded_names(cursor):
+    """Make nombre_clave unique so a catalog cannot hold one name in two spellings."""
+    duplicados = []
+    for table in FOLDED_NAME_TABLES:
+        cursor.execute(
+            f"SELECT group_concat(nombre, ' / ') FROM {table} "
+            "WHERE nombre_clave IS NOT NULL GROUP BY nombre_clave HAVING COUNT(*) > 1"
+        )
+        duplicados += [f"{table}: {row[0]}" for row in cursor.fetchall()]
+    if duplicados:
+        raise MigrationError(
+            f"Catalog names differing only in accents or case: {'; '.join(duplicados)}",
+            duplicados
+        )
+    for table in FOLDED_NAME_TABLES:
+        cursor.execute(f"DROP INDEX IF EXISTS idx_{table}_nombre_clave")
+        cursor.execute(f"CREATE UNIQUE INDEX idx_{table}_nombre_clave ON {table}(nombre_clave)")
+
+
+def _recalculation_by_crop_id(cursor):
+    """Key recalculation jobs on the tipo_cultivo id rather than the crop name.
+
+    Pending jobs whose names fold to the same crop are merged into the newest
+    one, as enqueue() would have done; jobs for crops the catalog no longer
+    has cannot match any hectarea and are closed.
+    """
+    cursor.execute("ALTER TABLE recalculo_cosechas ADD COLUMN id_tipo_cultivo INTEGER REFERENCES tipo_cultivo(id)")
+    cursor.execute(f"""
+        UPDATE recalculo_cosechas SET id_tipo_cultivo = (
+            SELECT c.id FROM tipo_cultivo c
+            WHERE c.nombre_clave = {fold_sql('recalculo_cosechas.tipo_de_cultivo')}
+        )
+    """)
+    cursor.execute(
+        "SELECT id, id_tipo_cultivo, origenes, dias_primera, dias_rutinaria FROM recalculo_cosechas "
+        "WHERE terminado IS NULL AND id_tipo_cultivo IS NOT NULL ORDER BY id"
+    )
+    jobs = {}
+    for job in cursor.fetchall():
+        jobs.setdefault(job[1], []).append(job)
+    for merged in jobs.values():
+        if len(merged) < 2:
+            continue
+        newest = merged[-1]
+        origenes = set()
+        for job in merged:
+            origenes.update(tuple(o) for o in json.loads(job[2]))
+            origenes.add((job[3], job[4]))
+        origenes.discard((newest[3], newest[4]))
+        cursor.executemany(
+            "UPDATE recalculo_cosechas SET terminado = CURRENT_TIMESTAMP WHERE id = ?",
+            [(job[0],) for job in merged[:-1]]
+        )
+        cursor.execute(
+            "UPDATE recalculo_cosechas SET origenes = ?, ultimo_numero = NULL, procesadas = 0 WHERE id = ?",
+            (json.dumps(sorted(origenes)), newest[0])
+        )
+    cursor.execute(
+        "UPDATE recalculo_cosechas SET terminado = CURRENT_TIMESTAMP "
+        "WHERE terminado IS NULL AND id_tipo_cultivo IS NULL"
+    )
+    cursor.execute("DROP INDEX IF EXISTS idx_recalculo_cosechas_pendiente")
+    cursor.execute("""
+        CREATE UNIQUE INDEX idx_recalculo_cosechas_pendiente
+        ON recalculo_cosechas(id_tipo_cultivo) WHERE terminado IS NULL
+    """)
+
+
+MIGRATIONS = [
+    Migration(1, "Esquema base y datos por defecto", _create_base_schema),
+    Migration(2, "Índices de búsqueda y numero único en hectareas", _add_lookup_indexes),
+    Migration(3, "Contadores de cambios por tabla", _add_change_counters),
+    Migration(4, "Recálculo de cosechas por cambio de ciclo", _add_harvest_recalculation),
+    Migration(5, "Búsqueda de texto completo (FTS5)", _add_full_text_search),
+    Migration(6, "Clave de nombre sin acentos ni mayúsculas en catálogos", _add_folded_names),
+    Migration(7, "Cultivo y suelo de hectareas como ids de catálogo", _prepare_hectarea_ids,
+              backfill=_copy_hectarea_ids, finish=_swap_hectarea_ids),
+    Migration(8, "Nombres de catálogo únicos sin acentos ni mayúsculas", _unique_folded_names),
+    Migration(9, "Recálculos de cosechas por id de cultivo", _recalculation_by_crop_id),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_version(conn):
+    """Get the schema version stored in the database header."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def pending_migrations(conn, target=None):
+    """Get the migrations that still need to run to reach target."""
+    target = LATEST_VERSION if target is None else target
+    version = get_version(conn)
+    return [m for m in MIGRATIONS if version < m.version <= target]
+
+
+def _run_step(conn, version, work):
+    """Run work(cursor) in one write transaction unless the schema reached version.
+
+    Returns (ran, result).
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        # Another process may have migrated while we waited for the lock
+        if get_version(conn) >= version:
+            conn.rollback()
+            return False, None
+        result = work(cursor)
+        conn.commit()
+        return True, result
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def migrate(conn, target=None, chunk_size=BACKFILL_CHUNK_SIZE, progress=None):
+    """Apply pending migrations in order and return the ones applied.
+
+    progress(migration, rows) is called after each backfill chunk.
+    """
+    target = LATEST_VERSION if target is None else target
+    if get_version(conn) >= target:
+        return []
+
+    applied = []
+    for migration in pending_migrations(conn, target):
+        def finish(cursor, migration=migration):
+            if migration.backfill is None:
+                migration.apply(cursor)
+            else:
+                migration.finish(cursor, chunk_size)
+            cursor.execute(f"PRAGMA user_version = {int(migration.version)}")
+
+        if migration.backfill is not None:
+            ran, _ = _run_step(conn, migration.version, migration.apply)
+            while ran:
+                ran, moved = _run_step(conn, migration.version,
+                                       lambda cursor: migration.backfill(cursor, chunk_size))
+                if not moved:
+                    break
+                if progress is not None:
+                    progress(migration, moved)
+        ran, _ = _run_step(conn, migration.version, finish)
+        if ran:
+            applied.append(migration)
+    return applied
+
+
+def main(argv=None):
+    """Command line entry point to inspect or apply migrations."""
+    from data import database
+
+    parser = argparse.ArgumentParser(prog="python -m data.migrations", description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=database.DATABASE_PATH, help="Ruta de la base de datos")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="Mostrar la versión actual y las migraciones pendientes")
+    upgrade = subparsers.add_parser("upgrade", help="Aplicar las migraciones pendientes")
+    upgrade.add_argument("--to", type=int, default=None, help="Versión objetivo")
+    upgrade.add_argument("--chunk-size", type=int, default=BACKFILL_CHUNK_SIZE,
+                         help="Filas copiadas por transacción en migraciones por bloques")
+    args = parser.parse_args(argv)
+
+    database.DATABASE_PATH = args.db
+    with database.connection() as conn:
+        if args.command == "status":
+            version = get_version(conn)
+            print(f"Base de datos: {args.db}")
+            print(f"Versión actual: {version} / última: {LATEST_VERSION}")
+            for m in MIGRATIONS:
+                estado = "aplicada" if m.version <= version else "pendiente"
+                print(f"  {m.version:>3}  {estado:<9}  {m.description}")
+        else:
+            copiadas = {}
+
+            def progress(migration, rows):
+                copiadas[migration.version] = copiadas.get(migration.version, 0) + rows
+                print(f"\rMigración {migration.version}: {copiadas[migration.version]} filas copiadas",
+                      end="", file=sys.stderr)
+
+            try:
+                applied = migrate(conn, args.to, args.chunk_size, progress)
+            except MigrationError as e:
+                print(f"Migración detenida, corrija los datos y repita: {e}", file=sys.stderr)
+                return 1
+            if copiadas:
+                print(file=sys.stderr)
+            if not applied:
+                print("El esquema ya está actualizado.")
+            for m in applied:
+                print(f"Aplicada migración {m.version}: {m.description}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Connection pool - Long-lived, thread-aware SQLite connections."""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class PoolStats:
+    """Counters describing how the pool has been used."""
+
+    FIELDS = (
+        "acquired", "reused", "opened", "closed", "waits",
+        "health_checks", "health_failures", "rollbacks",
+    )
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+        self.open_seconds = 0.0
+
+    def snapshot(self):
+        """Return the current counters as a dictionary."""
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data["open_seconds"] = self.open_seconds
+        return data
+
+
+class PooledConnection:
+    """Proxy around a sqlite3.Connection that returns to the pool on close()."""
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self.last_used = time.monotonic()
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        """Release the connection back to the pool instead of closing it."""
+        self._pool.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Nested uses share the outer transaction; only the outermost ends it
+        if self._pool.is_outermost(self):
+            if exc_type is None:
+                self._raw.commit()
+            else:
+                self._raw.rollback()
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """Pool of SQLite connections bound to the thread that acquires them.
+
+    A thread keeps the same connection for every nested acquire until the
+    outermost release, after which the connection goes back to the idle set
+    and stays open for the next caller.
+    """
+
+    def __init__(self, database, pool_size=5, timeout=5.0,
+                 health_check_interval=30.0, on_connect=None):
+        self.database = database
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.on_connect = on_connect
+        self.stats = PoolStats()
+        self._idle = []
+        self._total = 0
+        self._closed = False
+        self._local = threading.local()
+        self._lock = threading.Condition()
+
+    def acquire(self):
+        """Get the calling thread's connection, checking one out if needed."""
+        holder = self._local
+        if getattr(holder, "conn", None) is not None:
+            holder.depth += 1
+            with self._lock:
+                self.stats.acquired += 1
+                self.stats.reused += 1
+            return holder.conn
+
+        conn = self._checkout()
+        holder.conn = conn
+        holder.depth = 1
+        return conn
+
+    def release(self, conn):
+        """Release one level of use; the outermost release returns it to the pool."""
+        holder = self._local
+        if getattr(holder, "conn", None) is not conn:
+            return
+        holder.depth -= 1
+        if holder.depth > 0:
+            return
+        holder.conn = None
+
+        if conn.in_transaction:
+            conn.rollback()
+            with self._lock:
+                self.stats.rollbacks += 1
+        conn.last_used = time.monotonic()
+        with self._lock:
+            if self._closed:
+                self._discard(conn)
+            else:
+                self._idle.append(conn)
+            self._lock.notify()
+
+    def is_outermost(self, conn):
+        """Whether conn is the calling thread's connection at its outermost level."""
+        holder = self._local
+        return getattr(holder, "conn", None) is conn and holder.depth == 1
+
+    @contextmanager
+    def connection(self):
+        """Context manager that commits on success and rolls back on error.
+
+        Only the outermost level does either, so a nested block never ends
+        the transaction of the block around it.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+            if conn.in_transaction and self.is_outermost(conn):
+                conn.commit()
+        except BaseException:
+            if conn.in_transaction and self.is_outermost(conn):
+                conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    @contextmanager
+    def track(self):
+        """Yield a dictionary filled with the stats accumulated inside the block."""
+        before = self.stats.snapshot()
+        delta = {}
+        try:
+            yield delta
+        finally:
+            after = self.stats.snapshot()
+            delta.update({key: after[key] - before[key] for key in after})
+
+    def close_all(self):
+        """Close every idle connection and refuse to keep released ones."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def _checkout(self):
+        """Take an idle connection or open a new one, waiting if the pool is full."""
+        deadline = time.monotonic() + self.timeout
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            self.stats.acquired += 1
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    if self._is_healthy(conn):
+                        self.stats.reused += 1
+                        return conn
+                    self._discard(conn)
+                    continue
+                if self._total < self.pool_size:
+                    self._total += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout}s"
+                    )
+                self.stats.waits += 1
+                self._lock.wait(remaining)
+
+        try:
+            return self._open()
+        except Exception:
+            with self._lock:
+                self._total -= 1
+                self._lock.notify()
+            raise
+
+    def _open(self):
+        """Open a new raw connection wrapped in a proxy."""
+        start = time.perf_counter()
+        raw = sqlite3.connect(self.database, check_same_thread=False)
+        raw.row_factory = sqlite3.Row
+        if self.on_connect is not None:
+            self.on_connect(raw)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.stats.opened += 1
+            self.stats.open_seconds += elapsed
+        return PooledConnection(self, raw)
+
+    def _is_healthy(self, conn):
+        """Ping connections that sat idle longer than the health check interval."""
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        self.stats.health_checks += 1
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            self.stats.health_failures += 1
+            return False
+
+    def _discard(self, conn):
+        """Close a raw connection and free its slot. Caller holds the lock."""
+        try:
+            conn._raw.close()
+        except sqlite3.Error:
+            pass
+        self._total -= 1
+        self.stats.closed += 1
@@ -0,0 +1,96 @@
+"""Search repository - Ranked full-text search over catalogs and observations."""
+
+import heapq
+import re
+
+from ..database import connection
+from ..migrations import FTS_SOURCES
+
+
+# Default snippet markers; callers rendering HTML pass their own
+SNIPPET_START = "["
+SNIPPET_END = "]"
+SNIPPET_TOKENS = 12
+
+_WORD = re.compile(r"\w+")
+
+# How each source names a result
+_TITLES = {
+    "tipo_hortaliza": "t.nombre",
+    "tipo_suelo": "t.nombre",
+    "clima": "t.nombre",
+    "gestion_cultivo": "'Gestión ' || t.codigo",
+}
+
+
+def fts_query(text, column=None):
+    """Turn user input into an FTS5 query requiring every word.
+
+    The last word matches as a prefix (from two letters), the way it is
+    being typed; the others must match whole words, which keeps FTS5 from
+    merging the doclists of every term sharing a long prefix. Words are
+    quoted, so operators and punctuation typed by the user are plain text.
+    Returns None when text has no words.
+    """
+    words = _WORD.findall(text)
+    if not words:
+        return None
+    scope = f"{column} : " if column else ""
+    terms = [f'{scope}"{word}"' for word in words]
+    # A one-letter prefix would match most of the vocabulary
+    if len(words[-1]) >= 2:
+        terms[-1] += "*"
+    return " AND ".join(terms)
+
+
+class BusquedaRepository:
+    """Repository for FTS5 searches."""
+
+    @staticmethod
+    def search(text, tablas=None, limit=50, start=SNIPPET_START, end=SNIPPET_END):
+        """Get the best matches for text across the indexed tables.
+
+        Returns (tabla, codigo, titulo, fragmento, rank) tuples ordered by
+        bm25 rank (lower is better) over every match; fragmento has the
+        matched words wrapped in start/end.
+        """
+        query = fts_query(text)
+        if query is None:
+            return []
+        results = []
+        with connection() as conn:
+            cursor = conn.cursor()
+            for tabla in tablas or FTS_SOURCES:
+                key = FTS_SOURCES[tabla][0]
+                # FTS5 sorts the matches by rank itself, so snippets and the
+                # join only run for the rows LIMIT returns
+                cursor.execute(f"""
+                    SELECT ?, f.rowid, {_TITLES[tabla]},
+                           snippet(fts_{tabla}, -1, ?, ?, '…', ?), f.rank
+                    FROM fts_{tabla} f JOIN {tabla} t ON t.{key} = f.rowid
+                    WHERE fts_{tabla} MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                """, (tabla, start, end, SNIPPET_TOKENS, query, limit))
+                results.append([tuple(row) for row in cursor.fetchall()])
+        # Each list is already sorted by rank
+        return list(heapq.merge(*results, key=lambda row: row[4]))[:limit]
+
+    @staticmethod
+    def count(text, tabla):
+        """Count the rows of one table matching text."""
+        query = fts_query(text)
+        if query is None:
+            return 0
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM fts_{tabla} WHERE fts_{tabla} MATCH ?", (query,))
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def optimize():
+        """Merge the FTS5 index segments, e.g. after a bulk import."""
+        with connection() as conn:
+            cursor = conn.cursor()
+            for tabla in FTS_SOURCES:
+                cursor.execute(f"INSERT INTO fts_{tabla}(fts_{tabla}) VALUES ('optimize')")
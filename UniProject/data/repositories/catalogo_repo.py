@@ -1,6 +1,43 @@
 """Catalog repository - Database operations for reference data."""
 
-from ..database import get_connection
+import sqlite3
+
+from utils.text_utils import fold
+from ..database import begin_immediate, connection, executemany_in_savepoint
+from .busqueda_repo import fts_query
+
+
+# Writable columns of each name-keyed catalog table, nombre first
+CATALOG_COLUMNS = {
+    "tipo_suelo": ("nombre", "descripcion", "imagen"),
+    "tipo_hortaliza": ("nombre", "descripcion", "imagen"),
+    "clima": ("nombre", "grados_temperatura", "descripcion", "imagen"),
+    "tipo_cultivo": ("nombre", "meses_primera", "meses_rutinaria"),
+}
+
+# Primary key of each catalog table
+CATALOG_KEYS = {"tipo_suelo": "codigo", "tipo_hortaliza": "codigo", "clima": "codigo", "tipo_cultivo": "id"}
+
+# Sorts after every character, closing the range of keys sharing a prefix
+_PREFIX_END = "\U0010ffff"
+
+# Shown when tipo_cultivo has no rows yet
+DEFAULT_TIPOS_CULTIVO = [
+    (1, "limones"),
+    (2, "maíz"),
+    (3, "trigo"),
+    (4, "tomate")
+]
+
+# Joined crop management listing shared by the full and streamed reads
+_GESTION_CULTIVO_REPORT = """
+    SELECT gc.codigo, u.username, th.nombre, ts.nombre, c.nombre, gc.video, gc.observaciones
+    FROM gestion_cultivo gc
+    JOIN usuarios u ON gc.id_persona = u.id
+    JOIN tipo_hortaliza th ON gc.id_tipo_hortaliza = th.codigo
+    JOIN tipo_suelo ts ON gc.id_tipo_suelo = ts.codigo
+    JOIN clima c ON gc.id_clima = c.codigo
+"""
 
 
 class CatalogoRepository:
@@ -13,70 +50,73 @@ class CatalogoRepository:
     @staticmethod
     def get_all_tipo_hortaliza():
         """Get all hortaliza types."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre FROM tipo_hortaliza")
-        datos = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre FROM tipo_hortaliza")
+            datos = cursor.fetchall()
         return datos
 
     @staticmethod
     def get_tipo_hortaliza_full():
         """Get all hortaliza types with full details."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_hortaliza")
-        rows = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_hortaliza")
+            rows = cursor.fetchall()
         return rows
 
     @staticmethod
     def search_tipo_hortaliza(nombre):
-        """Search hortaliza type by name."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT codigo, nombre, descripcion, imagen FROM tipo_hortaliza WHERE nombre LIKE ?",
-            ('%' + nombre + '%',)
-        )
-        registros = cursor.fetchall()
-        conn.close()
+        """Search hortaliza types by name, ignoring accents and case.
+
+        Names starting with the text come first, then names with words
+        starting with the given ones, best first.
+        """
+        registros = CatalogoRepository.search_by_prefix("tipo_hortaliza", nombre)
+        query = fts_query(nombre, "nombre")
+        if query is None:
+            return registros
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT t.codigo, t.nombre, t.descripcion, t.imagen
+                   FROM fts_tipo_hortaliza f JOIN tipo_hortaliza t ON t.codigo = f.rowid
+                   WHERE fts_tipo_hortaliza MATCH ?
+                   ORDER BY f.rank""",
+                (query,)
+            )
+            vistos = {r[0] for r in registros}
+            registros += [r for r in cursor.fetchall() if r[0] not in vistos]
         return registros
 
     @staticmethod
     def create_tipo_hortaliza(nombre, descripcion, imagen):
         """Create new hortaliza type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, ?, ?)",
-            (nombre, descripcion, imagen)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES (?, ?, ?)",
+                (nombre, descripcion, imagen)
+            )
 
     @staticmethod
     def update_tipo_hortaliza(codigo, nombre, descripcion, imagen):
         """Update hortaliza type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE tipo_hortaliza
-               SET nombre = ?, descripcion = ?, imagen = ?
-               WHERE codigo = ?""",
-            (nombre, descripcion, imagen, codigo)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE tipo_hortaliza
+                   SET nombre = ?, descripcion = ?, imagen = ?
+                   WHERE codigo = ?""",
+                (nombre, descripcion, imagen, codigo)
+            )
 
     @staticmethod
     def delete_tipo_hortaliza(codigo):
         """Delete hortaliza type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tipo_hortaliza WHERE codigo = ?", (codigo,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM tipo_hortaliza WHERE codigo = ?", (codigo,))
 
     # ========================
     # Tipo Suelo
@@ -85,57 +125,49 @@ class CatalogoRepository:
     @staticmethod
     def get_all_tipo_suelo():
         """Get all soil types."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre FROM tipo_suelo")
-        datos = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre FROM tipo_suelo")
+            datos = cursor.fetchall()
         return datos
 
     @staticmethod
     def get_tipo_suelo_full():
         """Get all soil types with full details."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_suelo")
-        rows = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_suelo")
+            rows = cursor.fetchall()
         return rows
 
     @staticmethod
     def create_tipo_suelo(nombre, descripcion, imagen):
         """Create new soil type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO tipo_suelo (nombre, descripcion, imagen) VALUES (?, ?, ?)",
-            (nombre, descripcion, imagen)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO tipo_suelo (nombre, descripcion, imagen) VALUES (?, ?, ?)",
+                (nombre, descripcion, imagen)
+            )
 
     @staticmethod
     def update_tipo_suelo(codigo, nombre, descripcion, imagen):
         """Update soil type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE tipo_suelo
-               SET nombre = ?, descripcion = ?, imagen = ?
-               WHERE codigo = ?""",
-            (nombre, descripcion, imagen, codigo)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE tipo_suelo
+                   SET nombre = ?, descripcion = ?, imagen = ?
+                   WHERE codigo = ?""",
+                (nombre, descripcion, imagen, codigo)
+            )
 
     @staticmethod
     def delete_tipo_suelo(codigo):
         """Delete soil type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tipo_suelo WHERE codigo = ?", (codigo,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM tipo_suelo WHERE codigo = ?", (codigo,))
 
     # ========================
     # Clima
@@ -144,57 +176,49 @@ class CatalogoRepository:
     @staticmethod
     def get_all_clima():
         """Get all climate types."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre FROM clima")
-        datos = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre FROM clima")
+            datos = cursor.fetchall()
         return datos
 
     @staticmethod
     def get_clima_full():
         """Get all climate types with full details."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, grados_temperatura, descripcion, imagen FROM clima")
-        rows = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT codigo, nombre, grados_temperatura, descripcion, imagen FROM clima")
+            rows = cursor.fetchall()
         return rows
 
     @staticmethod
     def create_clima(nombre, grados, descripcion, imagen):
         """Create new climate type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO clima (nombre, grados_temperatura, descripcion, imagen) VALUES (?, ?, ?, ?)",
-            (nombre, grados, descripcion, imagen)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO clima (nombre, grados_temperatura, descripcion, imagen) VALUES (?, ?, ?, ?)",
+                (nombre, grados, descripcion, imagen)
+            )
 
     @staticmethod
     def update_clima(codigo, nombre, grados, descripcion, imagen):
         """Update climate type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE clima
-               SET nombre = ?, grados_temperatura = ?, descripcion = ?, imagen = ?
-               WHERE codigo = ?""",
-            (nombre, grados, descripcion, imagen, codigo)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE clima
+                   SET nombre = ?, grados_temperatura = ?, descripcion = ?, imagen = ?
+                   WHERE codigo = ?""",
+                (nombre, grados, descripcion, imagen, codigo)
+            )
 
     @staticmethod
     def delete_clima(codigo):
         """Delete climate type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM clima WHERE codigo = ?", (codigo,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM clima WHERE codigo = ?", (codigo,))
 
     # ========================
     # Tipo Cultivo
@@ -203,62 +227,49 @@ class CatalogoRepository:
     @staticmethod
     def get_all_tipo_cultivo():
         """Get all crop types."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, nombre FROM tipo_cultivo")
-        rows = cursor.fetchall()
-        conn.close()
-        return rows if rows else [
-            (1, "limones"),
-            (2, "maíz"),
-            (3, "trigo"),
-            (4, "tomate")
-        ]
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, nombre FROM tipo_cultivo")
+            rows = cursor.fetchall()
+        return rows if rows else DEFAULT_TIPOS_CULTIVO
 
     @staticmethod
     def get_tipo_cultivo_full():
         """Get all crop types with full details."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, nombre, meses_primera, meses_rutinaria FROM tipo_cultivo")
-        rows = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, nombre, meses_primera, meses_rutinaria FROM tipo_cultivo")
+            rows = cursor.fetchall()
         return rows
 
     @staticmethod
     def create_tipo_cultivo(nombre, meses_primera, meses_rutinaria):
         """Create new crop type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO tipo_cultivo (nombre, meses_primera, meses_rutinaria) VALUES (?, ?, ?)",
-            (nombre, meses_primera, meses_rutinaria)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO tipo_cultivo (nombre, meses_primera, meses_rutinaria) VALUES (?, ?, ?)",
+                (nombre, meses_primera, meses_rutinaria)
+            )
 
     @staticmethod
     def update_tipo_cultivo(cultivo_id, nombre, meses_primera, meses_rutinaria):
         """Update crop type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE tipo_cultivo
-               SET nombre = ?, meses_primera = ?, meses_rutinaria = ?
-               WHERE id = ?""",
-            (nombre, meses_primera, meses_rutinaria, cultivo_id)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE tipo_cultivo
+                   SET nombre = ?, meses_primera = ?, meses_rutinaria = ?
+                   WHERE id = ?""",
+                (nombre, meses_primera, meses_rutinaria, cultivo_id)
+            )
 
     @staticmethod
     def delete_tipo_cultivo(cultivo_id):
         """Delete crop type."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tipo_cultivo WHERE id = ?", (cultivo_id,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM tipo_cultivo WHERE id = ?", (cultivo_id,))
 
     # ========================
     # Gestion Cultivo
@@ -267,80 +278,167 @@ class CatalogoRepository:
     @staticmethod
     def get_all_gestion_cultivo():
         """Get all crop management records."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT gc.codigo, u.username, th.nombre, ts.nombre, c.nombre, gc.video, gc.observaciones
-            FROM gestion_cultivo gc
-            JOIN usuarios u ON gc.id_persona = u.id
-            JOIN tipo_hortaliza th ON gc.id_tipo_hortaliza = th.codigo
-            JOIN tipo_suelo ts ON gc.id_tipo_suelo = ts.codigo
-            JOIN clima c ON gc.id_clima = c.codigo
-        """)
-        registros = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_GESTION_CULTIVO_REPORT)
+            registros = cursor.fetchall()
         return registros
 
+    @staticmethod
+    def iter_gestion_cultivo(batch_size=500):
+        """Yield crop management records in batches from a single read.
+
+        The pooled connection is held until the generator is exhausted or
+        closed, so every batch comes from the same snapshot.
+        """
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_GESTION_CULTIVO_REPORT)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield batch
+
+    @staticmethod
+    def count_gestion_cultivo():
+        """Count the crop management records the report will list."""
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM ({_GESTION_CULTIVO_REPORT})")
+            total = cursor.fetchone()[0]
+        return total
+
     @staticmethod
     def get_gestion_cultivo_raw():
         """Get crop management records with IDs."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT codigo, id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones FROM gestion_cultivo"
-        )
-        gestiones = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT codigo, id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones FROM gestion_cultivo"
+            )
+            gestiones = cursor.fetchall()
         return gestiones
 
     @staticmethod
     def create_gestion_cultivo(id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones):
         """Create new crop management record."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """INSERT INTO gestion_cultivo
-               (id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """INSERT INTO gestion_cultivo
+                   (id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones)
+            )
 
     @staticmethod
     def get_gestion_cultivo_by_id(codigo):
         """Get specific crop management record."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones
-               FROM gestion_cultivo WHERE codigo = ?""",
-            (codigo,)
-        )
-        data = cursor.fetchone()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones
+                   FROM gestion_cultivo WHERE codigo = ?""",
+                (codigo,)
+            )
+            data = cursor.fetchone()
         return data
 
     @staticmethod
     def update_gestion_cultivo(codigo, id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones):
         """Update crop management record."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE gestion_cultivo
-               SET id_persona = ?, id_tipo_hortaliza = ?, id_tipo_suelo = ?,
-                   id_clima = ?, video = ?, observaciones = ?
-               WHERE codigo = ?""",
-            (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones, codigo)
-        )
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE gestion_cultivo
+                   SET id_persona = ?, id_tipo_hortaliza = ?, id_tipo_suelo = ?,
+                       id_clima = ?, video = ?, observaciones = ?
+                   WHERE codigo = ?""",
+                (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones, codigo)
+            )
 
     @staticmethod
     def delete_gestion_cultivo(codigo):
         """Delete crop management record."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM gestion_cultivo WHERE codigo = ?", (codigo,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM gestion_cultivo WHERE codigo = ?", (codigo,))
+
+    # ========================
+    # Folded name lookups
+    # ========================
+
+    @staticmethod
+    def find_by_nombre(table, nombre):
+        """Get the catalog rows whose name equals nombre ignoring accents and case."""
+        columns = (CATALOG_KEYS[table],) + CATALOG_COLUMNS[table]
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM {table} WHERE nombre_clave = pliegue(?)",
+                (nombre,)
+            )
+            return cursor.fetchall()
+
+    @staticmethod
+    def search_by_prefix(table, prefix, limit=None):
+        """Get catalog rows whose name starts with prefix ignoring accents and case.
+
+        Rows come in folded-name order; the range is served by the
+        nombre_clave index.
+        """
+        columns = (CATALOG_KEYS[table],) + CATALOG_COLUMNS[table]
+        clave = fold(prefix)
+        if not clave:
+            return []
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM {table} "
+                "WHERE nombre_clave >= ? AND nombre_clave < ? ORDER BY nombre_clave LIMIT ?",
+                (clave, clave + _PREFIX_END, -1 if limit is None else limit)
+            )
+            return cursor.fetchall()
+
+    # ========================
+    # Bulk upsert
+    # ========================
+
+    @staticmethod
+    def upsert_many(table, rows):
+        """Insert or update catalog rows keyed on nombre ignoring accents and case.
+
+        rows is a sequence of tuples in CATALOG_COLUMNS[table] order; None
+        leaves a stored value unchanged. Existing entries keep their codigo/id
+        and spelling so references from other tables stay valid. Returns (saved, errors) with (index, message) per rejected row.
+        """
+        columns = CATALOG_COLUMNS[table]
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return 0, []
+        # Columns missing from the incoming row keep their stored value
+        updates = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in columns[1:])
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(nombre_clave) DO UPDATE SET {updates}"
+        )
+        with connection() as conn:
+            cursor = conn.cursor()
+            begin_immediate(cursor)
+            try:
+                executemany_in_savepoint(cursor, sql, rows)
+                return len(rows), []
+            except sqlite3.DatabaseError:
+                pass
+
+            saved, errors = 0, []
+            for index, row in enumerate(rows):
+                try:
+                    cursor.execute(sql, row)
+                except sqlite3.DatabaseError as e:
+                    errors.append((index, str(e)))
+                    continue
+                saved += 1
+            return saved, errors
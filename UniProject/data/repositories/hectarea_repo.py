@@ -1,6 +1,120 @@
 """Hectarea repository - Database operations for hectareas."""
 
-from ..database import get_connection
+import sqlite3
+
+from ..database import begin_immediate, connection, executemany_in_savepoint
+
+
+_INSERT_HECTAREA = """
+    INSERT INTO hectareas
+    (numero, id_tipo_cultivo, siembra, primera_cosecha,
+     cosecha_rutinaria, id_tipo_suelo, temperatura)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+HECTAREA_COLUMNS = (
+    "id", "numero", "tipo_de_cultivo", "siembra", "primera_cosecha",
+    "cosecha_rutinaria", "tipo_suelo", "temperatura",
+)
+
+DEFAULT_PAGE_SIZE = 500
+
+# Crop and soil names live in their catalogs; hectareas stores the ids.
+# name column -> (catalog, catalog key, id column). Names resolve on
+# nombre_clave, ignoring accents and case; crop names read back lowercase.
+NAME_CATALOGS = {
+    "tipo_de_cultivo": ("tipo_cultivo", "id", "id_tipo_cultivo"),
+    "tipo_suelo": ("tipo_suelo", "codigo", "id_tipo_suelo"),
+}
+
+# SQL for each column as read, and the join it needs (if any)
+_COLUMN_SQL = {
+    column: f"h.{column}" for column in HECTAREA_COLUMNS if column not in NAME_CATALOGS
+}
+_COLUMN_SQL.update(tipo_de_cultivo="lower(tc.nombre)", tipo_suelo="ts.nombre")
+_JOINS = {
+    "tipo_de_cultivo": "LEFT JOIN tipo_cultivo tc ON tc.id = h.id_tipo_cultivo",
+    "tipo_suelo": "LEFT JOIN tipo_suelo ts ON ts.codigo = h.id_tipo_suelo",
+}
+
+# NULLs cannot be compared in a keyset condition, so sort them as a sentinel
+_SORT_NULLS = {"temperatura": -1e308, "id": 0}
+_SORT_EXPRESSIONS = {
+    column: f"IFNULL({_COLUMN_SQL[column]}, {_SORT_NULLS.get(column, repr(''))})"
+    for column in HECTAREA_COLUMNS if column != "numero"
+}
+
+_UPSERT_HECTAREA = _INSERT_HECTAREA + """
+    ON CONFLICT(numero) DO UPDATE SET
+        id_tipo_cultivo = excluded.id_tipo_cultivo,
+        siembra = excluded.siembra,
+        primera_cosecha = excluded.primera_cosecha,
+        cosecha_rutinaria = excluded.cosecha_rutinaria,
+        id_tipo_suelo = excluded.id_tipo_suelo,
+        temperatura = excluded.temperatura
+"""
+
+
+def _select(columns):
+    """SELECT ... FROM clause reading columns, joining only the catalogs they name."""
+    joins = [_JOINS[column] for column in NAME_CATALOGS if column in columns]
+    fields = ", ".join(f"{_COLUMN_SQL[column]} AS {column}" for column in columns)
+    return f"SELECT {fields} FROM hectareas h {' '.join(joins)}"
+
+
+def _name_ids(cursor, column, names):
+    """Map names to catalog ids for a name column; None and '' map to None.
+
+    Names the catalog lacks are left out; new crops and soils are added
+    through CatalogoService, not by saving a hectarea.
+    """
+    table, key, _ = NAME_CATALOGS[column]
+    ids = {}
+    for nombre in set(names):
+        if nombre is None or nombre == "":
+            ids[nombre] = None
+            continue
+        cursor.execute(
+            f"SELECT {key} FROM {table} WHERE nombre_clave = pliegue(?) ORDER BY {key} LIMIT 1",
+            (str(nombre),)
+        )
+        row = cursor.fetchone()
+        if row is not None:
+            ids[nombre] = row[0]
+    return ids
+
+
+def _with_ids(cursor, rows, tipo_index, suelo_index):
+    """Copy row tuples with the crop and soil names at those positions replaced by ids.
+
+    Returns (converted rows, index in rows of each, (index, message) errors
+    for rows naming a crop or soil the catalogs lack).
+    """
+    names = {column: _name_ids(cursor, column, [row[index] for row in rows])
+             for column, index in (("tipo_de_cultivo", tipo_index), ("tipo_suelo", suelo_index))}
+    converted, indexes, errors = [], [], []
+    for i, row in enumerate(rows):
+        row = list(row)
+        unknown = None
+        for column, index in (("tipo_de_cultivo", tipo_index), ("tipo_suelo", suelo_index)):
+            if row[index] not in names[column]:
+                unknown = f"Unknown {column}: {row[index]}"
+                break
+            row[index] = names[column][row[index]]
+        if unknown is not None:
+            errors.append((i, unknown))
+            continue
+        converted.append(tuple(row))
+        indexes.append(i)
+    return converted, indexes, errors
+
+
+def _one_with_ids(cursor, row, tipo_index, suelo_index):
+    """_with_ids for a single row, raising ValueError for an unknown name."""
+    converted, _, errors = _with_ids(cursor, [row], tipo_index, suelo_index)
+    if errors:
+        raise ValueError(errors[0][1])
+    return converted[0]
 
 
 class HectareaRepository:
@@ -9,75 +123,250 @@ class HectareaRepository:
     @staticmethod
     def create(hectarea):
         """Save a hectarea to database."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        data = hectarea.to_dict()
-        cursor.execute("""
-            INSERT INTO hectareas 
-            (numero, tipo_de_cultivo, siembra, primera_cosecha, 
-             cosecha_rutinaria, tipo_suelo, temperatura)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data['numero'],
-            data['tipo_de_cultivo'],
-            data['siembra'],
-            data['primera_cosecha'],
-            data['cosecha_rutinaria'],
-            data['tipo_suelo'],
-            data['temperatura']
-        ))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            data = hectarea.to_dict()
+            row = _one_with_ids(cursor, (
+                data['numero'],
+                data['tipo_de_cultivo'],
+                data['siembra'],
+                data['primera_cosecha'],
+                data['cosecha_rutinaria'],
+                data['tipo_suelo'],
+                data['temperatura']
+            ), 1, 5)
+            cursor.execute(_INSERT_HECTAREA, row)
 
     @staticmethod
     def get_all():
         """Get all hectareas."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM hectareas")
-        hectareas = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_select(HECTAREA_COLUMNS) + " ORDER BY h.id")
+            hectareas = cursor.fetchall()
         return hectareas
 
+    @staticmethod
+    def fetch_page(after=None, limit=DEFAULT_PAGE_SIZE, columns=None, tipo_de_cultivo=None,
+                   tipo_suelo=None, siembra_desde=None, siembra_hasta=None,
+                   order_by="numero", descending=False):
+        """Get up to limit hectareas that sort after the given key.
+
+        With the default order after is the last numero seen; for any other
+        order_by it is the value returned by page_key() for the last row.
+        columns restricts the projection to names from HECTAREA_COLUMNS; numero
+        and the order_by column are appended when missing because they form
+        the pagination key. Hectareas without a numero are never returned.
+        """
+        columns = tuple(columns) if columns else HECTAREA_COLUMNS
+        unknown = (set(columns) | {order_by}) - set(HECTAREA_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown hectarea columns: {', '.join(sorted(unknown))}")
+        for key_column in ("numero", order_by):
+            if key_column not in columns:
+                columns += (key_column,)
+
+        with connection() as conn:
+            cursor = conn.cursor()
+            where, params = ["h.numero IS NOT NULL"], []
+            for column, nombre in (("tipo_de_cultivo", tipo_de_cultivo), ("tipo_suelo", tipo_suelo)):
+                if nombre is None:
+                    continue
+                # Filter on the integer id; a name the catalog lacks matches nothing
+                catalog_id = _name_ids(cursor, column, [nombre]).get(nombre)
+                if catalog_id is None:
+                    return []
+                where.append(f"h.{NAME_CATALOGS[column][2]} = ?")
+                params.append(catalog_id)
+            if siembra_desde is not None:
+                where.append("h.siembra >= ?")
+                params.append(siembra_desde)
+            if siembra_hasta is not None:
+                where.append("h.siembra <= ?")
+                params.append(siembra_hasta)
+
+            direction = "DESC" if descending else "ASC"
+            comparison = "<" if descending else ">"
+            if order_by == "numero":
+                order = f"h.numero {direction}"
+                if after is not None:
+                    where.append(f"h.numero {comparison} ?")
+                    params.append(after)
+            else:
+                sort_expr = _SORT_EXPRESSIONS[order_by]
+                order = f"{sort_expr} {direction}, h.numero {direction}"
+                if after is not None:
+                    where.append(f"({sort_expr}, h.numero) {comparison} (?, ?)")
+                    params.extend(after)
+            params.append(limit)
+
+            cursor.execute(
+                f"{_select(columns)} WHERE {' AND '.join(where)} ORDER BY {order} LIMIT ?",
+                params
+            )
+            return cursor.fetchall()
+
+    @staticmethod
+    def page_key(row, order_by="numero"):
+        """Get the keyset value to pass as after= to continue past row."""
+        if order_by == "numero":
+            return row["numero"]
+        value = row[order_by]
+        if value is None:
+            value = _SORT_NULLS.get(order_by, "")
+        return (value, row["numero"])
+
+    @staticmethod
+    def iter_all(page_size=DEFAULT_PAGE_SIZE, columns=None, **filters):
+        """Yield hectareas ordered by numero, reading one keyset page at a time.
+
+        Accepts the same columns, filters and ordering as fetch_page; at most
+        page_size rows are held in memory regardless of table size.
+        """
+        order_by = filters.get("order_by", "numero")
+        after = None
+        while True:
+            page = HectareaRepository.fetch_page(after, page_size, columns, **filters)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = HectareaRepository.page_key(page[-1], order_by)
+
     @staticmethod
     def get_by_numero(numero):
         """Get hectarea by number."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM hectareas WHERE numero = ?", (numero,))
-        hectarea = cursor.fetchone()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_select(HECTAREA_COLUMNS) + " WHERE h.numero = ?", (numero,))
+            hectarea = cursor.fetchone()
         return hectarea
 
+    @staticmethod
+    def search_terms():
+        """Get every numero and the distinct crop and soil names.
+
+        Returns (numeros, cultivos, suelos); numeros come sorted, read from
+        the numero index.
+        """
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT numero FROM hectareas WHERE numero IS NOT NULL ORDER BY numero")
+            numeros = [row[0] for row in cursor]
+            # Only catalog rows in use; each is one probe of the id index
+            cursor.execute("""
+                SELECT lower(nombre) FROM tipo_cultivo t
+                WHERE EXISTS (SELECT 1 FROM hectareas WHERE id_tipo_cultivo = t.id)
+            """)
+            cultivos = [row[0] for row in cursor]
+            cursor.execute("""
+                SELECT nombre FROM tipo_suelo t
+                WHERE EXISTS (SELECT 1 FROM hectareas WHERE id_tipo_suelo = t.codigo)
+            """)
+            suelos = [row[0] for row in cursor]
+        return numeros, cultivos, suelos
+
     @staticmethod
     def delete(numero):
         """Delete a hectarea."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM hectareas WHERE numero = ?", (numero,))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM hectareas WHERE numero = ?", (numero,))
 
     @staticmethod
     def update(numero, tipo, siembra, primera, rutinaria, tipo_suelo, temperatura):
         """Update hectarea data."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE hectareas
-            SET tipo_de_cultivo = ?, siembra = ?, primera_cosecha = ?,
-                cosecha_rutinaria = ?, tipo_suelo = ?, temperatura = ?
-            WHERE numero = ?
-        """, (tipo.lower(), siembra, primera, rutinaria, tipo_suelo, temperatura, numero))
-        conn.commit()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            row = _one_with_ids(cursor, (tipo, siembra, primera, rutinaria, tipo_suelo, temperatura, numero), 0, 4)
+            cursor.execute("""
+                UPDATE hectareas
+                SET id_tipo_cultivo = ?, siembra = ?, primera_cosecha = ?,
+                    cosecha_rutinaria = ?, id_tipo_suelo = ?, temperatura = ?
+                WHERE numero = ?
+            """, row)
 
     @staticmethod
     def get_next_numero():
         """Get next available hectarea number."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT MAX(numero) FROM hectareas")
-        max_num = cursor.fetchone()[0]
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(numero) FROM hectareas")
+            max_num = cursor.fetchone()[0]
         return 1 if max_num is None else max_num + 1
+
+    @staticmethod
+    def create_many(rows):
+        """Insert many hectareas in one transaction under a contiguous block of numeros.
+
+        rows is a sequence of (tipo_de_cultivo, siembra, primera_cosecha,
+        cosecha_rutinaria, tipo_suelo, temperatura) tuples. Returns
+        (numeros, errors): the numero given to each inserted row in order, and
+        (index, message) for rows naming an unknown crop or soil or that the
+        database rejected.
+        """
+        rows = list(rows)
+        if not rows:
+            return [], []
+        with connection() as conn:
+            cursor = conn.cursor()
+            # IMMEDIATE takes the write lock before reading MAX(numero)
+            begin_immediate(cursor)
+            cursor.execute("SELECT MAX(numero) FROM hectareas")
+            max_num = cursor.fetchone()[0]
+            start = 1 if max_num is None else max_num + 1
+
+            rows, indexes, errors = _with_ids(cursor, rows, 0, 4)
+            params = [(start + i,) + tuple(row) for i, row in enumerate(rows)]
+            try:
+                executemany_in_savepoint(cursor, _INSERT_HECTAREA, params)
+                return [p[0] for p in params], errors
+            except sqlite3.DatabaseError:
+                pass
+
+            # Retry row by row so one bad row does not abort the batch
+            numeros = []
+            numero = start
+            for index, row in zip(indexes, rows):
+                try:
+                    cursor.execute(_INSERT_HECTAREA, (numero,) + tuple(row))
+                except sqlite3.DatabaseError as e:
+                    errors.append((index, str(e)))
+                    continue
+                numeros.append(numero)
+                numero += 1
+            errors.sort()
+            return numeros, errors
+
+    @staticmethod
+    def upsert_many(rows):
+        """Insert or overwrite many hectareas keyed on numero in one transaction.
+
+        rows is a sequence of (numero, tipo_de_cultivo, siembra, primera_cosecha,
+        cosecha_rutinaria, tipo_suelo, temperatura) tuples. Returns (saved,
+        errors) with (index, message) for rows naming an unknown crop or soil
+        or that the database rejected.
+        """
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return 0, []
+        with connection() as conn:
+            cursor = conn.cursor()
+            begin_immediate(cursor)
+            rows, indexes, errors = _with_ids(cursor, rows, 1, 5)
+            try:
+                executemany_in_savepoint(cursor, _UPSERT_HECTAREA, rows)
+                return len(rows), errors
+            except sqlite3.DatabaseError:
+                pass
+
+            saved = 0
+            for index, row in zip(indexes, rows):
+                try:
+                    cursor.execute(_UPSERT_HECTAREA, row)
+                except sqlite3.DatabaseError as e:
+                    errors.append((index, str(e)))
+                    continue
+                saved += 1
+            errors.sort()
+            return saved, errors
+
@@ -0,0 +1,149 @@
+"""Recalculation repository - Harvest date rewrites owed after cycle changes."""
+
+import json
+
+from ..database import begin_immediate, connection
+
+
+_JOB_COLUMNS = (
+    "id", "id_tipo_cultivo", "tipo_de_cultivo", "origenes", "dias_primera", "dias_rutinaria",
+    "ultimo_numero", "total", "procesadas", "actualizadas",
+)
+
+
+def _offset(days):
+    """SQLite date() modifier adding a number of days."""
+    return f"{int(days):+d} days"
+
+
+class RecalculoRepository:
+    """Repository for the recalculo_cosechas job table."""
+
+    @staticmethod
+    def enqueue(id_tipo_cultivo, desde, hasta):
+        """Record that a crop's cycle moved from desde to hasta, both (first, routine) days.
+
+        id_tipo_cultivo is the crop's tipo_cultivo id. A pending job for the
+        same crop is merged and restarted, so rows still on any earlier cycle
+        are moved as well. Returns the job id, or None when there is nothing
+        to rewrite.
+        """
+        hasta = [int(hasta[0]), int(hasta[1])]
+        with connection() as conn:
+            cursor = conn.cursor()
+            begin_immediate(cursor)
+            cursor.execute(
+                "SELECT id, origenes, dias_primera, dias_rutinaria FROM recalculo_cosechas "
+                "WHERE id_tipo_cultivo = ? AND terminado IS NULL",
+                (id_tipo_cultivo,)
+            )
+            pending = cursor.fetchone()
+            origenes = [[int(desde[0]), int(desde[1])]]
+            if pending:
+                origenes += json.loads(pending[1]) + [[pending[2], pending[3]]]
+            origenes = sorted({tuple(o) for o in origenes} - {tuple(hasta)})
+
+            cursor.execute("SELECT nombre FROM tipo_cultivo WHERE id = ?", (id_tipo_cultivo,))
+            cultivo = cursor.fetchone()
+            cursor.execute("SELECT COUNT(*) FROM hectareas WHERE id_tipo_cultivo = ?", (id_tipo_cultivo,))
+            total = cursor.fetchone()[0]
+            if not origenes or not total or cultivo is None:
+                if pending:
+                    cursor.execute("DELETE FROM recalculo_cosechas WHERE id = ?", (pending[0],))
+                return None
+
+            if pending:
+                cursor.execute("""
+                    UPDATE recalculo_cosechas
+                    SET tipo_de_cultivo = ?, origenes = ?, dias_primera = ?, dias_rutinaria = ?,
+                        ultimo_numero = NULL, total = ?, procesadas = 0
+                    WHERE id = ?
+                """, (cultivo[0], json.dumps(origenes), hasta[0], hasta[1], total, pending[0]))
+                return pending[0]
+            # The name is only kept for progress messages
+            cursor.execute("""
+                INSERT INTO recalculo_cosechas
+                (id_tipo_cultivo, tipo_de_cultivo, origenes, dias_primera, dias_rutinaria, total)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (id_tipo_cultivo, cultivo[0], json.dumps(origenes), hasta[0], hasta[1], total))
+            return cursor.lastrowid
+
+    @staticmethod
+    def get_pending():
+        """Get unfinished jobs as dicts, oldest first."""
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM recalculo_cosechas "
+                "WHERE terminado IS NULL ORDER BY id"
+            )
+            return [dict(zip(_JOB_COLUMNS, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def run_chunk(job_id, chunk_size):
+        """Rewrite the next chunk_size hectareas of a job in one transaction.
+
+        Only rows whose stored dates are exactly the ones computed from one of
+        the job's origin cycles are touched; anything else was entered by hand.
+        The checkpoint advances in the same transaction. Returns the updated
+        job dict with a "terminado" flag, or None if the job is not pending.
+        """
+        with connection() as conn:
+            cursor = conn.cursor()
+            begin_immediate(cursor)
+            cursor.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM recalculo_cosechas "
+                "WHERE id = ? AND terminado IS NULL",
+                (job_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            job = dict(zip(_JOB_COLUMNS, row))
+            tipo = job["id_tipo_cultivo"]
+
+            if job["ultimo_numero"] is None:
+                cursor.execute(
+                    "SELECT numero FROM hectareas WHERE id_tipo_cultivo = ? "
+                    "ORDER BY numero LIMIT ?", (tipo, chunk_size)
+                )
+            else:
+                cursor.execute(
+                    "SELECT numero FROM hectareas WHERE id_tipo_cultivo = ? AND numero > ? "
+                    "ORDER BY numero LIMIT ?", (tipo, job["ultimo_numero"], chunk_size)
+                )
+            numeros = [r[0] for r in cursor.fetchall()]
+
+            actualizadas = 0
+            if numeros:
+                matches, params = [], []
+                for first, routine in json.loads(job["origenes"]):
+                    matches.append(
+                        "(primera_cosecha = date(siembra, ?) AND cosecha_rutinaria = date(siembra, ?))"
+                    )
+                    params += [_offset(first), _offset(first + routine)]
+                cursor.execute(f"""
+                    UPDATE hectareas
+                    SET primera_cosecha = date(siembra, ?), cosecha_rutinaria = date(siembra, ?)
+                    WHERE id_tipo_cultivo = ? AND numero BETWEEN ? AND ?
+                      AND ({' OR '.join(matches)})
+                """, [
+                    _offset(job["dias_primera"]),
+                    _offset(job["dias_primera"] + job["dias_rutinaria"]),
+                    tipo, numeros[0], numeros[-1], *params,
+                ])
+                actualizadas = cursor.rowcount
+
+            terminado = len(numeros) < chunk_size
+            cursor.execute("""
+                UPDATE recalculo_cosechas
+                SET ultimo_numero = ?, procesadas = procesadas + ?, actualizadas = actualizadas + ?,
+                    terminado = CASE WHEN ? THEN CURRENT_TIMESTAMP END
+                WHERE id = ?
+            """, (numeros[-1] if numeros else job["ultimo_numero"], len(numeros),
+                  actualizadas, terminado, job_id))
+            job["ultimo_numero"] = numeros[-1] if numeros else job["ultimo_numero"]
+            job["procesadas"] += len(numeros)
+            job["actualizadas"] += actualizadas
+            job["terminado"] = terminado
+            return job
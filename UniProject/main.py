@@ -3,16 +3,14 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
 from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QTimer
 
 from data.database import initialize_db
 from ui.styles.stylesheet import get_stylesheet
-from ui.screens.login import LoginScreen
-from ui.screens.main import MainScreen
-from ui.screens.hectareas.register import RegistrarScreen, BuscarScreen, GestionarHectareasScreen
-from ui.screens.dashboard import PerfilScreen, InformeScreen, ConsultaScreen
-from ui.screens.admin_catalog import TipoHortalizaManagementScreen, TipoSueloManagementScreen, ClimaManagementScreen
-from ui.screens.admin_management import UserManagementScreen, GestionCultivoScreen
-from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_X, WINDOW_Y, ADMIN_ROLE
+from ui.screens.registry import ScreenRegistry
+from ui.recalculo import RecalculoWorker
+from services.change_service import ChangeService
+from config.settings import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_X, WINDOW_Y, ADMIN_ROLE, CHANGE_POLL_INTERVAL_MS
 
 
 class MainWindow(QMainWindow):
@@ -35,35 +33,58 @@ class MainWindow(QMainWindow):
         # Apply stylesheet
         self.setStyleSheet(get_stylesheet())
         
-        # Initialize screens
+        # Screens are built on first show
         self.screens = self._initialize_screens()
-        self._add_screens_to_stack()
+        
+        # Refresh caches and screens when another instance commits changes
+        self.change_timer = QTimer(self)
+        self.change_timer.timeout.connect(ChangeService.poll)
+        self.change_timer.start(CHANGE_POLL_INTERVAL_MS)
+        
+        # Move stored harvest dates to changed crop cycles in the background,
+        # resuming whatever a previous session left unfinished
+        self.recalculo_worker = None
+        self._recalculo_pendiente = False
+        self.destroyed.connect(ChangeService.subscribe("tipo_cultivo", lambda table: self.start_recalculo()))
+        QTimer.singleShot(0, self.start_recalculo)
         
         # Show login screen
         self.show_screen("login")
     
-    def _initialize_screens(self):
-        """Initialize all screens."""
-        return {
-            "login": LoginScreen(self),
-            "main": MainScreen(self),
-            "registrar": RegistrarScreen(self),
-            "buscar": BuscarScreen(self),
-            "perfil": PerfilScreen(self),
-            "informe": InformeScreen(self),
-            "consulta": ConsultaScreen(self),
-            "gestionar_hectareas": GestionarHectareasScreen(self),
-            "gestion_cultivo": GestionCultivoScreen(self),
-            "usuarios": UserManagementScreen(self),
-            "gestion_hortaliza": TipoHortalizaManagementScreen(self),
-            "gestion_suelo": TipoSueloManagementScreen(self),
-            "gestion_clima": ClimaManagementScreen(self),
-        }
+    def start_recalculo(self):
+        """Run pending harvest recalculations, or queue another run if one is active."""
+        if self.recalculo_worker is not None and self.recalculo_worker.isRunning():
+            self._recalculo_pendiente = True
+            return
+        self._recalculo_pendiente = False
+        self.recalculo_worker = RecalculoWorker(self)
+        self.recalculo_worker.progress.connect(self._mostrar_recalculo)
+        self.recalculo_worker.done.connect(self._recalculo_terminado)
+        self.recalculo_worker.start()
     
-    def _add_screens_to_stack(self):
-        """Add all screens to the stack widget."""
-        for screen in self.screens.values():
-            self.stack.addWidget(screen)
+    def _mostrar_recalculo(self, tipo, procesadas, total):
+        self.statusBar().showMessage(f"Recalculando cosechas de {tipo}: {procesadas}/{total}")
+    
+    def _recalculo_terminado(self, result):
+        if not result["success"]:
+            self.statusBar().showMessage(f"Error al recalcular cosechas: {result['error']}", 10000)
+        elif result["actualizadas"]:
+            self.statusBar().showMessage(f"Cosechas recalculadas en {result['actualizadas']} hectáreas.", 5000)
+        else:
+            self.statusBar().clearMessage()
+        if self._recalculo_pendiente:
+            self.start_recalculo()
+    
+    def closeEvent(self, event):
+        """Stop the recalculation thread; pending chunks resume on next start."""
+        if self.recalculo_worker is not None:
+            self.recalculo_worker.cancel()
+            self.recalculo_worker.wait()
+        super().closeEvent(event)
+    
+    def _initialize_screens(self):
+        """Create the registry that builds screens on demand."""
+        return ScreenRegistry(self, self.stack)
     
     def show_screen(self, name):
         """Show a screen by name."""
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-import sqlite3
+
+from data.repositories.hectarea_repo import HectareaRepository
+from services.hectarea_service import HectareaService
 
 
 class Hectarea:
@@ -41,33 +43,29 @@ class Hectarea:
         except ValueError:
             self.temperatura = None
 
+    def to_dict(self):
+        return {
+            "numero": self.numero,
+            "tipo_de_cultivo": self.tipo_de_cultivo,
+            "siembra": self.siembra.strftime("%Y-%m-%d"),
+            "primera_cosecha": self.primeracosecha.strftime("%Y-%m-%d"),
+            "cosecha_rutinaria": self.cosecha_rutinaria,
+            "tipo_suelo": self.tipo_suelo,
+            "temperatura": self.temperatura,
+        }
+
+    # hectareas guarda cultivo y suelo como ids de catálogo; el repositorio los resuelve
     def guardar_en_bd(self):
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO hectareas (numero, tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria, tipo_suelo, temperatura) 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (self.numero, self.tipo_de_cultivo, self.siembra.strftime("%Y-%m-%d"),
-              self.primeracosecha.strftime("%Y-%m-%d"), self.cosecha_rutinaria, self.tipo_suelo, self.temperatura))
-        conn.commit()
-        conn.close()
+        HectareaRepository.create(self)
 
     @staticmethod
     def eliminar(numero):
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM hectareas WHERE numero = ?", (numero,))
-        conn.commit()
-        conn.close()
+        HectareaRepository.delete(numero)
 
     @staticmethod
     def actualizar(numero, tipo, siembra, primera, rutinaria, tipo_suelo, temperatura):
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE hectareas 
-            SET tipo_de_cultivo = ?, siembra = ?, primera_cosecha = ?, cosecha_rutinaria = ?, tipo_suelo = ?, temperatura = ?
-            WHERE numero = ?
-        """, (tipo.lower(), siembra, primera, rutinaria, tipo_suelo, temperatura, numero))
-        conn.commit()
-        conn.close()
+        # El servicio valida fechas y temperatura antes de guardar
+        resultado = HectareaService.update_hectarea(numero, tipo, siembra, primera, rutinaria,
+                                                    tipo_suelo, temperatura)
+        if not resultado["success"]:
+            raise ValueError(resultado["error"])
@@ -10,7 +10,12 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 from models import Hectarea
-from db import obtener_personas, obtener_tipo_hortaliza, obtener_tipo_suelo, obtener_climas
+from services.auth_service import AuthService
+from services.catalogo_service import CatalogoService
+from services.coincidencia_service import CoincidenciaService
+from services.hectarea_service import HectareaService
+from services.report_service import ReportService
+from ui.widgets.report_view import ReportView
 
 
 # LoginScreen: Inicio de sesión
@@ -38,13 +43,8 @@ class LoginScreen(QWidget):
     
     def refresh_users(self):
         self.users_list.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT username FROM usuarios")
-        users = cursor.fetchall()
-        conn.close()
-        for u in users:
-            self.users_list.addItem(u[0])
+        for u in AuthService.get_all_users():
+            self.users_list.addItem(u[1])
     
     def do_login(self, item):
         username = item.text()
@@ -53,15 +53,11 @@ class LoginScreen(QWidget):
                                               QLineEdit.Password)
         if not ok:
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT password, role, email FROM usuarios WHERE username = ?", (username,))
-        result = cursor.fetchone()
-        conn.close()
-        if result and password == result[0]:
+        result = AuthService.validate_credentials(username, password)
+        if result["valid"]:
             self.controller.current_user = username
-            self.controller.user_role = result[1]
-            self.controller.current_email = result[2]
+            self.controller.user_role = result["role"]
+            self.controller.current_email = result["email"]
             self.controller.show_screen("main")
         else:
             QMessageBox.critical(self, "Error", "Contraseña incorrecta.")
@@ -70,14 +66,10 @@ class LoginScreen(QWidget):
         email, ok = QInputDialog.getText(self, "Recuperar Contraseña", "Ingrese su correo electrónico:")
         if not ok or not email:
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT username, password FROM usuarios WHERE email = ?", (email,))
-        result = cursor.fetchone()
-        conn.close()
-        if result:
+        result = AuthService.recover_password_by_email(email)
+        if result["found"]:
             QMessageBox.information(self, "Recuperación", 
-                                    f"Usuario: {result[0]}\nContraseña: {result[1]}\n(Se simula envío de correo)")
+                                    f"Usuario: {result['username']}\nContraseña: {result['password']}\n(Se simula envío de correo)")
         else:
             QMessageBox.critical(self, "Error", "No se encontró un usuario con ese correo.")
 
@@ -142,19 +134,16 @@ class MainScreen(QWidget):
     
     def show_hectareas(self):
         self.content_area.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM hectareas")
-        hectareas = cursor.fetchall()
-        conn.close()
-        if hectareas:
-            texto = ""
-            for h in hectareas:
-                texto += (f"Hectárea {h[1]}:\n  Tipo: {h[2]}\n  Siembra: {h[3]}\n  1ra Cosecha: {h[4]}\n"
-                          f"  Cosecha Rutinaria: {h[5]}\n  Tipo de Suelo: {h[6]}\n  Temperatura: {h[7]}\n\n")
-            self.content_area.setPlainText(texto)
-        else:
-            self.content_area.setPlainText("No hay hectáreas registradas.")
+        hectareas = HectareaService.iter_hectareas(columns=(
+            "numero", "tipo_de_cultivo", "siembra", "primera_cosecha",
+            "cosecha_rutinaria", "tipo_suelo", "temperatura",
+        ))
+        texto = "".join(
+            f"Hectárea {h[0]}:\n  Tipo: {h[1]}\n  Siembra: {h[2]}\n  1ra Cosecha: {h[3]}\n"
+            f"  Cosecha Rutinaria: {h[4]}\n  Tipo de Suelo: {h[5]}\n  Temperatura: {h[6]}\n\n"
+            for h in hectareas
+        )
+        self.content_area.setPlainText(texto or "No hay hectáreas registradas.")
 
 
 # RegistrarScreen: Registro de Hectáreas (sin campos para fechas de cosecha)
@@ -192,20 +181,12 @@ class RegistrarScreen(QWidget):
     
     def cargar_opciones(self):
         self.combo_crop.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT nombre FROM tipo_cultivo")
-        rows = cursor.fetchall()
-        conn.close()
-        crop_types = [r[0] for r in rows] if rows else ["limones", "maíz", "trigo", "tomate"]
+        rows = CatalogoService.get_all_tipo_cultivo()
+        crop_types = [r[1] for r in rows] if rows else ["limones", "maíz", "trigo", "tomate"]
         self.combo_crop.addItems(crop_types)
         self.combo_suelo.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT nombre FROM tipo_suelo")
-        suelos = cursor.fetchall()
-        conn.close()
-        suelo_types = [s[0] for s in suelos] if suelos else ["Sin suelo registrado"]
+        suelos = CatalogoService.get_all_tipo_suelo()
+        suelo_types = [s[1] for s in suelos] if suelos else ["Sin suelo registrado"]
         self.combo_suelo.addItems(suelo_types)
     
     def registrar_hectarea(self):
@@ -216,19 +197,13 @@ class RegistrarScreen(QWidget):
             return
         suelo = self.combo_suelo.currentText()
         temperatura = self.entry_temp.text().strip()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT MAX(numero) FROM hectareas")
-        max_num = cursor.fetchone()[0]
-        conn.close()
-        numero = 1 if max_num is None else max_num + 1
-        try:
-            hectarea = Hectarea(numero, crop, siembra, None, None, suelo, temperatura)
-            hectarea.guardar_en_bd()
+        numero = HectareaService.get_next_numero()
+        result = HectareaService.create_hectarea(numero, crop, siembra, suelo, temperatura)
+        if result["success"]:
             QMessageBox.information(self, "Registro", "Hectárea registrada con éxito.")
             self.controller.show_screen("main")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        else:
+            QMessageBox.critical(self, "Error", result["error"])
 
 
 # BuscarScreen: Búsqueda de Hectáreas
@@ -258,15 +233,11 @@ class BuscarScreen(QWidget):
     
     def buscar_hectarea(self):
         num_text = self.entry_numero.text().strip()
-        if not num_text.isdigit():
+        if not (num_text.isascii() and num_text.isdigit()):
             self.result_area.setPlainText("Ingrese un número válido.")
             return
         num = int(num_text)
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM hectareas WHERE numero = ?", (num,))
-        hectarea = cursor.fetchone()
-        conn.close()
+        hectarea = HectareaService.get_hectarea(num)
         self.result_area.clear()
         if hectarea:
             texto = (f"Hectárea {hectarea[1]}:\n  Tipo: {hectarea[2]}\n  Siembra: {hectarea[3]}\n"
@@ -314,37 +285,23 @@ class InformeScreen(QWidget):
         title = QLabel("Informe de Gestión Cultivo")
         title.setFont(QFont("Helvetica", 18, QFont.Bold))
         layout.addWidget(title, alignment=Qt.AlignCenter)
-        self.informe_area = QTextEdit()
-        self.informe_area.setReadOnly(True)
+        self.informe_area = ReportView()
         layout.addWidget(self.informe_area)
         btn_volver = QPushButton("Volver")
-        btn_volver.clicked.connect(lambda: self.controller.show_screen("main"))
+        btn_volver.clicked.connect(self.volver)
         layout.addWidget(btn_volver, alignment=Qt.AlignCenter)
         self.setLayout(layout)
     
     def cargar_informe(self):
-        self.informe_area.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT gc.codigo, u.username, th.nombre, ts.nombre, c.nombre, gc.video, gc.observaciones
-            FROM gestion_cultivo gc
-            JOIN usuarios u ON gc.id_persona = u.id
-            JOIN tipo_hortaliza th ON gc.id_tipo_hortaliza = th.codigo
-            JOIN tipo_suelo ts ON gc.id_tipo_suelo = ts.codigo
-            JOIN clima c ON gc.id_clima = c.codigo
-        """)
-        registros = cursor.fetchall()
-        conn.close()
-        if registros:
-            texto = ""
-            for r in registros:
-                texto += (f"Código: {r[0]}\nUsuario: {r[1]}\nTipo Hortaliza: {r[2]}\n"
-                          f"Tipo Suelo: {r[3]}\nClima: {r[4]}\nVideo: {r[5]}\nObservaciones: {r[6]}\n"
-                          + "-" * 40 + "\n")
-            self.informe_area.setPlainText(texto)
-        else:
-            self.informe_area.setPlainText("No hay registros de gestión cultivo.")
+        self.informe_area.load(
+            ReportService.iter_gestion_report,
+            ReportService.count_gestion_report,
+            empty_text="No hay registros de gestión cultivo."
+        )
+    
+    def volver(self):
+        self.informe_area.cancel()
+        self.controller.show_screen("main")
 
 
 # ConsultaScreen: Consulta de Tipos de Cultivo (Hortalizas)
@@ -377,11 +334,7 @@ class ConsultaScreen(QWidget):
         if not nombre:
             QMessageBox.critical(self, "Error", "Ingrese un nombre para consultar.")
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_hortaliza WHERE nombre LIKE ?", ('%' + nombre + '%',))
-        registros = cursor.fetchall()
-        conn.close()
+        registros = CatalogoService.search_hortaliza(nombre)
         self.result_area.clear()
         if registros:
             texto = ""
@@ -425,11 +378,10 @@ class GestionarHectareasScreen(QWidget):
     
     def refresh_hectareas(self):
         self.hectareas_list.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT numero, tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria, tipo_suelo, temperatura FROM hectareas")
-        hectareas = cursor.fetchall()
-        conn.close()
+        hectareas = HectareaService.iter_hectareas(columns=(
+            "numero", "tipo_de_cultivo", "siembra", "primera_cosecha",
+            "cosecha_rutinaria", "tipo_suelo", "temperatura",
+        ))
         for h in hectareas:
             self.hectareas_list.addItem(
                 f"N° {h[0]}: {h[1]} | Siembra: {h[2]} | 1ra: {h[3]} | Rutinaria: {h[4]} | Suelo: {h[5]} | Temp: {h[6]}"
@@ -455,32 +407,63 @@ class GestionarHectareasScreen(QWidget):
             return
         line = selected.text()
         numero = int(line.split(":")[0].replace("N°", "").strip())
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT tipo_de_cultivo, siembra, primera_cosecha, cosecha_rutinaria, tipo_suelo, temperatura 
-            FROM hectareas WHERE numero = ?
-        """, (numero,))
-        data = cursor.fetchone()
-        conn.close()
+        hectarea = HectareaService.get_hectarea(numero)
+        data = tuple(hectarea)[2:] if hectarea else None
         if not data:
             QMessageBox.critical(self, "Error", "No se encontraron datos para la hectárea seleccionada.")
             return
-        new_tipo, ok1 = QInputDialog.getText(self, "Editar", "Nuevo tipo de cultivo:", text=data[0])
+        new_tipo, ok1 = QInputDialog.getText(self, "Editar", "Nuevo tipo de cultivo:", text=data[0] or "")
         new_siembra, ok2 = QInputDialog.getText(self, "Editar", "Nueva fecha de siembra (YYYY-MM-DD):", text=data[1])
         new_primera, ok3 = QInputDialog.getText(self, "Editar", "Nueva fecha de primera cosecha (YYYY-MM-DD):", text=data[2])
         new_rutinaria, ok4 = QInputDialog.getText(self, "Editar", "Nueva cosecha rutinaria:", text=data[3])
-        new_suelo, ok5 = QInputDialog.getText(self, "Editar", "Nuevo tipo de suelo:", text=data[4])
+        new_suelo, ok5 = QInputDialog.getText(self, "Editar", "Nuevo tipo de suelo:", text=data[4] or "")
         new_temp, ok6 = QInputDialog.getText(self, "Editar", "Nueva temperatura (°C):", text=str(data[5]) if data[5] is not None else "")
         if not (ok1 and ok2 and ok3 and ok4 and ok5):
             QMessageBox.critical(self, "Error", "Edición cancelada o campos incompletos.")
             return
+        new_tipo, ok1 = self.confirmar_nombre("tipo_cultivo", "tipo de cultivo", new_tipo)
+        new_suelo, ok5 = self.confirmar_nombre("tipo_suelo", "tipo de suelo", new_suelo) if ok1 else (new_suelo, False)
+        if not (ok1 and ok5):
+            QMessageBox.critical(self, "Error", "Edición cancelada.")
+            return
         try:
             Hectarea.actualizar(numero, new_tipo, new_siembra, new_primera, new_rutinaria, new_suelo, new_temp)
             QMessageBox.information(self, "Éxito", "Hectárea actualizada.")
             self.refresh_hectareas()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
+    
+    def confirmar_nombre(self, table, etiqueta, nombre):
+        """Ask which known name was meant when nombre is not one; returns (nombre, ok).
+
+        Hectareas only take names in the catalog, so keeping a new name (or a
+        built-in one the catalog lacks) adds it there.
+        """
+        nombre = nombre.strip()
+        if not nombre:
+            return nombre, True
+        conocido = CoincidenciaService.canonical(table, nombre)
+        if conocido is None:
+            sugerencias = CoincidenciaService.suggest(table, nombre)
+            if sugerencias:
+                opciones = sugerencias + [f"Mantener \"{nombre}\" (nuevo)"]
+                eleccion, ok = QInputDialog.getItem(
+                    self, "Confirmar", f"No existe el {etiqueta} \"{nombre}\". ¿Quiso decir?", opciones, 0, False
+                )
+                if not ok:
+                    return nombre, False
+                conocido = nombre if eleccion == opciones[-1] else eleccion
+            elif QMessageBox.question(self, "Confirmar", f"No existe el {etiqueta} \"{nombre}\". ¿Agregarlo?",
+                                      QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+                conocido = nombre
+            else:
+                return nombre, False
+        try:
+            CatalogoService.add_nombre(table, conocido)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Error", f"No se pudo agregar el {etiqueta}: {e}")
+            return conocido, False
+        return conocido, True
 
 
 # GestionCultivoScreen: Gestión de Cultivos (Admin)
@@ -513,12 +496,7 @@ class GestionCultivoScreen(QWidget):
     
     def cargar_gestiones(self):
         self.gestion_list.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones FROM gestion_cultivo")
-        gestiones = cursor.fetchall()
-        conn.close()
-        for g in gestiones:
+        for g in CatalogoService.get_gestion_cultivo_raw():
             self.gestion_list.addItem(
                 f"Código: {g[0]} | Persona ID: {g[1]} | Hortaliza ID: {g[2]} | Suelo ID: {g[3]} | Clima ID: {g[4]} | Video: {g[5]} | Obs: {g[6]}"
             )
@@ -527,7 +505,7 @@ class GestionCultivoScreen(QWidget):
         dialog = QDialog(self)
         dialog.setWindowTitle("Registrar Gestión Cultivo")
         d_layout = QFormLayout(dialog)
-        personas = obtener_personas()
+        personas = AuthService.get_all_users()
         if not personas:
             QMessageBox.critical(dialog, "Error", "No hay usuarios registrados.")
             return
@@ -535,7 +513,7 @@ class GestionCultivoScreen(QWidget):
         combo_persona = QComboBox()
         combo_persona.addItems(list(personas_dict.keys()))
         d_layout.addRow("Seleccione Persona:", combo_persona)
-        hort_data = obtener_tipo_hortaliza()
+        hort_data = CatalogoService.get_all_tipo_hortaliza()
         if not hort_data:
             QMessageBox.critical(dialog, "Error", "No hay tipos de hortaliza registrados.")
             return
@@ -543,7 +521,7 @@ class GestionCultivoScreen(QWidget):
         combo_hortaliza = QComboBox()
         combo_hortaliza.addItems(list(hort_dict.keys()))
         d_layout.addRow("Seleccione Tipo de Hortaliza:", combo_hortaliza)
-        suelo_data = obtener_tipo_suelo()
+        suelo_data = CatalogoService.get_all_tipo_suelo()
         if not suelo_data:
             QMessageBox.critical(dialog, "Error", "No hay tipos de suelo registrados.")
             return
@@ -551,7 +529,7 @@ class GestionCultivoScreen(QWidget):
         combo_suelo = QComboBox()
         combo_suelo.addItems(list(suelo_dict.keys()))
         d_layout.addRow("Seleccione Tipo de Suelo:", combo_suelo)
-        clima_data = obtener_climas()
+        clima_data = CatalogoService.get_all_clima()
         if not clima_data:
             QMessageBox.critical(dialog, "Error", "No hay climas registrados.")
             return
@@ -578,14 +556,7 @@ class GestionCultivoScreen(QWidget):
                 return
             video = entry_video.text().strip()
             observaciones = entry_obs.text().strip()
-            conn = sqlite3.connect("cultivos.db")
-            cur = conn.cursor()
-            cur.execute("""
-                INSERT INTO gestion_cultivo (id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones))
-            conn.commit()
-            conn.close()
+            CatalogoService.create_gestion_cultivo(id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones)
             QMessageBox.information(self, "Éxito", "Gestión cultivo registrada.")
             self.cargar_gestiones()
     
@@ -596,21 +567,14 @@ class GestionCultivoScreen(QWidget):
             return
         line = selected.text()
         codigo = int(line.split("|")[0].split(":")[1].strip())
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id_persona, id_tipo_hortaliza, id_tipo_suelo, id_clima, video, observaciones 
-            FROM gestion_cultivo WHERE codigo = ?
-        """, (codigo,))
-        data = cursor.fetchone()
-        conn.close()
+        data = CatalogoService.get_gestion_by_id(codigo)
         if not data:
             QMessageBox.critical(self, "Error", "No se encontró la gestión seleccionada.")
             return
         dialog = QDialog(self)
         dialog.setWindowTitle("Editar Gestión Cultivo")
         d_layout = QFormLayout(dialog)
-        personas = obtener_personas()
+        personas = AuthService.get_all_users()
         personas_dict = {f"{p[0]}: {p[1]}": p[0] for p in personas}
         combo_persona = QComboBox()
         combo_persona.addItems(list(personas_dict.keys()))
@@ -620,7 +584,7 @@ class GestionCultivoScreen(QWidget):
                 combo_persona.setCurrentIndex(index)
                 break
         d_layout.addRow("Seleccione Persona:", combo_persona)
-        hort_data = obtener_tipo_hortaliza()
+        hort_data = CatalogoService.get_all_tipo_hortaliza()
         hort_dict = {f"{h[0]}: {h[1]}": h[0] for h in hort_data}
         combo_hortaliza = QComboBox()
         combo_hortaliza.addItems(list(hort_dict.keys()))
@@ -630,7 +594,7 @@ class GestionCultivoScreen(QWidget):
                 combo_hortaliza.setCurrentIndex(index)
                 break
         d_layout.addRow("Seleccione Tipo de Hortaliza:", combo_hortaliza)
-        suelo_data = obtener_tipo_suelo()
+        suelo_data = CatalogoService.get_all_tipo_suelo()
         suelo_dict = {f"{s[0]}: {s[1]}": s[0] for s in suelo_data}
         combo_suelo = QComboBox()
         combo_suelo.addItems(list(suelo_dict.keys()))
@@ -640,7 +604,7 @@ class GestionCultivoScreen(QWidget):
                 combo_suelo.setCurrentIndex(index)
                 break
         d_layout.addRow("Seleccione Tipo de Suelo:", combo_suelo)
-        clima_data = obtener_climas()
+        clima_data = CatalogoService.get_all_clima()
         clima_dict = {f"{c[0]}: {c[1]}": c[0] for c in clima_data}
         combo_clima = QComboBox()
         combo_clima.addItems(list(clima_dict.keys()))
@@ -671,15 +635,7 @@ class GestionCultivoScreen(QWidget):
                 return
             video = entry_video.text().strip()
             observaciones = entry_obs.text().strip()
-            conn = sqlite3.connect("cultivos.db")
-            cur = conn.cursor()
-            cur.execute("""
-                UPDATE gestion_cultivo
-                SET id_persona = ?, id_tipo_hortaliza = ?, id_tipo_suelo = ?, id_clima = ?, video = ?, observaciones = ?
-                WHERE codigo = ?
-            """, (id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones, codigo))
-            conn.commit()
-            conn.close()
+            CatalogoService.update_gestion_cultivo(codigo, id_persona, id_hortaliza, id_suelo, id_clima, video, observaciones)
             QMessageBox.information(self, "Éxito", "Gestión cultivo actualizada.")
             self.cargar_gestiones()
     
@@ -700,11 +656,7 @@ class GestionCultivoScreen(QWidget):
         if QMessageBox.question(self, "Confirmar",
                                 f"¿Está seguro de eliminar la gestión con código {codigo}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM gestion_cultivo WHERE codigo = ?", (codigo,))
-            conn.commit()
-            conn.close()
+            CatalogoService.delete_gestion_cultivo(codigo)
             QMessageBox.information(self, "Éxito", "Gestión cultivo eliminada.")
             self.cargar_gestiones()
 
@@ -772,12 +724,7 @@ class TipoHortalizaManagementScreen(QWidget):
     
     def cargar_hortalizas(self):
         self.list_hortalizas.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_hortaliza")
-        rows = cursor.fetchall()
-        conn.close()
-        for r in rows:
+        for r in CatalogoService.get_tipo_hortaliza_full():
             self.list_hortalizas.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]}")
     
     def crear_actualizar_hortaliza(self):
@@ -788,31 +735,19 @@ class TipoHortalizaManagementScreen(QWidget):
             QMessageBox.critical(self, "Error", "El nombre es obligatorio.")
             return
         selected = self.list_hortalizas.currentItem()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
         if selected:
             codigo = selected.text().split("|")[0].strip()
             try:
-                cursor.execute("""
-                    UPDATE tipo_hortaliza
-                    SET nombre = ?, descripcion = ?, imagen = ?
-                    WHERE codigo = ?
-                """, (nombre, descripcion, imagen, codigo))
-                conn.commit()
+                CatalogoService.update_hortaliza(codigo, nombre, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Tipo de hortaliza actualizado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe una hortaliza con ese nombre.")
         else:
             try:
-                cursor.execute("""
-                    INSERT INTO tipo_hortaliza (nombre, descripcion, imagen)
-                    VALUES (?, ?, ?)
-                """, (nombre, descripcion, imagen))
-                conn.commit()
+                CatalogoService.create_hortaliza(nombre, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Nuevo tipo de hortaliza creado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe una hortaliza con ese nombre.")
-        conn.close()
         self.cargar_hortalizas()
         self.limpiar_campos()
     
@@ -824,11 +759,7 @@ class TipoHortalizaManagementScreen(QWidget):
         codigo = selected.text().split("|")[0].strip()
         if QMessageBox.question(self, "Confirmar", f"¿Desea eliminar el código {codigo}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tipo_hortaliza WHERE codigo = ?", (codigo,))
-            conn.commit()
-            conn.close()
+            CatalogoService.delete_hortaliza(codigo)
             QMessageBox.information(self, "Éxito", "Hortaliza eliminada.")
             self.cargar_hortalizas()
             self.limpiar_campos()
@@ -892,12 +823,7 @@ class TipoSueloManagementScreen(QWidget):
     
     def cargar_suelos(self):
         self.list_suelos.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, descripcion, imagen FROM tipo_suelo")
-        rows = cursor.fetchall()
-        conn.close()
-        for r in rows:
+        for r in CatalogoService.get_tipo_suelo_full():
             self.list_suelos.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]}")
     
     def crear_actualizar_suelo(self):
@@ -908,31 +834,19 @@ class TipoSueloManagementScreen(QWidget):
             QMessageBox.critical(self, "Error", "El nombre es obligatorio.")
             return
         selected = self.list_suelos.currentItem()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
         if selected:
             codigo = selected.text().split("|")[0].strip()
             try:
-                cursor.execute("""
-                    UPDATE tipo_suelo
-                    SET nombre = ?, descripcion = ?, imagen = ?
-                    WHERE codigo = ?
-                """, (nombre, descripcion, imagen, codigo))
-                conn.commit()
+                CatalogoService.update_suelo(codigo, nombre, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Tipo de suelo actualizado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un tipo de suelo con ese nombre.")
         else:
             try:
-                cursor.execute("""
-                    INSERT INTO tipo_suelo (nombre, descripcion, imagen)
-                    VALUES (?, ?, ?)
-                """, (nombre, descripcion, imagen))
-                conn.commit()
+                CatalogoService.create_suelo(nombre, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Nuevo tipo de suelo creado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un tipo de suelo con ese nombre.")
-        conn.close()
         self.cargar_suelos()
         self.limpiar_campos()
     
@@ -944,11 +858,11 @@ class TipoSueloManagementScreen(QWidget):
         codigo = selected.text().split("|")[0].strip()
         if QMessageBox.question(self, "Confirmar", f"¿Desea eliminar el código {codigo}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tipo_suelo WHERE codigo = ?", (codigo,))
-            conn.commit()
-            conn.close()
+            try:
+                CatalogoService.delete_suelo(codigo)
+            except sqlite3.IntegrityError as e:
+                QMessageBox.critical(self, "Error", str(e))
+                return
             QMessageBox.information(self, "Éxito", "Tipo de suelo eliminado.")
             self.cargar_suelos()
             self.limpiar_campos()
@@ -1010,12 +924,7 @@ class ClimaManagementScreen(QWidget):
     
     def cargar_climas(self):
         self.list_climas.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT codigo, nombre, grados_temperatura, descripcion, imagen FROM clima")
-        rows = cursor.fetchall()
-        conn.close()
-        for r in rows:
+        for r in CatalogoService.get_clima_full():
             self.list_climas.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]} | {r[4]}")
     
     def crear_actualizar_clima(self):
@@ -1032,31 +941,19 @@ class ClimaManagementScreen(QWidget):
             QMessageBox.critical(self, "Error", "Ingrese un valor numérico en grados de temperatura.")
             return
         selected = self.list_climas.currentItem()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
         if selected:
             codigo = selected.text().split("|")[0].strip()
             try:
-                cursor.execute("""
-                    UPDATE clima
-                    SET nombre = ?, grados_temperatura = ?, descripcion = ?, imagen = ?
-                    WHERE codigo = ?
-                """, (nombre, grados, descripcion, imagen, codigo))
-                conn.commit()
+                CatalogoService.update_clima(codigo, nombre, grados, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Clima actualizado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un clima con ese nombre.")
         else:
             try:
-                cursor.execute("""
-                    INSERT INTO clima (nombre, grados_temperatura, descripcion, imagen)
-                    VALUES (?, ?, ?, ?)
-                """, (nombre, grados, descripcion, imagen))
-                conn.commit()
+                CatalogoService.create_clima(nombre, grados, descripcion, imagen)
                 QMessageBox.information(self, "Éxito", "Nuevo clima creado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un clima con ese nombre.")
-        conn.close()
         self.cargar_climas()
         self.limpiar_campos()
     
@@ -1068,11 +965,7 @@ class ClimaManagementScreen(QWidget):
         codigo = selected.text().split("|")[0].strip()
         if QMessageBox.question(self, "Confirmar", f"¿Desea eliminar el código {codigo}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM clima WHERE codigo = ?", (codigo,))
-            conn.commit()
-            conn.close()
+            CatalogoService.delete_clima(codigo)
             QMessageBox.information(self, "Éxito", "Clima eliminado.")
             self.cargar_climas()
             self.limpiar_campos()
@@ -1143,11 +1036,7 @@ class TipoCultivoManagementScreen(QWidget):
     
     def cargar_cultivos(self):
         self.list_cultivos.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, nombre, meses_primera, meses_rutinaria FROM tipo_cultivo")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = CatalogoService.get_tipo_cultivo_full()
         for r in rows:
             self.list_cultivos.addItem(f"{r[0]} | {r[1]} | 1ra: {r[2]} meses | Rutinaria: {r[3]} meses")
     
@@ -1159,31 +1048,20 @@ class TipoCultivoManagementScreen(QWidget):
             QMessageBox.critical(self, "Error", "El nombre es obligatorio.")
             return
         selected = self.list_cultivos.currentItem()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
+        # Through the service so cached cycles reload and stored harvests are recalculated
         if selected:
             cultivo_id = selected.text().split("|")[0].strip()
             try:
-                cursor.execute("""
-                    UPDATE tipo_cultivo
-                    SET nombre = ?, meses_primera = ?, meses_rutinaria = ?
-                    WHERE id = ?
-                """, (nombre, meses_primera, meses_rutinaria, cultivo_id))
-                conn.commit()
+                CatalogoService.update_tipo_cultivo(cultivo_id, nombre, meses_primera, meses_rutinaria)
                 QMessageBox.information(self, "Éxito", "Tipo de cultivo actualizado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un tipo de cultivo con ese nombre.")
         else:
             try:
-                cursor.execute("""
-                    INSERT INTO tipo_cultivo (nombre, meses_primera, meses_rutinaria)
-                    VALUES (?, ?, ?)
-                """, (nombre, meses_primera, meses_rutinaria))
-                conn.commit()
+                CatalogoService.create_tipo_cultivo(nombre, meses_primera, meses_rutinaria)
                 QMessageBox.information(self, "Éxito", "Nuevo tipo de cultivo creado.")
             except sqlite3.IntegrityError:
                 QMessageBox.critical(self, "Error", "Ya existe un tipo de cultivo con ese nombre.")
-        conn.close()
         self.cargar_cultivos()
         self.limpiar_campos()
     
@@ -1195,11 +1073,11 @@ class TipoCultivoManagementScreen(QWidget):
         cultivo_id = selected.text().split("|")[0].strip()
         if QMessageBox.question(self, "Confirmar", f"¿Desea eliminar el tipo de cultivo con ID {cultivo_id}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tipo_cultivo WHERE id = ?", (cultivo_id,))
-            conn.commit()
-            conn.close()
+            try:
+                CatalogoService.delete_tipo_cultivo(cultivo_id)
+            except sqlite3.IntegrityError as e:
+                QMessageBox.critical(self, "Error", str(e))
+                return
             QMessageBox.information(self, "Éxito", "Tipo de cultivo eliminado.")
             self.cargar_cultivos()
             self.limpiar_campos()
@@ -1265,12 +1143,7 @@ class UserManagementScreen(QWidget):
     
     def refresh_user_list(self):
         self.user_list.clear()
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT username, email FROM usuarios")
-        users = cursor.fetchall()
-        conn.close()
-        for user in users:
+        for user in AuthService.get_all_users_details():
             self.user_list.addItem(f"{user[0]} - {user[1] if user[1] else ''}")
     
     def create_user(self):
@@ -1280,20 +1153,15 @@ class UserManagementScreen(QWidget):
         if not username or not password or not email:
             QMessageBox.critical(self, "Error", "Todos los campos son requeridos para crear un usuario.")
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        try:
-            cursor.execute("INSERT INTO usuarios (username, password, role, email) VALUES (?, ?, 'usuario', ?)",
-                           (username, password, email))
-            conn.commit()
+        result = AuthService.create_user(username, password, email)
+        if result["success"]:
             QMessageBox.information(self, "Éxito", "Usuario creado correctamente.")
             self.refresh_user_list()
             self.new_username.clear()
             self.new_password.clear()
             self.new_email.clear()
-        except sqlite3.IntegrityError:
-            QMessageBox.critical(self, "Error", "El usuario ya existe.")
-        conn.close()
+        else:
+            QMessageBox.critical(self, "Error", f"No se pudo crear el usuario: {result['error']}")
     
     def delete_user(self):
         selected = self.user_list.currentItem()
@@ -1305,11 +1173,10 @@ class UserManagementScreen(QWidget):
         if username == "admin":
             QMessageBox.critical(self, "Error", "No se puede eliminar el usuario admin.")
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM usuarios WHERE username = ?", (username,))
-        conn.commit()
-        conn.close()
+        result = AuthService.delete_user(username)
+        if not result["success"]:
+            QMessageBox.critical(self, "Error", result["error"])
+            return
         QMessageBox.information(self, "Éxito", "Usuario eliminado.")
         self.refresh_user_list()
     
@@ -1323,34 +1190,22 @@ class UserManagementScreen(QWidget):
         if username == "admin":
             QMessageBox.critical(self, "Error", "No se puede editar el usuario admin.")
             return
-        conn = sqlite3.connect("cultivos.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT username, password, email FROM usuarios WHERE username = ?", (username,))
-        data = cursor.fetchone()
-        conn.close()
+        data = AuthService.get_user(username)
         if not data:
             QMessageBox.critical(self, "Error", "No se encontró información del usuario.")
             return
-        new_username, ok1 = QInputDialog.getText(self, "Editar Usuario", "Nuevo username:", text=data[0])
-        new_password, ok2 = QInputDialog.getText(self, "Editar Usuario", "Nueva contraseña:", text=data[1], echo=QLineEdit.Password)
-        new_email, ok3 = QInputDialog.getText(self, "Editar Usuario", "Nuevo email:", text=data[2])
+        new_username, ok1 = QInputDialog.getText(self, "Editar Usuario", "Nuevo username:", text=username)
+        new_password, ok2 = QInputDialog.getText(self, "Editar Usuario", "Nueva contraseña:", text=data[0], echo=QLineEdit.Password)
+        new_email, ok3 = QInputDialog.getText(self, "Editar Usuario", "Nuevo email:", text=data[2] or "")
         if not (ok1 and ok2 and ok3 and new_username and new_password and new_email):
             QMessageBox.critical(self, "Error", "Todos los campos son requeridos para editar el usuario.")
             return
-        try:
-            conn = sqlite3.connect("cultivos.db")
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE usuarios
-                SET username = ?, password = ?, email = ?
-                WHERE username = ?
-            """, (new_username, new_password, new_email, username))
-            conn.commit()
-            conn.close()
+        result = AuthService.update_user(username, new_username, new_password, new_email)
+        if result["success"]:
             QMessageBox.information(self, "Éxito", "Usuario actualizado correctamente.")
             self.refresh_user_list()
-        except sqlite3.IntegrityError:
-            QMessageBox.critical(self, "Error", "El nuevo username ya existe.")
+        else:
+            QMessageBox.critical(self, "Error", f"No se pudo actualizar el usuario: {result['error']}")
 
 
 # ===========================
@@ -1,6 +1,13 @@
 """Authentication service - User login and validation."""
 
+from data.change_tracker import tracker
 from data.repositories.usuario_repo import UsuarioRepository
+from services.cache import CatalogCache
+
+
+# (id, username) of every user, shared by the login list and admin dialogs
+_users_cache = CatalogCache("usuarios", UsuarioRepository.get_all)
+tracker.subscribe("usuarios", lambda table: _users_cache.invalidate())
 
 
 class AuthService:
@@ -21,7 +28,12 @@ class AuthService:
     @staticmethod
     def get_all_users():
         """Get all registered users."""
-        return UsuarioRepository.get_all()
+        return _users_cache.rows()
+
+    @staticmethod
+    def get_user(username):
+        """Get (password, role, email) of a user, or None if it does not exist."""
+        return UsuarioRepository.get_by_username(username)
 
     @staticmethod
     def recover_password_by_email(email):
@@ -36,6 +48,7 @@ class AuthService:
         """Create new user."""
         try:
             UsuarioRepository.create(username, password, email)
+            _users_cache.invalidate()
             return {"success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -47,6 +60,7 @@ class AuthService:
             return {"success": False, "error": "Cannot delete admin user"}
         try:
             UsuarioRepository.delete(username)
+            _users_cache.invalidate()
             return {"success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -58,10 +72,16 @@ class AuthService:
             return {"success": False, "error": "Cannot modify admin user"}
         try:
             UsuarioRepository.update(username, new_username, password, email)
+            _users_cache.invalidate()
             return {"success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def cache_stats():
+        """Get hit/miss counters of the user list cache."""
+        return _users_cache.stats()
+
     @staticmethod
     def get_all_users_details():
         """Get all users with details."""
@@ -0,0 +1,34 @@
+"""Search service - Full-text search across catalogs and crop management notes."""
+
+from data.repositories.busqueda_repo import BusquedaRepository, SNIPPET_END, SNIPPET_START
+
+
+# Spanish labels for each searchable table
+SEARCH_SOURCES = {
+    "tipo_hortaliza": "Tipo de hortaliza",
+    "tipo_suelo": "Tipo de suelo",
+    "clima": "Clima",
+    "gestion_cultivo": "Gestión de cultivo",
+}
+
+
+class BusquedaService:
+    """Service for ranked text search."""
+
+    @staticmethod
+    def search(texto, tablas=None, limit=50, start=SNIPPET_START, end=SNIPPET_END):
+        """Search words (prefixes) in names, descriptions and observations.
+
+        Returns (tabla, codigo, titulo, fragmento, rank) tuples, best first.
+        """
+        return BusquedaRepository.search(texto, tablas, limit, start, end)
+
+    @staticmethod
+    def count(texto, tabla):
+        """Count matching rows of one table."""
+        return BusquedaRepository.count(texto, tabla)
+
+    @staticmethod
+    def optimize():
+        """Compact the search indexes after large imports."""
+        BusquedaRepository.optimize()
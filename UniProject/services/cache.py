@@ -0,0 +1,73 @@
+"""Catalog cache - In-memory copies of small reference tables."""
+
+import threading
+
+from utils.text_utils import fold
+
+
+class CatalogCache:
+    """Rows of one catalog held in memory with id and name lookups.
+
+    The loader runs on the first read and again only after invalidate(),
+    which every write path calls.
+    """
+
+    def __init__(self, name, loader, id_index=0, name_index=1):
+        self.name = name
+        self._loader = loader
+        self._id_index = id_index
+        self._name_index = name_index
+        self._rows = None
+        self._by_id = {}
+        self._by_name = {}
+        self._by_clave = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def rows(self):
+        """Get every cached row, loading them on a miss."""
+        with self._lock:
+            if self._rows is not None:
+                self.hits += 1
+                return self._rows
+            self.misses += 1
+            generation = self._generation
+        rows = list(self._loader())
+        with self._lock:
+            # Don't keep rows read before an invalidation that raced with us
+            if generation == self._generation:
+                self._rows = rows
+                self._by_id = {row[self._id_index]: row for row in rows}
+                self._by_name = {row[self._name_index]: row[self._id_index] for row in rows}
+                self._by_clave = {fold(row[self._name_index]): row[self._id_index] for row in rows}
+        return rows
+
+    def get(self, row_id):
+        """Get a row by its id, or None."""
+        self.rows()
+        return self._by_id.get(row_id)
+
+    def id_for(self, nombre):
+        """Get the id of the row with this name, or None.
+
+        Falls back to comparing names without accents or case.
+        """
+        self.rows()
+        row_id = self._by_name.get(nombre)
+        if row_id is None and nombre is not None:
+            row_id = self._by_clave.get(fold(nombre))
+        return row_id
+
+    def invalidate(self):
+        """Forget the cached rows so the next read reloads them."""
+        with self._lock:
+            self._generation += 1
+            self._rows = None
+            self._by_id = {}
+            self._by_name = {}
+            self._by_clave = {}
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "loaded": self._rows is not None}
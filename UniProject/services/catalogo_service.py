@@ -1,16 +1,117 @@
 """Catalog service - Business logic for reference data."""
 
-from data.repositories.catalogo_repo import CatalogoRepository
+from core.cycles import cycles, resolve_cycle, table_overrides
+from data.change_tracker import tracker
+from data.repositories.catalogo_repo import CatalogoRepository, DEFAULT_TIPOS_CULTIVO
+from services.cache import CatalogCache
+from services.recalculo_service import RecalculoService
+
+
+# Full rows of each catalog; (codigo/id, nombre) come first so they also
+# serve the get_all_* listings
+_caches = {
+    "tipo_hortaliza": CatalogCache("tipo_hortaliza", CatalogoRepository.get_tipo_hortaliza_full),
+    "tipo_suelo": CatalogCache("tipo_suelo", CatalogoRepository.get_tipo_suelo_full),
+    "clima": CatalogCache("clima", CatalogoRepository.get_clima_full),
+    "tipo_cultivo": CatalogCache("tipo_cultivo", CatalogoRepository.get_tipo_cultivo_full),
+}
+
+# Changes committed by other processes reach the caches through the tracker
+for _table in _caches:
+    tracker.subscribe(_table, lambda table: _caches[table].invalidate())
+
+# Harvest cycles are compiled from the cached tipo_cultivo rows
+cycles.set_loader(_caches["tipo_cultivo"].rows)
+tracker.subscribe("tipo_cultivo", lambda table: cycles.invalidate())
+
+
+def _write_through(table, write, *args):
+    """Run a repository write and drop the cached copy of the table."""
+    if table == "tipo_cultivo":
+        return _write_cycles(write, *args)
+    try:
+        return write(*args)
+    finally:
+        _caches[table].invalidate()
+
+
+def _cycles_by_id(rows):
+    """Map each tipo_cultivo id to the (first, routine) days its hectareas use."""
+    overrides = table_overrides(rows)
+    return {row[0]: resolve_cycle(row[1], overrides) for row in rows if row[1]}
+
+
+def _write_cycles(write, *args):
+    """Write tipo_cultivo and queue a recalculation for every crop whose cycle changed.
+
+    Crops are compared by id, so a rename that changes the cycle (e.g. onto a
+    built-in crop) is caught too. Added and deleted crops have no hectareas.
+    """
+    before = _cycles_by_id(_caches["tipo_cultivo"].rows())
+    try:
+        result = write(*args)
+    finally:
+        _caches["tipo_cultivo"].invalidate()
+        cycles.invalidate()
+    after = _cycles_by_id(_caches["tipo_cultivo"].rows())
+    for id_tipo_cultivo in before.keys() & after.keys():
+        if before[id_tipo_cultivo] != after[id_tipo_cultivo]:
+            RecalculoService.enqueue(id_tipo_cultivo, before[id_tipo_cultivo], after[id_tipo_cultivo])
+    return result
 
 
 class CatalogoService:
     """Service for catalog operations."""
 
+    # ============ Cache ============
+    @staticmethod
+    def get_catalog_id(table, nombre):
+        """Get the codigo/id of a catalog entry by name from the cache."""
+        return _caches[table].id_for(nombre)
+
+    @staticmethod
+    def get_catalog_row(table, codigo):
+        """Get a catalog entry by codigo/id from the cache."""
+        return _caches[table].get(codigo)
+
+    @staticmethod
+    def find_catalog(table, nombre):
+        """Get catalog rows named nombre, ignoring accents and case."""
+        return CatalogoRepository.find_by_nombre(table, nombre)
+
+    @staticmethod
+    def add_nombre(table, nombre):
+        """Add a crop or soil type named nombre unless one matches it ignoring accents and case."""
+        if CatalogoRepository.find_by_nombre(table, nombre):
+            return
+        if table == "tipo_cultivo":
+            CatalogoService.create_tipo_cultivo(nombre, None, None)
+        else:
+            CatalogoService.create_suelo(nombre, None, None)
+
+    @staticmethod
+    def search_catalog_prefix(table, prefix, limit=None):
+        """Get catalog rows whose name starts with prefix, ignoring accents and case."""
+        return CatalogoRepository.search_by_prefix(table, prefix, limit)
+
+    @staticmethod
+    def invalidate_cache(table=None):
+        """Drop one cached catalog, or all of them."""
+        for name in ([table] if table else _caches):
+            _caches[name].invalidate()
+        if table in (None, "tipo_cultivo"):
+            cycles.invalidate()
+
+    @staticmethod
+    def cache_stats():
+        """Get hit/miss counters per cached catalog."""
+        return {name: cache.stats() for name, cache in _caches.items()}
+
     # ============ Tipo Hortaliza ============
     @staticmethod
     def get_all_tipo_hortaliza():
         """Get all hortaliza types."""
-        return CatalogoRepository.get_all_tipo_hortaliza()
+        return _caches["tipo_hortaliza"].rows()
 
     @staticmethod
     def search_hortaliza(nombre):
@@ -20,100 +121,100 @@ class CatalogoService:
     @staticmethod
     def get_tipo_hortaliza_full():
         """Get hortaliza types with details."""
-        return CatalogoRepository.get_tipo_hortaliza_full()
+        return _caches["tipo_hortaliza"].rows()
 
     @staticmethod
     def create_hortaliza(nombre, descripcion, imagen):
         """Create hortaliza type."""
-        return CatalogoRepository.create_tipo_hortaliza(nombre, descripcion, imagen)
+        return _write_through("tipo_hortaliza", CatalogoRepository.create_tipo_hortaliza, nombre, descripcion, imagen)
 
     @staticmethod
     def update_hortaliza(codigo, nombre, descripcion, imagen):
         """Update hortaliza type."""
-        return CatalogoRepository.update_tipo_hortaliza(codigo, nombre, descripcion, imagen)
+        return _write_through("tipo_hortaliza", CatalogoRepository.update_tipo_hortaliza, codigo, nombre, descripcion, imagen)
 
     @staticmethod
     def delete_hortaliza(codigo):
         """Delete hortaliza type."""
-        return CatalogoRepository.delete_tipo_hortaliza(codigo)
+        return _write_through("tipo_hortaliza", CatalogoRepository.delete_tipo_hortaliza, codigo)
 
     # ============ Tipo Suelo ============
     @staticmethod
     def get_all_tipo_suelo():
         """Get all soil types."""
-        return CatalogoRepository.get_all_tipo_suelo()
+        return _caches["tipo_suelo"].rows()
 
     @staticmethod
     def get_tipo_suelo_full():
         """Get soil types with details."""
-        return CatalogoRepository.get_tipo_suelo_full()
+        return _caches["tipo_suelo"].rows()
 
     @staticmethod
     def create_suelo(nombre, descripcion, imagen):
         """Create soil type."""
-        return CatalogoRepository.create_tipo_suelo(nombre, descripcion, imagen)
+        return _write_through("tipo_suelo", CatalogoRepository.create_tipo_suelo, nombre, descripcion, imagen)
 
     @staticmethod
     def update_suelo(codigo, nombre, descripcion, imagen):
         """Update soil type."""
-        return CatalogoRepository.update_tipo_suelo(codigo, nombre, descripcion, imagen)
+        return _write_through("tipo_suelo", CatalogoRepository.update_tipo_suelo, codigo, nombre, descripcion, imagen)
 
     @staticmethod
     def delete_suelo(codigo):
         """Delete soil type."""
-        return CatalogoRepository.delete_tipo_suelo(codigo)
+        return _write_through("tipo_suelo", CatalogoRepository.delete_tipo_suelo, codigo)
 
     # ============ Clima ============
     @staticmethod
     def get_all_clima():
         """Get all climate types."""
-        return CatalogoRepository.get_all_clima()
+        return _caches["clima"].rows()
 
     @staticmethod
     def get_clima_full():
         """Get climate types with details."""
-        return CatalogoRepository.get_clima_full()
+        return _caches["clima"].rows()
 
     @staticmethod
     def create_clima(nombre, grados, descripcion, imagen):
         """Create climate type."""
-        return CatalogoRepository.create_clima(nombre, grados, descripcion, imagen)
+        return _write_through("clima", CatalogoRepository.create_clima, nombre, grados, descripcion, imagen)
 
     @staticmethod
     def update_clima(codigo, nombre, grados, descripcion, imagen):
         """Update climate type."""
-        return CatalogoRepository.update_clima(codigo, nombre, grados, descripcion, imagen)
+        return _write_through("clima", CatalogoRepository.update_clima, codigo, nombre, grados, descripcion, imagen)
 
     @staticmethod
     def delete_clima(codigo):
         """Delete climate type."""
-        return CatalogoRepository.delete_clima(codigo)
+        return _write_through("clima", CatalogoRepository.delete_clima, codigo)
 
     # ============ Tipo Cultivo ============
     @staticmethod
     def get_all_tipo_cultivo():
         """Get all crop types."""
-        return CatalogoRepository.get_all_tipo_cultivo()
+        return _caches["tipo_cultivo"].rows() or DEFAULT_TIPOS_CULTIVO
 
     @staticmethod
     def get_tipo_cultivo_full():
         """Get crop types with details."""
-        return CatalogoRepository.get_tipo_cultivo_full()
+        return _caches["tipo_cultivo"].rows()
 
     @staticmethod
     def create_tipo_cultivo(nombre, meses_primera, meses_rutinaria):
         """Create crop type."""
-        return CatalogoRepository.create_tipo_cultivo(nombre, meses_primera, meses_rutinaria)
+        return _write_through("tipo_cultivo", CatalogoRepository.create_tipo_cultivo, nombre, meses_primera, meses_rutinaria)
 
     @staticmethod
     def update_tipo_cultivo(cultivo_id, nombre, meses_primera, meses_rutinaria):
         """Update crop type."""
-        return CatalogoRepository.update_tipo_cultivo(cultivo_id, nombre, meses_primera, meses_rutinaria)
+        return _write_through("tipo_cultivo", CatalogoRepository.update_tipo_cultivo, cultivo_id, nombre, meses_primera, meses_rutinaria)
 
     @staticmethod
     def delete_tipo_cultivo(cultivo_id):
         """Delete crop type."""
-        return CatalogoRepository.delete_tipo_cultivo(cultivo_id)
+        return _write_through("tipo_cultivo", CatalogoRepository.delete_tipo_cultivo, cultivo_id)
 
     # ============ Gestion Cultivo ============
     @staticmethod
@@ -121,6 +222,16 @@ class CatalogoService:
         """Get all crop management records."""
         return CatalogoRepository.get_all_gestion_cultivo()
 
+    @staticmethod
+    def iter_gestion_cultivo(batch_size=500):
+        """Iterate over crop management records in batches."""
+        return CatalogoRepository.iter_gestion_cultivo(batch_size)
+
+    @staticmethod
+    def count_gestion_cultivo():
+        """Count crop management records."""
+        return CatalogoRepository.count_gestion_cultivo()
+
     @staticmethod
     def get_gestion_cultivo_raw():
         """Get crop management raw data."""
@@ -149,3 +260,9 @@ class CatalogoService:
     def delete_gestion_cultivo(codigo):
         """Delete crop management record."""
         return CatalogoRepository.delete_gestion_cultivo(codigo)
+
+    # ============ Bulk ============
+    @staticmethod
+    def upsert_catalog(table, rows):
+        """Insert or update catalog rows keyed on nombre."""
+        return _write_through(table, CatalogoRepository.upsert_many, table, rows)
@@ -0,0 +1,17 @@
+"""Change service - Table change notifications for caches and screens."""
+
+from data.change_tracker import tracker
+
+
+class ChangeService:
+    """Service for reacting to database changes made by any process."""
+
+    @staticmethod
+    def subscribe(table, callback):
+        """Call callback(table) when table changes; returns an unsubscribe function."""
+        return tracker.subscribe(table, callback)
+
+    @staticmethod
+    def poll():
+        """Publish pending change events; returns the set of changed tables."""
+        return tracker.poll()
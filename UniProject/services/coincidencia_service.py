@@ -0,0 +1,92 @@
+"""Name matching service - Closest crop and soil names for mistyped input."""
+
+import threading
+
+from core.enums import HARVEST_CYCLES, SoilType
+from services.catalogo_service import CatalogoService
+from utils.fuzzy import BKTree
+from utils.text_utils import fold
+
+
+def max_distance_for(key):
+    """Allowed edit distance for a folded name: 1 up to three letters, else 2."""
+    return 1 if len(key) <= 3 else 2
+
+
+class _NameMatcher:
+    """BK-tree over the folded names of one catalog plus built-in names.
+
+    The tree is rebuilt whenever the catalog cache hands out a new row list,
+    i.e. after any write or change notification invalidated it.
+    """
+
+    def __init__(self, loader, builtin):
+        self._loader = loader
+        self._builtin = builtin
+        self._rows = None
+        self._names = {}
+        self._tree = BKTree()
+        self._lock = threading.Lock()
+
+    def _current(self):
+        rows = self._loader()
+        with self._lock:
+            if rows is not self._rows:
+                names = {fold(nombre): nombre for nombre in self._builtin}
+                # Catalog spelling wins over the built-in one
+                names.update((fold(row[1]), row[1]) for row in rows if row[1])
+                self._names = names
+                self._tree = BKTree(names)
+                self._rows = rows
+            return self._names, self._tree
+
+    def canonical(self, nombre):
+        names, _ = self._current()
+        return names.get(fold(nombre))
+
+    def closest(self, nombre, max_distance=None):
+        """(distance, name) pairs, closest first."""
+        key = fold(nombre)
+        if not key:
+            return []
+        names, tree = self._current()
+        if max_distance is None:
+            max_distance = max_distance_for(key)
+        return [(distance, names[match]) for distance, match in tree.search(key, max_distance)]
+
+
+_matchers = {
+    "tipo_cultivo": _NameMatcher(CatalogoService.get_tipo_cultivo_full, tuple(HARVEST_CYCLES)),
+    "tipo_suelo": _NameMatcher(CatalogoService.get_tipo_suelo_full, tuple(s.value for s in SoilType)),
+}
+
+MATCH_TABLES = tuple(_matchers)
+
+
+class CoincidenciaService:
+    """Service for typo-tolerant crop and soil names."""
+
+    @staticmethod
+    def canonical(table, nombre):
+        """Get the known spelling of nombre ignoring accents and case, or None."""
+        return _matchers[table].canonical(nombre)
+
+    @staticmethod
+    def suggest(table, nombre, limit=5, max_distance=None):
+        """Get up to limit known names close to nombre, closest first."""
+        return [match for _, match in _matchers[table].closest(nombre, max_distance)[:limit]]
+
+    @staticmethod
+    def correct(table, nombre):
+        """Get the name nombre most likely meant, or None.
+
+        An exact match (ignoring accents and case) wins; otherwise the closest
+        name is used only if no other name is equally close.
+        """
+        exact = _matchers[table].canonical(nombre)
+        if exact is not None:
+            return exact
+        matches = _matchers[table].closest(nombre)
+        if not matches or (len(matches) > 1 and matches[1][0] == matches[0][0]):
+            return None
+        return matches[0][1]
@@ -1,7 +1,11 @@
 """Hectarea service - Business logic for hectare management."""
 
-from core.models import Hectarea
+from core.cycles import cycles
+from core.models import HECTAREA_FIELDS, Hectarea, HectareaBatch, compute_harvest_dates
 from data.repositories.hectarea_repo import HectareaRepository
+from utils.date_utils import parse_date
+# Installs the tipo_cultivo loader and reload hooks on cycles
+import services.catalogo_service  # noqa: F401
 
 
 class HectareaService:
@@ -22,11 +26,86 @@ class HectareaService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def create_many(rows):
+        """Create many hectareas in a single transaction.
+
+        Each row is a dict with crop_type, siembra, tipo_suelo, temperatura and
+        optional primera_cosecha / cosecha_rutinaria. Invalid rows are reported
+        in "errors" as (index, message) without aborting the rest; valid rows
+        receive contiguous numeros.
+        """
+        prepared, indexes, errors = _prepare_rows(rows)
+        try:
+            numeros, db_errors = HectareaRepository.create_many(prepared)
+        except Exception as e:
+            return {"success": False, "error": str(e), "created": 0, "numeros": [], "errors": errors}
+
+        errors.extend((indexes[i], message) for i, message in db_errors)
+        errors.sort()
+        return {"success": True, "created": len(numeros), "numeros": numeros, "errors": errors}
+
+    @staticmethod
+    def upsert_many(rows):
+        """Insert or update many hectareas keyed on their numero in one transaction.
+
+        Same row format as create_many plus a required numero; existing
+        hectareas with that numero are overwritten.
+        """
+        prepared, indexes, errors = _prepare_rows(rows, with_numero=True)
+        try:
+            saved, db_errors = HectareaRepository.upsert_many(prepared)
+        except Exception as e:
+            return {"success": False, "error": str(e), "saved": 0, "errors": errors}
+
+        errors.extend((indexes[i], message) for i, message in db_errors)
+        errors.sort()
+        return {"success": True, "saved": saved, "errors": errors}
+
     @staticmethod
     def get_all_hectareas():
         """Get all hectareas."""
         return HectareaRepository.get_all()
 
+    @staticmethod
+    def iter_hectareas(page_size=500, columns=None, **filters):
+        """Iterate over hectareas page by page ordered by numero."""
+        return HectareaRepository.iter_all(page_size, columns, **filters)
+
+    @staticmethod
+    def load_batch(page_size=5000, **filters):
+        """Load matching hectareas into a compact HectareaBatch."""
+        return HectareaBatch.from_rows(
+            HectareaRepository.iter_all(page_size, HECTAREA_FIELDS, **filters)
+        )
+
+    @staticmethod
+    def harvest_calendar(**filters):
+        """Build a harvest calendar for the matching hectareas."""
+        # NumPy is only needed here, so keep it out of application startup
+        from core.harvest_calendar import HarvestCalendar
+        return HarvestCalendar.from_batch(HectareaService.load_batch(**filters))
+
+    @staticmethod
+    def harvest_cycle(crop_type):
+        """Get the (first, routine) cycle lengths in days used for a crop, matched by fold()."""
+        return cycles.cycle(crop_type)
+
+    @staticmethod
+    def harvest_events(desde, hasta, **filters):
+        """Iterate over the harvests between two dates in date order."""
+        return HectareaService.harvest_calendar(**filters).events(desde, hasta)
+
+    @staticmethod
+    def fetch_page(after=None, limit=500, columns=None, **filters):
+        """Get one keyset page of hectareas."""
+        return HectareaRepository.fetch_page(after, limit, columns, **filters)
+
+    @staticmethod
+    def page_key(row, order_by="numero"):
+        """Get the keyset value that continues after row."""
+        return HectareaRepository.page_key(row, order_by)
+
     @staticmethod
     def get_hectarea(numero):
         """Get hectarea by number."""
@@ -43,9 +122,13 @@ class HectareaService:
 
     @staticmethod
     def update_hectarea(numero, tipo, siembra, primera, rutinaria, tipo_suelo, temperatura):
-        """Update hectarea data."""
+        """Update hectarea data; dates must be YYYY-MM-DD and junk temperatures become None."""
         try:
-            HectareaRepository.update(numero, tipo, siembra, primera, rutinaria, tipo_suelo, temperatura)
+            for fecha in (siembra, primera, rutinaria):
+                if fecha:
+                    parse_date(fecha)
+            HectareaRepository.update(numero, tipo, siembra or None, primera or None, rutinaria or None,
+                                      tipo_suelo, _parse_temperatura(temperatura))
             return {"success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -54,3 +137,39 @@ class HectareaService:
     def get_next_numero():
         """Get next available hectarea number."""
         return HectareaRepository.get_next_numero()
+
+
+def _prepare_rows(rows, with_numero=False):
+    """Validate row dicts and compute harvest dates.
+
+    Returns (prepared tuples, original index of each, (index, message) errors).
+    """
+    prepared, indexes, errors = [], [], []
+    for index, row in enumerate(rows):
+        try:
+            tipo = row["crop_type"].lower()
+            siembra, primera, rutinaria = compute_harvest_dates(
+                tipo, row["siembra"],
+                row.get("primera_cosecha") or None, row.get("cosecha_rutinaria") or None
+            )
+            values = (tipo, siembra, primera, rutinaria,
+                      row.get("tipo_suelo"), _parse_temperatura(row.get("temperatura")))
+            if with_numero:
+                values = (int(row["numero"]),) + values
+        except KeyError as e:
+            errors.append((index, f"Missing field: {e.args[0]}"))
+            continue
+        except (AttributeError, TypeError, ValueError) as e:
+            errors.append((index, str(e)))
+            continue
+        prepared.append(values)
+        indexes.append(index)
+    return prepared, indexes, errors
+
+
+def _parse_temperatura(temperatura):
+    """Parse temperature the way Hectarea does: blanks and junk become None."""
+    try:
+        return float(temperatura) if temperatura not in (None, "") else None
+    except ValueError:
+        return None
@@ -0,0 +1,282 @@
+"""Import service - Streaming CSV/JSON Lines loader for hectareas and catalogs.
+
+Rows are read one at a time and written in fixed-size batches, so memory use
+depends on the batch size and not on the file size.
+
+Usage::
+
+    python -m services.import_service hectareas hectareas.csv [--batch-size 5000]
+    python -m services.import_service tipo_suelo suelos.jsonl
+    python -m services.import_service hectareas hectareas.csv --corregir-nombres
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from data import database
+from data.repositories.catalogo_repo import CATALOG_COLUMNS
+from services.catalogo_service import CatalogoService
+from services.coincidencia_service import CoincidenciaService
+from services.hectarea_service import HectareaService
+
+
+IMPORT_KINDS = ("hectareas",) + tuple(CATALOG_COLUMNS)
+MAX_REPORTED_ERRORS = 1000
+
+# Column converters for catalog tables; nombre is always required
+_CATALOG_TYPES = {
+    "grados_temperatura": float,
+    "meses_primera": int,
+    "meses_rutinaria": int,
+}
+
+
+class ImportReport:
+    """Outcome of an import run."""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.read = 0
+        self.saved = 0
+        self.failed = 0
+        self.corrected = 0
+        self.batches = 0
+        self.errors = []
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.read / self.seconds if self.seconds else 0.0
+
+    def add_error(self, line, message):
+        """Record a rejected row, keeping at most MAX_REPORTED_ERRORS messages."""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "read": self.read,
+            "saved": self.saved,
+            "failed": self.failed,
+            "corrected": self.corrected,
+            "batches": self.batches,
+            "seconds": self.seconds,
+            "rows_per_second": self.rows_per_second,
+            "errors": self.errors,
+        }
+
+
+def iter_records(path, fmt=None):
+    """Yield (file line, record) for each record of a CSV or JSON Lines file.
+
+    A JSON line that cannot be decoded yields a ValueError instead of a
+    record, so the import can reject that line and carry on.
+    """
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv")
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                # line_num counts the header and quoted line breaks
+                yield reader.line_num, record
+        elif fmt == "jsonl":
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield number, ValueError(f"Invalid JSON: {e.msg} (column {e.colno})")
+        else:
+            raise ValueError(f"Unsupported format: {fmt}")
+
+
+def _valid_records(batch, report):
+    """Keep the (line, record) pairs whose record is an object; reject the rest."""
+    valid = []
+    for line, record in batch:
+        if isinstance(record, Exception):
+            report.add_error(line, str(record))
+        elif not isinstance(record, dict):
+            report.add_error(line, "Expected an object per record")
+        else:
+            valid.append((line, record))
+    return valid
+
+
+def _catalog_row(kind, record):
+    """Convert a record into a tuple in CATALOG_COLUMNS order."""
+    values = []
+    for column in CATALOG_COLUMNS[kind]:
+        value = record.get(column)
+        if value in (None, ""):
+            if column == "nombre":
+                raise ValueError("Missing field: nombre")
+            values.append(None)
+            continue
+        if column == "nombre":
+            value = str(value).strip()
+        elif column in _CATALOG_TYPES:
+            value = _CATALOG_TYPES[column](value)
+        values.append(value)
+    return tuple(values)
+
+
+def _hectarea_row(record):
+    """Map a record using the table/model field names onto the service row format."""
+    row = dict(record)
+    if "crop_type" not in row and "tipo_de_cultivo" in row:
+        row["crop_type"] = row["tipo_de_cultivo"]
+    return row
+
+
+def _correct_names(row, memo, report):
+    """Replace crop and soil names with the known names they most likely meant.
+
+    memo keeps each distinct input's answer for the whole import.
+    """
+    for field, table in (("crop_type", "tipo_cultivo"), ("tipo_suelo", "tipo_suelo")):
+        nombre = row.get(field)
+        if not isinstance(nombre, str) or not nombre:
+            continue
+        if (table, nombre) not in memo:
+            memo[table, nombre] = CoincidenciaService.correct(table, nombre)
+        corrected = memo[table, nombre]
+        if corrected is not None and corrected != nombre:
+            row[field] = corrected
+            report.corrected += 1
+
+
+class ImportService:
+    """Service for headless bulk imports."""
+
+    @staticmethod
+    def import_records(kind, records, batch_size=1000, progress=None, correct_names=False):
+        """Import an iterable of record dicts in batches and return an ImportReport.
+
+        Hectareas with a numero are upserted on it; those without one get new
+        contiguous numeros. Catalog rows are upserted on nombre ignoring
+        accents and case, so running the same import twice does not duplicate
+        anything. With correct_names, mistyped hectarea crop and soil names
+        are replaced by the unambiguous closest known name (counted in
+        report.corrected).
+        Errors are reported by record position, starting at 1.
+        """
+        return ImportService._import_numbered(kind, enumerate(records, 1), batch_size, progress,
+                                              correct_names)
+
+    @staticmethod
+    def _import_numbered(kind, numbered, batch_size, progress, correct_names):
+        """Import (line, record) pairs as import_records does, reporting errors by line."""
+        if kind not in IMPORT_KINDS:
+            raise ValueError(f"Unknown import kind: {kind}")
+        report = ImportReport(kind)
+        start = time.perf_counter()
+        numbered = iter(numbered)
+        memo = {} if correct_names else None
+        while True:
+            batch = list(islice(numbered, batch_size))
+            if not batch:
+                break
+            report.read += len(batch)
+            batch = _valid_records(batch, report)
+            if kind == "hectareas":
+                ImportService._import_hectareas(batch, report, memo)
+            else:
+                ImportService._import_catalog(kind, batch, report)
+            report.batches += 1
+            if progress is not None:
+                progress(report)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def import_file(kind, path, fmt=None, batch_size=1000, progress=None, correct_names=False):
+        """Stream a CSV/JSONL file into the database using the bulk-import profile."""
+        previous = database.PRAGMA_PROFILE
+        database.set_pragma_profile("bulk-import")
+        try:
+            return ImportService._import_numbered(kind, iter_records(path, fmt), batch_size, progress,
+                                                  correct_names)
+        finally:
+            database.set_pragma_profile(previous)
+
+    @staticmethod
+    def _import_hectareas(batch, report, memo=None):
+        with_numero, without_numero = [], []
+        for line, record in batch:
+            row = _hectarea_row(record)
+            if memo is not None:
+                _correct_names(row, memo, report)
+            target = with_numero if row.get("numero") not in (None, "") else without_numero
+            target.append((line, row))
+
+        for rows, save in ((with_numero, HectareaService.upsert_many),
+                           (without_numero, HectareaService.create_many)):
+            if not rows:
+                continue
+            result = save([row for _, row in rows])
+            if not result["success"]:
+                for line, _ in rows:
+                    report.add_error(line, result["error"])
+                continue
+            for index, message in result["errors"]:
+                report.add_error(rows[index][0], message)
+            report.saved += len(rows) - len(result["errors"])
+
+    @staticmethod
+    def _import_catalog(kind, batch, report):
+        rows, lines = [], []
+        for line, record in batch:
+            try:
+                rows.append(_catalog_row(kind, record))
+                lines.append(line)
+            except (TypeError, ValueError) as e:
+                report.add_error(line, str(e))
+        saved, errors = CatalogoService.upsert_catalog(kind, rows)
+        report.saved += saved
+        for index, message in errors:
+            report.add_error(lines[index], message)
+
+
+def main(argv=None):
+    """Command line entry point for headless imports."""
+    parser = argparse.ArgumentParser(prog="python -m services.import_service", description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default=None)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--corregir-nombres", action="store_true",
+                        help="Corregir cultivos y suelos mal escritos al nombre conocido más cercano")
+    parser.add_argument("--db", default=database.DATABASE_PATH, help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    database.DATABASE_PATH = args.db
+    database.initialize_db()
+
+    def progress(report):
+        elapsed = time.perf_counter() - started
+        rate = report.read / elapsed if elapsed else 0.0
+        print(f"\r{report.read} filas leídas ({rate:,.0f} filas/s)", end="", file=sys.stderr)
+
+    started = time.perf_counter()
+    report = ImportService.import_file(args.kind, args.path, args.format, args.batch_size, progress,
+                                       args.corregir_nombres)
+    print(file=sys.stderr)
+    print(f"Leídas: {report.read}  Guardadas: {report.saved}  Rechazadas: {report.failed}")
+    if args.corregir_nombres:
+        print(f"Nombres corregidos: {report.corrected}")
+    print(f"Tiempo: {report.seconds:.2f} s  ({report.rows_per_second:,.0f} filas/s)")
+    for line, message in report.errors[:20]:
+        print(f"  línea {line}: {message}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Recalculation service - Move stored harvest dates to new crop cycles.
+
+When tipo_cultivo changes a crop's cycle lengths, CatalogoService records a
+job; run_pending() rewrites the affected hectareas chunk by chunk, each chunk
+committing together with its checkpoint, so an interrupted run picks up where
+it stopped. Dates entered by hand are left as they are.
+
+Usage::
+
+    python -m services.recalculo_service [--chunk-size 2000]
+"""
+
+import argparse
+import sys
+
+from config.settings import RECALCULO_CHUNK_SIZE
+from data.repositories.recalculo_repo import RecalculoRepository
+
+
+class RecalculoService:
+    """Service for harvest recalculation jobs."""
+
+    @staticmethod
+    def enqueue(id_tipo_cultivo, desde, hasta):
+        """Record a cycle change of a crop by tipo_cultivo id; returns the job id or None."""
+        return RecalculoRepository.enqueue(id_tipo_cultivo, desde, hasta)
+
+    @staticmethod
+    def get_pending():
+        """Get unfinished jobs."""
+        return RecalculoRepository.get_pending()
+
+    @staticmethod
+    def run_pending(chunk_size=RECALCULO_CHUNK_SIZE, progress=None, cancelled=None):
+        """Run every pending job until done or cancelled() returns True.
+
+        progress(tipo_de_cultivo, procesadas, total) is called after each
+        chunk. Returns a result dict with the number of rewritten hectareas
+        and whether every job finished.
+        """
+        actualizadas = 0
+        try:
+            for job in RecalculoRepository.get_pending():
+                while True:
+                    if cancelled is not None and cancelled():
+                        return {"success": True, "actualizadas": actualizadas, "completo": False}
+                    before = job["actualizadas"]
+                    job = RecalculoRepository.run_chunk(job["id"], chunk_size)
+                    if job is None:
+                        break
+                    actualizadas += job["actualizadas"] - before
+                    if progress is not None:
+                        progress(job["tipo_de_cultivo"], min(job["procesadas"], job["total"]), job["total"])
+                    if job["terminado"]:
+                        break
+            return {"success": True, "actualizadas": actualizadas, "completo": True}
+        except Exception as e:
+            return {"success": False, "error": str(e), "actualizadas": actualizadas, "completo": False}
+
+
+def main(argv=None):
+    """Command line entry point to finish pending recalculations."""
+    parser = argparse.ArgumentParser(prog="python -m services.recalculo_service",
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=RECALCULO_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    from data.database import initialize_db
+    initialize_db()
+
+    def progress(tipo, procesadas, total):
+        print(f"{tipo}: {procesadas}/{total}")
+
+    result = RecalculoService.run_pending(args.chunk_size, progress)
+    if not result["success"]:
+        print(f"Error: {result['error']}")
+        return 1
+    print(f"Hectáreas actualizadas: {result['actualizadas']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
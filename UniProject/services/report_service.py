@@ -0,0 +1,32 @@
+"""Report service - Text reports streamed in chunks."""
+
+from services.catalogo_service import CatalogoService
+
+
+GESTION_SEPARATOR = "-" * 40
+
+
+def format_gestion(registro):
+    """Format one crop management record as it appears in the report."""
+    return (f"Código: {registro[0]}\nUsuario: {registro[1]}\nTipo Hortaliza: {registro[2]}\n"
+            f"Tipo Suelo: {registro[3]}\nClima: {registro[4]}\nVideo: {registro[5]}\n"
+            f"Observaciones: {registro[6]}\n{GESTION_SEPARATOR}\n")
+
+
+class ReportService:
+    """Service for building reports without materializing them."""
+
+    @staticmethod
+    def count_gestion_report():
+        """Get the number of records the crop management report lists."""
+        return CatalogoService.count_gestion_cultivo()
+
+    @staticmethod
+    def iter_gestion_report(chunk_size=500):
+        """Yield (text, records) chunks of the crop management report.
+
+        Concatenating every chunk gives the full report; each chunk is joined
+        once, so the cost stays linear in the number of records.
+        """
+        for batch in CatalogoService.iter_gestion_cultivo(chunk_size):
+            yield "".join(map(format_gestion, batch)), len(batch)
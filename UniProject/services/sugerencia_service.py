@@ -0,0 +1,128 @@
+"""Suggestion service - Search-as-you-type over hectareas and catalog names."""
+
+import threading
+
+from config.settings import SUGGESTION_LIMIT
+from data.change_tracker import tracker
+from data.repositories.hectarea_repo import HectareaRepository
+from services.catalogo_service import CatalogoService
+from utils.prefix_index import NamePrefixIndex, NumberPrefixIndex
+from utils.text_utils import fold
+
+
+# Spanish label of each kind of suggestion, in the order they are listed
+SUGGESTION_KINDS = {
+    "hectarea": "Hectárea",
+    "cultivo": "Cultivo",
+    "suelo": "Suelo",
+    "tipo_hortaliza": "Hortaliza",
+    "clima": "Clima",
+}
+
+# Tables whose changes make the index stale
+_SOURCE_TABLES = ("hectareas", "tipo_cultivo", "tipo_suelo", "tipo_hortaliza", "clima")
+
+
+def _unique_names(*sources):
+    """Names from several lists, skipping repeats that differ only in accents or case."""
+    seen = {}
+    for names in sources:
+        for nombre in names:
+            if nombre and fold(nombre) not in seen:
+                seen[fold(nombre)] = nombre
+    return seen.values()
+
+
+class SuggestionIndex:
+    """Hectarea numbers and names held in memory for prefix lookups."""
+
+    def __init__(self, numeros=(), nombres=None):
+        """Build from numbers and a {kind: names} mapping."""
+        self.numeros = NumberPrefixIndex(numeros)
+        self.nombres = {
+            kind: NamePrefixIndex((nombre, nombre) for nombre in names)
+            for kind, names in (nombres or {}).items()
+        }
+
+    def __len__(self):
+        return len(self.numeros) + sum(len(index) for index in self.nombres.values())
+
+    def suggest(self, texto, limit=SUGGESTION_LIMIT, kinds=None):
+        """Get up to limit (kind, value) pairs whose value starts with texto."""
+        results = []
+        for kind in kinds or SUGGESTION_KINDS:
+            if len(results) >= limit:
+                break
+            if kind == "hectarea":
+                results.extend((kind, numero) for numero in self.numeros.search(texto, limit - len(results)))
+            elif kind in self.nombres:
+                results.extend((kind, nombre) for nombre, _ in self.nombres[kind].search(texto, limit - len(results)))
+        return results
+
+
+_index = SuggestionIndex()
+_stale = True
+_generation = 0
+_lock = threading.Lock()
+
+
+def _mark_stale(table):
+    global _stale, _generation
+    with _lock:
+        _stale = True
+        _generation += 1
+
+
+for _table in _SOURCE_TABLES:
+    tracker.subscribe(_table, _mark_stale)
+
+
+class SugerenciaService:
+    """Service for search-as-you-type suggestions.
+
+    Lookups only read the in-memory index; build_index() reads the database
+    and is meant for a worker thread. Until the first build, suggest()
+    returns nothing.
+    """
+
+    @staticmethod
+    def build_index():
+        """Load numbers and names from the database into a new index."""
+        global _index, _stale
+        with _lock:
+            generation = _generation
+        numeros, cultivos, suelos = HectareaRepository.search_terms()
+        index = SuggestionIndex(numeros, {
+            # Spelled as stored in hectareas first, so they work as filters
+            "cultivo": _unique_names(cultivos, (r[1] for r in CatalogoService.get_all_tipo_cultivo())),
+            "suelo": _unique_names(suelos, (r[1] for r in CatalogoService.get_all_tipo_suelo())),
+            "tipo_hortaliza": _unique_names(r[1] for r in CatalogoService.get_all_tipo_hortaliza()),
+            "clima": _unique_names(r[1] for r in CatalogoService.get_all_clima()),
+        })
+        with _lock:
+            _index = index
+            # A change during the build needs another one
+            _stale = generation != _generation
+        return len(index)
+
+    @staticmethod
+    def is_stale():
+        """Whether the data changed since the index was built."""
+        return _stale
+
+    @staticmethod
+    def suggest(texto, limit=SUGGESTION_LIMIT, kinds=None):
+        """Get (kind, value) suggestions for texto, numbers first.
+
+        kinds limits and orders the kinds listed (see SUGGESTION_KINDS).
+        """
+        if not texto.strip():
+            return []
+        return _index.suggest(texto, limit, kinds)
+
+    @staticmethod
+    def label(kind, value):
+        """Text shown for one suggestion, e.g. 'Cultivo: maíz'."""
+        if kind == "hectarea":
+            return f"{SUGGESTION_KINDS[kind]} {value}"
+        return f"{SUGGESTION_KINDS[kind]}: {value}"
@@ -0,0 +1,28 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from core.cycles import cycles
+from data import database
+from data.change_tracker import tracker
+from services import catalogo_service
+
+
+def _forget_cached_data():
+    """Drop every in-memory copy of database rows."""
+    for cache in catalogo_service._caches.values():
+        cache.invalidate()
+    cycles.invalidate()
+    tracker.close()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the application at a fresh, fully migrated database."""
+    database.close_pool()
+    monkeypatch.setattr(database, "DATABASE_PATH", str(tmp_path / "cultivos.db"))
+    _forget_cached_data()
+    database.initialize_db()
+    yield database.DATABASE_PATH
+    database.close_pool()
+    _forget_cached_data()
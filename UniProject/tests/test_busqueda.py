@@ -0,0 +1,38 @@
+"""Tests for the FTS5 search repository."""
+
+from data.database import connection
+from data.repositories.busqueda_repo import BusquedaRepository, fts_query
+
+
+def add_observaciones(textos):
+    with connection() as conn:
+        conn.executemany(
+            "INSERT INTO gestion_cultivo (id_persona, observaciones) VALUES (1, ?)",
+            [(texto,) for texto in textos]
+        )
+
+
+def test_fts_query_quotes_words_and_prefixes_the_last():
+    assert fts_query("plaga pul") == '"plaga" AND "pul"*'
+    assert fts_query("riego OR x") == '"riego" AND "OR" AND "x"'
+    assert fts_query("a") == '"a"'
+    assert fts_query("¿?") is None
+
+
+def test_best_match_is_found_among_every_match(db):
+    # The best-ranked row is the oldest of many matches
+    add_observaciones(["riego riego riego"])
+    add_observaciones([f"poda {i} abono compost surco riego helada granizo" for i in range(1500)])
+
+    results = BusquedaRepository.search("riego", tablas=["gestion_cultivo"], limit=5)
+    assert len(results) == 5
+    assert results[0][3] == "[riego] [riego] [riego]"
+    assert [row[4] for row in results] == sorted(row[4] for row in results)
+    assert BusquedaRepository.count("riego", "gestion_cultivo") == 1501
+
+
+def test_results_from_several_tables_are_merged_by_rank(db):
+    add_observaciones(["suelo franco con buen drenaje"])
+    results = BusquedaRepository.search("franco")
+    assert {row[0] for row in results} == {"tipo_suelo", "gestion_cultivo"}
+    assert [row[4] for row in results] == sorted(row[4] for row in results)
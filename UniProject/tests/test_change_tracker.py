@@ -0,0 +1,67 @@
+"""Tests for data.change_tracker.ChangeTracker."""
+
+import logging
+import sqlite3
+
+import pytest
+
+from data.change_tracker import ChangeTracker
+
+
+@pytest.fixture
+def tracker(db):
+    tracker = ChangeTracker()
+    yield tracker
+    tracker.close()
+
+
+def add_suelo(path, nombre):
+    """Commit from a connection of its own, as another process would."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("INSERT INTO tipo_suelo (nombre) VALUES (?)", (nombre,))
+    conn.close()
+
+
+def test_poll_reports_tables_changed_by_other_connections(db, tracker):
+    seen = []
+    tracker.subscribe("tipo_suelo", seen.append)
+    assert tracker.poll() == set()
+
+    add_suelo(db, "Volcánico")
+    assert tracker.poll() == {"tipo_suelo"}
+    assert seen == ["tipo_suelo"]
+    assert tracker.poll() == set()
+
+
+def test_failing_callback_does_not_stop_the_others(db, tracker, caplog):
+    seen = []
+
+    def broken(table):
+        raise RuntimeError("boom")
+
+    tracker.subscribe("tipo_suelo", broken)
+    tracker.subscribe("tipo_suelo", seen.append)
+    tracker.poll()
+
+    add_suelo(db, "Volcánico")
+    with caplog.at_level(logging.ERROR, logger="data.change_tracker"):
+        assert tracker.poll() == {"tipo_suelo"}
+    assert seen == ["tipo_suelo"]
+    assert "tipo_suelo" in caplog.text and "boom" in caplog.text
+
+
+def test_unsubscribe_stops_notifications(db, tracker):
+    seen = []
+    unsubscribe = tracker.subscribe("tipo_suelo", seen.append)
+    tracker.poll()
+    unsubscribe()
+
+    add_suelo(db, "Volcánico")
+    tracker.poll()
+    assert seen == []
+
+
+def test_subscribe_rejects_untracked_tables(tracker):
+    with pytest.raises(ValueError):
+        tracker.subscribe("recalculo_cosechas", print)
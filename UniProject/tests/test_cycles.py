@@ -0,0 +1,60 @@
+"""Tests for core.cycles.CycleRegistry."""
+
+from core.cycles import DEFAULT_CROP_ID, CycleRegistry
+from core.enums import DEFAULT_HARVEST_DAYS, DEFAULT_ROUTINE_HARVEST_DAYS
+
+
+ROWS = [
+    (1, "limones", 2, 2),
+    (2, "maíz", 4, 2),
+    (3, "Papas", None, None),
+]
+
+
+def registry(rows=ROWS):
+    return CycleRegistry(lambda: rows)
+
+
+def test_names_match_ignoring_accents_and_case():
+    cycles = registry()
+    assert cycles.crop_id("Maiz") == cycles.crop_id("maíz") == cycles.crop_id(" MAÍZ ")
+    assert cycles.cycle("Maiz") == (120, 60)
+
+
+def test_unknown_names_get_the_default_cycle_without_registering():
+    cycles = registry()
+    cycles.reload()
+    size = len(cycles.names)
+    assert cycles.crop_id("girasol") == DEFAULT_CROP_ID
+    assert cycles.cycle("girasol") == (DEFAULT_HARVEST_DAYS, DEFAULT_ROUTINE_HARVEST_DAYS)
+    assert cycles.ids_for(["girasol", "cebada", "girasol"]) == [DEFAULT_CROP_ID] * 3
+    assert len(cycles.names) == size
+
+
+def test_builtin_cycles_apply_to_crops_missing_from_the_table():
+    cycles = registry([])
+    assert cycles.cycle("Trigo") == (120, 30)
+    # Empty months in the table keep the default cycle
+    assert registry().cycle("papas") == (DEFAULT_HARVEST_DAYS, DEFAULT_ROUTINE_HARVEST_DAYS)
+
+
+def test_limones_rule_is_never_overridden():
+    cycles = registry()
+    assert cycles.is_limones("Limones")
+    assert cycles.cycle("limones") == (1825, 180)
+    assert not cycles.is_limones("maíz")
+
+
+def test_reload_keeps_ids_and_recompiles_cycles():
+    rows = list(ROWS)
+    cycles = registry(rows)
+    maiz = cycles.crop_id("maíz")
+    rows[1] = (2, "maíz", 1, 1)
+    cycles.invalidate()
+    assert cycles.crop_id("maiz") == maiz
+    assert cycles.cycle("maiz") == (30, 30)
+
+    rows.append((4, "Girasol", 5, 1))
+    cycles.invalidate()
+    assert cycles.crop_id("girasol") != DEFAULT_CROP_ID
+    assert cycles.cycle("Girasol") == (150, 30)
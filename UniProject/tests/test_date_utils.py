@@ -0,0 +1,57 @@
+"""Tests for utils.date_utils against datetime.strptime."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from utils.date_utils import (
+    ISO_FORMAT, format_date, format_iso, get_date_difference, parse_date, parse_iso, to_datetime64,
+)
+
+
+VALID = ["2024-01-01", "2024-02-29", "0001-01-01", "9999-12-31", "2024-1-5", "2024-01-5",
+         "２０２４-01-01"]
+INVALID = ["2023-02-29", "2024-13-01", "2024-00-10", "0000-01-01", "2024/01/01",
+           "24-01-01", "2024-01-01 ", "", "abc"]
+
+
+@pytest.mark.parametrize("value", VALID)
+def test_parse_iso_matches_strptime(value):
+    assert parse_iso(value) == datetime.strptime(value, ISO_FORMAT)
+
+
+@pytest.mark.parametrize("value", INVALID)
+def test_parse_iso_rejects_what_strptime_rejects(value):
+    with pytest.raises(ValueError) as expected:
+        datetime.strptime(value, ISO_FORMAT)
+    with pytest.raises(ValueError) as got:
+        parse_iso(value)
+    assert str(got.value) == str(expected.value)
+
+
+def test_parse_date_names_the_bad_value_and_other_formats_work():
+    with pytest.raises(ValueError, match="Invalid date format: 2023-02-30"):
+        parse_date("2023-02-30")
+    assert parse_date("29/02/2024", "%d/%m/%Y") == datetime(2024, 2, 29)
+
+
+def test_formatting_round_trips():
+    assert format_iso(date(2024, 2, 29)) == "2024-02-29"
+    assert format_iso(datetime(5, 1, 2)) == datetime(5, 1, 2).strftime(ISO_FORMAT)
+    assert format_date("2024-01-01") == "2024-01-01"
+    assert format_date(date(2024, 3, 1), "%d/%m/%Y") == "01/03/2024"
+    assert get_date_difference("2024-03-01", "2024-02-28") == 2
+
+
+def test_to_datetime64_converts_in_bulk_and_keeps_missing_values():
+    result = to_datetime64(["2024-02-29", None, "", "2024-1-5", "0001-01-01"])
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert [str(d) for d in result] == ["2024-02-29", "NaT", "NaT", "2024-01-05", "0001-01-01"]
+    assert len(to_datetime64([])) == 0
+
+
+@pytest.mark.parametrize("value", ["2023-02-30", "0000-01-01", "2024/01/01"])
+def test_to_datetime64_rejects_invalid_dates_by_name(value):
+    with pytest.raises(ValueError, match=value):
+        to_datetime64(["2024-01-01", value])
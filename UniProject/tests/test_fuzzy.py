@@ -0,0 +1,67 @@
+"""Tests for utils.fuzzy and CoincidenciaService against brute force."""
+
+import random
+
+import pytest
+
+from services.catalogo_service import CatalogoService
+from services.coincidencia_service import CoincidenciaService
+from utils.fuzzy import BKTree, levenshtein
+
+
+def reference(a, b):
+    """Levenshtein distance by the textbook dynamic programme."""
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+def random_words(rng, count, alphabet="abcñá", longest=8):
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randrange(longest + 1)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("", "", 0), ("", "maiz", 4), ("maiz", "", 4), ("maiz", "maíz", 1),
+    ("tomate", "tomaet", 2), ("limones", "limon", 2), ("kitten", "sitting", 3),
+])
+def test_levenshtein_known_distances(a, b, expected):
+    assert levenshtein(a, b) == levenshtein(b, a) == expected
+
+
+def test_levenshtein_matches_reference_including_long_patterns():
+    rng = random.Random(5)
+    words = random_words(rng, 150) + random_words(rng, 20, alphabet="ab", longest=90)
+    for a in words:
+        b = rng.choice(words)
+        assert levenshtein(a, b) == reference(a, b), (a, b)
+
+
+def test_bk_tree_search_matches_brute_force():
+    rng = random.Random(8)
+    words = random_words(rng, 400)
+    tree = BKTree(words)
+    assert len(tree) == len(set(words))
+    for query in random_words(rng, 60):
+        for k in (0, 1, 2, 3):
+            expected = sorted({(reference(query, w), w) for w in words if reference(query, w) <= k})
+            assert tree.search(query, k) == expected, (query, k)
+    assert BKTree().search("maiz", 2) == []
+
+
+def test_correct_prefers_exact_then_unambiguous_names(db):
+    assert CoincidenciaService.correct("tipo_cultivo", " MAIZ") == "maíz"
+    assert CoincidenciaService.correct("tipo_cultivo", "tomatw") == "tomate"
+    assert CoincidenciaService.correct("tipo_suelo", "arenozo") == "Arenoso"
+    assert CoincidenciaService.correct("tipo_cultivo", "zanahoria") is None
+    CatalogoService.create_tipo_cultivo("Tomato", None, None)
+    # tomate and Tomato are both one edit away
+    assert CoincidenciaService.correct("tipo_cultivo", "tomatu") is None
+    assert CoincidenciaService.correct("tipo_cultivo", "tomato") == "Tomato"
+    assert CoincidenciaService.suggest("tipo_cultivo", "tomat") == ["tomate", "Tomato"]
@@ -0,0 +1,57 @@
+"""Tests for the vectorized harvest schedule engine against Hectarea."""
+
+import itertools
+
+import numpy as np
+
+from core.harvest import compute_schedule, schedule_batch
+from core.models import Hectarea, HectareaBatch
+
+
+CROPS = ["maíz", "Maiz", "trigo", "tomate", "limones", "LIMONES", "girasol"]
+SIEMBRAS = ["2024-01-01", "2024-02-29", "2023-02-28", "2020-12-31", "9999-10-01"]
+SUPPLIED = [(None, None), ("2024-06-01", None), (None, "2024-07-01"), ("2024-06-01", "2024-07-01")]
+
+
+def scalar(tipo, siembra, primera, rutinaria):
+    """Dates Hectarea computes, or None where it raises."""
+    try:
+        h = Hectarea(0, tipo, siembra, primera, rutinaria).to_dict()
+    except (ValueError, OverflowError):
+        return None
+    return h["primera_cosecha"], h["cosecha_rutinaria"]
+
+
+def test_schedule_matches_hectarea_row_by_row(db):
+    cases = list(itertools.product(range(len(CROPS)), SIEMBRAS, SUPPLIED))
+    primera = [p or "NaT" for _, _, (p, _) in cases]
+    rutinaria = [r or "NaT" for _, _, (_, r) in cases]
+    first, routine, valid = compute_schedule(
+        [s for _, s, _ in cases], [c for c, _, _ in cases], CROPS, primera, rutinaria
+    )
+
+    for i, (code, siembra, (p, r)) in enumerate(cases):
+        expected = scalar(CROPS[code], siembra, p, r)
+        if expected is None:
+            assert not valid[i], cases[i]
+            assert np.isnat(first[i]) and np.isnat(routine[i])
+        else:
+            assert valid[i], cases[i]
+            assert (str(first[i]), str(routine[i])) == expected, cases[i]
+
+
+def test_limones_on_a_leap_day_is_invalid(db):
+    first, routine, valid = compute_schedule(["2024-02-29", "2024-03-01"], [0, 0], ["limones"])
+    assert valid.tolist() == [False, True]
+    assert str(first[1]) == "2029-03-01" and str(routine[1]) == "2029-08-28"
+
+
+def test_schedule_batch_recomputes_from_sowing_dates(db):
+    batch = HectareaBatch.from_rows([
+        (1, "maíz", "2024-01-01", "2000-01-01", "2000-01-01", None, None),
+        (2, "trigo", "2024-01-01", None, None, None, None),
+    ])
+    first, routine, valid = schedule_batch(batch)
+    assert valid.all()
+    assert [str(d) for d in first] == ["2024-03-31", "2024-04-30"]
+    assert [str(d) for d in routine] == ["2024-04-30", "2024-05-30"]
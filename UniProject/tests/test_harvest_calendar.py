@@ -0,0 +1,79 @@
+"""Tests for HarvestCalendar range queries against a brute-force expansion."""
+
+import random
+from datetime import date, timedelta
+
+from core.cycles import cycles
+from core.harvest_calendar import PRIMERA, RUTINARIA, HarvestCalendar, HarvestEvent
+from core.models import HectareaBatch
+from services.hectarea_service import HectareaService
+
+
+CROPS = ["maíz", "trigo", "tomate", "limones", "girasol"]
+
+
+def random_rows(count, seed=3):
+    rng = random.Random(seed)
+    rows = []
+    for numero in range(1, count + 1):
+        siembra = date(2023, 1, 1) + timedelta(days=rng.randrange(400))
+        primera = siembra + timedelta(days=rng.randrange(60, 200))
+        rutinaria = primera + timedelta(days=rng.randrange(10, 60))
+        # Some rows miss dates, as legacy rows may
+        rows.append((numero, rng.choice(CROPS), siembra.isoformat(),
+                     primera.isoformat() if numero % 7 else None,
+                     rutinaria.isoformat() if numero % 11 else None, None, None))
+    return rows
+
+
+def expand(rows, desde, hasta):
+    """Every harvest of rows in [desde, hasta], sorted like HarvestCalendar.events."""
+    events = []
+    for numero, tipo, _, primera, rutinaria, _, _ in rows:
+        if primera and desde <= date.fromisoformat(primera) <= hasta:
+            events.append(HarvestEvent(date.fromisoformat(primera), numero, tipo, PRIMERA))
+        if rutinaria:
+            day, period = date.fromisoformat(rutinaria), cycles.routine_days(tipo)
+            while day <= hasta:
+                if day >= desde:
+                    events.append(HarvestEvent(day, numero, tipo, RUTINARIA))
+                day += timedelta(days=period)
+    return sorted(events, key=lambda e: (e.fecha, e.numero, e.cosecha == RUTINARIA))
+
+
+def test_events_and_count_match_a_full_expansion(db):
+    rows = random_rows(300)
+    calendar = HarvestCalendar.from_batch(HectareaBatch.from_rows(rows))
+    for desde, hasta in [(date(2023, 1, 1), date(2023, 12, 31)),
+                         (date(2024, 3, 15), date(2024, 3, 15)),
+                         (date(2024, 6, 1), date(2026, 6, 1)),
+                         (date(2030, 1, 1), date(2029, 1, 1))]:
+        expected = expand(rows, desde, hasta)
+        assert list(calendar.events(desde, hasta)) == expected
+        assert calendar.count(desde, hasta) == len(expected)
+
+
+def test_routine_harvests_recur_with_the_crop_cycle(db):
+    calendar = HarvestCalendar.from_batch(HectareaBatch.from_rows([
+        (1, "maíz", "2024-01-01", "2024-03-31", "2024-04-30", None, None),
+        (2, "limones", "2024-01-01", None, "2024-01-10", None, None),
+    ]))
+    assert len(calendar) == 2
+    events = list(calendar.events("2024-03-31", "2024-07-10"))
+    assert [(e.fecha.isoformat(), e.numero, e.cosecha) for e in events] == [
+        ("2024-03-31", 1, PRIMERA),
+        ("2024-04-30", 1, RUTINARIA),
+        ("2024-05-30", 1, RUTINARIA),
+        ("2024-06-29", 1, RUTINARIA),
+        ("2024-07-08", 2, RUTINARIA),
+    ]
+
+
+def test_service_builds_the_calendar_from_stored_rows(db):
+    HectareaService.create_hectarea(1, "Maiz", "2024-01-01", "Franco", None)
+    events = list(HectareaService.harvest_events("2024-01-01", "2024-05-31"))
+    assert [(e.fecha.isoformat(), e.tipo_de_cultivo, e.cosecha) for e in events] == [
+        ("2024-03-31", "maíz", PRIMERA),
+        ("2024-04-30", "maíz", RUTINARIA),
+        ("2024-05-30", "maíz", RUTINARIA),
+    ]
@@ -0,0 +1,65 @@
+"""Tests for HectareaRepository bulk writes."""
+
+import pytest
+
+from data.database import connection
+from data.repositories.hectarea_repo import HectareaRepository
+
+
+ROW = ("maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 20.0)
+
+
+@pytest.fixture
+def rejecting(db):
+    """Make the database itself refuse rows sown on 1999-01-01."""
+    with connection() as conn:
+        for event in ("INSERT", "UPDATE"):
+            conn.execute(f"""
+                CREATE TRIGGER test_rechazo_{event.lower()} BEFORE {event} ON hectareas
+                WHEN new.siembra = '1999-01-01'
+                BEGIN SELECT RAISE(ABORT, 'rechazada'); END
+            """)
+    return db
+
+
+def numeros():
+    with connection() as conn:
+        return [r[0] for r in conn.execute("SELECT numero FROM hectareas ORDER BY numero")]
+
+
+def test_create_many_numbers_rows_contiguously(db):
+    assert HectareaRepository.create_many([ROW] * 3) == ([1, 2, 3], [])
+    assert HectareaRepository.create_many([ROW]) == ([4], [])
+    assert HectareaRepository.create_many([]) == ([], [])
+
+
+def test_create_many_reports_unknown_names_and_saves_the_rest(db):
+    rows = [ROW, ("girasol",) + ROW[1:], ROW[:4] + ("Pantanoso", None), ROW]
+    saved, errors = HectareaRepository.create_many(rows)
+    assert saved == [1, 2]
+    assert errors == [(1, "Unknown tipo_de_cultivo: girasol"), (2, "Unknown tipo_suelo: Pantanoso")]
+
+
+def test_create_many_retries_row_by_row_after_a_failed_batch(rejecting):
+    rows = [ROW, ("trigo", "1999-01-01") + ROW[2:], ROW, ROW]
+    saved, errors = HectareaRepository.create_many(rows)
+    # Nothing from the failed executemany survives; the retry keeps numeros contiguous
+    assert saved == [1, 2, 3]
+    assert errors == [(1, "rechazada")]
+    assert numeros() == [1, 2, 3]
+
+
+def test_upsert_many_overwrites_by_numero_and_retries_failed_batches(rejecting):
+    HectareaRepository.create_many([ROW] * 2)
+    saved, errors = HectareaRepository.upsert_many([
+        (2, "trigo", "2024-02-01", None, None, "Limoso", None),
+        (1, "trigo", "1999-01-01", None, None, "Limoso", None),
+        (5, "tomate", "2024-02-01", None, None, "girasol", None),
+        (7, "tomate", "2024-02-01", None, None, "Franco", None),
+    ])
+    assert saved == 2
+    assert errors == [(1, "rechazada"), (2, "Unknown tipo_suelo: girasol")]
+    assert numeros() == [1, 2, 7]
+    assert HectareaRepository.get_by_numero(1)["tipo_de_cultivo"] == "maíz"
+    assert HectareaRepository.get_by_numero(2)["tipo_suelo"] == "Limoso"
+
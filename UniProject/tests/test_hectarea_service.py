@@ -0,0 +1,39 @@
+"""Tests for HectareaService harvest dates and catalog name resolution."""
+
+from services.catalogo_service import CatalogoService
+from services.hectarea_service import HectareaService
+
+
+def fechas(numero):
+    row = HectareaService.get_hectarea(numero)
+    return row["tipo_de_cultivo"], row["primera_cosecha"], row["cosecha_rutinaria"]
+
+
+def test_name_variants_use_the_catalog_crop_cycle(db):
+    for numero, nombre in enumerate(("maíz", "Maiz", " MAÍZ"), 1):
+        assert HectareaService.create_hectarea(numero, nombre, "2024-01-01", "franco", None)["success"]
+        assert fechas(numero) == ("maíz", "2024-03-31", "2024-04-30")
+    assert HectareaService.harvest_cycle("Maiz") == HectareaService.harvest_cycle("maíz") == (90, 30)
+
+
+def test_batch_rows_use_the_catalog_crop_cycle(db):
+    CatalogoService.create_tipo_cultivo("Girasol", 4, 1)
+    result = HectareaService.create_many([
+        {"crop_type": "girasol", "siembra": "2024-01-01", "tipo_suelo": "Franco"},
+        {"crop_type": "TRIGO", "siembra": "2024-01-01", "tipo_suelo": "Franco"},
+    ])
+    assert result["success"] and result["errors"] == []
+    girasol, trigo = result["numeros"]
+    assert fechas(girasol) == ("girasol", "2024-04-30", "2024-05-30")
+    assert fechas(trigo) == ("trigo", "2024-04-30", "2024-05-30")
+
+    HectareaService.upsert_many([{"numero": trigo, "crop_type": "Maiz", "siembra": "2024-01-01",
+                                  "tipo_suelo": "Franco"}])
+    assert fechas(trigo) == ("maíz", "2024-03-31", "2024-04-30")
+
+
+def test_unknown_crops_are_rejected(db):
+    result = HectareaService.create_hectarea(1, "maizz", "2024-01-01", "Franco", None)
+    assert not result["success"]
+    assert "maizz" in result["error"]
+    assert HectareaService.get_hectarea(1) is None
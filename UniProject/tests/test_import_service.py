@@ -0,0 +1,66 @@
+"""Tests for services.import_service."""
+
+import json
+
+from services.catalogo_service import CatalogoService
+from services.import_service import ImportService
+
+
+def _suelos():
+    return {row[1]: row[2] for row in CatalogoService.get_tipo_suelo_full()}
+
+
+def test_catalog_reimport_updates_the_row_with_another_spelling(db):
+    before = len(_suelos())
+    report = ImportService.import_records("tipo_suelo", [
+        {"nombre": "arenoso", "descripcion": "Drena rápido."},
+        {"nombre": "FRANCO"},
+    ])
+    suelos = _suelos()
+    assert (report.saved, report.failed) == (2, 0)
+    assert len(suelos) == before
+    assert suelos["Arenoso"] == "Drena rápido."
+    assert suelos["Franco"] == "Suelos equilibrados."
+
+
+def test_catalog_import_twice_does_not_duplicate(db):
+    records = [{"nombre": "Volcánico", "descripcion": "Ceniza."}]
+    ImportService.import_records("tipo_suelo", records)
+    ImportService.import_records("tipo_suelo", [{"nombre": "volcanico"}])
+    assert [nombre for nombre in _suelos() if nombre.lower().startswith("volc")] == ["Volcánico"]
+
+
+def test_jsonl_errors_are_reported_by_file_line(db, tmp_path):
+    path = tmp_path / "suelos.jsonl"
+    path.write_text("\n".join([
+        json.dumps({"nombre": "Calizo"}),
+        "",
+        '{"nombre": ',
+        json.dumps(["Pedregoso"]),
+        json.dumps({"descripcion": "sin nombre"}),
+        json.dumps({"nombre": "Turboso"}),
+    ]) + "\n", encoding="utf-8")
+    report = ImportService.import_file("tipo_suelo", str(path))
+    assert report.saved == 2
+    assert [line for line, _ in report.errors] == [3, 4, 5]
+    assert report.errors[0][1].startswith("Invalid JSON")
+    assert report.errors[1][1] == "Expected an object per record"
+    assert report.errors[2][1] == "Missing field: nombre"
+
+
+def test_hectareas_with_unknown_names_are_rejected_per_row(db, tmp_path):
+    path = tmp_path / "hectareas.csv"
+    path.write_text(
+        "numero,crop_type,siembra,tipo_suelo,temperatura\n"
+        "1,maíz,2024-01-01,arcilloso,20\n"
+        "2,maizz,2024-01-01,Franco,20\n"
+        "3,trigo,2024-01-01,Pantano,\n",
+        encoding="utf-8"
+    )
+    report = ImportService.import_file("hectareas", str(path))
+    assert report.saved == 1
+    assert report.errors == [(3, "Unknown tipo_de_cultivo: maizz"), (4, "Unknown tipo_suelo: Pantano")]
+
+    report = ImportService.import_file("hectareas", str(path), correct_names=True)
+    assert report.saved == 2
+    assert [line for line, _ in report.errors] == [4]
@@ -0,0 +1,137 @@
+"""Tests for the versioned schema migrations."""
+
+import sqlite3
+
+import pytest
+
+from data import migrations
+from data.migrations import (
+    LATEST_VERSION, MIGRATIONS, MigrationError, get_version, migrate, pending_migrations,
+)
+
+
+HECTAREA_INSERT = (
+    "INSERT INTO hectareas (numero, tipo_de_cultivo, siembra, primera_cosecha, "
+    "cosecha_rutinaria, tipo_suelo, temperatura) VALUES (?, ?, '2024-01-01', NULL, NULL, ?, NULL)"
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """A raw connection to an empty database file, at user_version 0."""
+    conn = sqlite3.connect(str(tmp_path / "cultivos.db"))
+    yield conn
+    conn.close()
+
+
+def names(conn, sql):
+    return {row[0] for row in conn.execute(sql)}
+
+
+def test_upgrade_from_empty_applies_every_migration_once(conn):
+    assert [m.version for m in pending_migrations(conn)] == list(range(1, LATEST_VERSION + 1))
+    assert migrate(conn) == MIGRATIONS
+    assert get_version(conn) == LATEST_VERSION
+    assert pending_migrations(conn) == [] and migrate(conn) == []
+
+
+def test_upgrade_stops_at_the_target(conn):
+    assert [m.version for m in migrate(conn, target=6)] == [1, 2, 3, 4, 5, 6]
+    assert get_version(conn) == 6
+    assert [m.version for m in pending_migrations(conn)] == list(range(7, LATEST_VERSION + 1))
+    assert [m.version for m in pending_migrations(conn, target=8)] == [7, 8]
+
+
+def test_duplicated_numeros_stop_migration_2(conn):
+    migrate(conn, target=1)
+    conn.executemany(HECTAREA_INSERT, [(3, "trigo", None), (3, "maíz", None), (4, "trigo", None)])
+    conn.commit()
+    with pytest.raises(MigrationError) as error:
+        migrate(conn)
+    assert error.value.values == [3]
+    assert get_version(conn) == 1
+
+
+def test_migrations_2_to_6_add_indexes_counters_jobs_search_and_keys(conn):
+    migrate(conn, target=6)
+    indexes = names(conn, "SELECT name FROM sqlite_master WHERE type = 'index'")
+    assert {"idx_hectareas_numero", "idx_usuarios_email", "idx_gestion_cultivo_persona",
+            "idx_recalculo_cosechas_pendiente", "idx_tipo_cultivo_nombre_clave"} <= indexes
+
+    before = dict(conn.execute("SELECT tabla, version FROM cambios_tabla"))
+    assert set(before) == set(migrations.TRACKED_TABLES)
+    conn.execute("INSERT INTO usuarios (username, password, role) VALUES ('ana', 'x', 'usuario')")
+    conn.commit()
+    after = dict(conn.execute("SELECT tabla, version FROM cambios_tabla"))
+    assert after == {**before, "usuarios": before["usuarios"] + 1}
+
+    found = names(conn, "SELECT h.nombre FROM fts_tipo_hortaliza f "
+                        "JOIN tipo_hortaliza h ON h.codigo = f.rowid WHERE fts_tipo_hortaliza MATCH 'raices'")
+    assert found == {"Raíces comestibles"}
+    assert names(conn, "SELECT nombre_clave FROM tipo_hortaliza WHERE nombre = 'Tubérculos'") == {"tuberculos"}
+
+
+def test_migration_7_backfills_names_as_ids_in_chunks(conn):
+    migrate(conn, target=6)
+    conn.executemany(HECTAREA_INSERT, [
+        (1, "Maiz", "franco"), (2, "MAÍZ", "Volcánico"), (3, "Girasol", "Franco"),
+        (4, "girasól", None), (5, "", ""), (6, None, "volcanico"), (7, "trigo", "Arenoso"),
+    ])
+    conn.commit()
+    moved = []
+    migrate(conn, target=7, chunk_size=2, progress=lambda migration, rows: moved.append(rows))
+    assert moved == [2, 2, 2, 1]
+
+    rows = conn.execute("""
+        SELECT h.numero, c.nombre, s.nombre FROM hectareas h
+        LEFT JOIN tipo_cultivo c ON c.id = h.id_tipo_cultivo
+        LEFT JOIN tipo_suelo s ON s.codigo = h.id_tipo_suelo
+        ORDER BY h.numero
+    """).fetchall()
+    # Names missing from the catalogs are added once, in their smallest spelling
+    assert rows == [
+        (1, "maíz", "Franco"), (2, "maíz", "Volcánico"), (3, "Girasol", "Franco"),
+        (4, "Girasol", None), (5, None, None), (6, None, "Volcánico"), (7, "trigo", "Arenoso"),
+    ]
+    assert names(conn, "SELECT name FROM sqlite_master WHERE name LIKE '%hectareas_nueva%'") == set()
+
+
+def test_migration_7_keeps_writes_made_while_it_copies(conn):
+    migrate(conn, target=6)
+    conn.executemany(HECTAREA_INSERT, [(n, "trigo", "Franco") for n in range(1, 6)])
+    conn.commit()
+    # Stop after the first chunk, as an interrupted upgrade would
+    step = MIGRATIONS[6]
+    migrations._run_step(conn, step.version, step.apply)
+    migrations._run_step(conn, step.version, lambda cursor: step.backfill(cursor, 2))
+
+    conn.execute("UPDATE hectareas SET tipo_de_cultivo = 'Cebolla' WHERE numero = 1")
+    conn.execute("DELETE FROM hectareas WHERE numero = 2")
+    conn.execute(HECTAREA_INSERT, (6, "tomate", "Limoso"))
+    conn.commit()
+    migrate(conn, target=7, chunk_size=2)
+
+    rows = conn.execute("""
+        SELECT h.numero, c.nombre, s.nombre FROM hectareas h
+        JOIN tipo_cultivo c ON c.id = h.id_tipo_cultivo
+        JOIN tipo_suelo s ON s.codigo = h.id_tipo_suelo
+        ORDER BY h.numero
+    """).fetchall()
+    assert rows == [(1, "Cebolla", "Franco"), (3, "trigo", "Franco"), (4, "trigo", "Franco"),
+                    (5, "trigo", "Franco"), (6, "tomate", "Limoso")]
+
+
+def test_names_differing_in_accents_stop_migration_8(conn):
+    migrate(conn, target=7)
+    conn.execute("INSERT INTO tipo_suelo (nombre) VALUES ('ARENOSO')")
+    conn.commit()
+    with pytest.raises(MigrationError) as error:
+        migrate(conn)
+    assert error.value.values == ["tipo_suelo: Arenoso / ARENOSO"]
+    assert get_version(conn) == 7
+
+    conn.execute("DELETE FROM tipo_suelo WHERE nombre = 'ARENOSO'")
+    conn.commit()
+    migrate(conn)
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO tipo_suelo (nombre) VALUES ('arenoso')")
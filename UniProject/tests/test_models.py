@@ -0,0 +1,65 @@
+"""Tests for the hectarea domain models."""
+
+import math
+
+import pytest
+
+from core.models import HECTAREA_FIELDS, Hectarea, HectareaBatch, HectareaRecord
+
+
+ROWS = [
+    (1, "maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 21.5),
+    (2, "trigo", "2024-02-29", None, None, None, None),
+    (3, "maíz", "29/02/2024", "", "sin fecha", "Franco", "templado"),
+]
+
+
+def test_record_round_trips_a_stored_row():
+    record = HectareaRecord.from_row(ROWS[0])
+    assert record.to_row() == ROWS[0]
+    assert record.to_dict() == dict(zip(HECTAREA_FIELDS, ROWS[0]))
+    assert record == HectareaRecord.from_row(dict(zip(HECTAREA_FIELDS, ROWS[0])))
+    assert hash(record) == hash(HectareaRecord.from_row(ROWS[0]))
+
+
+def test_record_is_immutable_and_has_no_instance_dict():
+    record = HectareaRecord.from_row(ROWS[0])
+    with pytest.raises(AttributeError):
+        record.numero = 5
+    with pytest.raises(AttributeError):
+        del record.tipo_de_cultivo
+    assert not hasattr(record, "__dict__")
+
+
+def test_record_create_matches_hectarea(db):
+    record = HectareaRecord.create(7, "Tomate", "2024-01-01", temperatura="18")
+    expected = Hectarea(7, "tomate", "2024-01-01", temperatura=18).to_dict()
+    assert record.to_dict() == expected
+    assert HectareaRecord.create(8, "limones", "2024-01-01").primera_cosecha == "2029-01-01"
+
+
+def test_unreadable_legacy_values_become_missing():
+    record = HectareaRecord.from_row(ROWS[2])
+    assert (record.siembra, record.primera_cosecha, record.cosecha_rutinaria) == (None, None, None)
+    batch = HectareaBatch.from_rows(ROWS)
+    assert math.isnan(batch.temperatura[2])
+    assert batch[2].temperatura is None
+
+
+def test_batch_stores_columns_and_shares_names():
+    batch = HectareaBatch.from_rows(ROWS)
+    assert len(batch) == 3
+    assert batch.crops == ["maíz", "trigo"]
+    assert list(batch.crop_code) == [0, 1, 0]
+    assert batch.soils == [None, "Franco"]
+    assert list(batch.soil_code) == [1, 0, 1]
+    assert [record.to_row() for record in batch][:2] == ROWS[:2]
+    assert batch.nbytes == 3 * (8 + 2 + 4 + 4 + 4 + 2 + 8)
+
+
+def test_batch_append_extends_the_columns():
+    batch = HectareaBatch()
+    batch.append(ROWS[1])
+    batch.extend([ROWS[0]])
+    assert [record.numero for record in batch] == [2, 1]
+    assert batch[1] == HectareaRecord.from_row(ROWS[0])
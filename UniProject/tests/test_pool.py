@@ -0,0 +1,107 @@
+"""Tests for data.pool.ConnectionPool."""
+
+import threading
+
+import pytest
+
+from data import database
+from data.pool import ConnectionPool, PoolTimeoutError
+from data.repositories.hectarea_repo import HectareaRepository
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), pool_size=2, timeout=0.1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+    yield pool
+    pool.close_all()
+
+
+def count(pool):
+    with pool.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+
+def test_nested_block_shares_the_connection(pool):
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    assert pool.stats.reused >= 1
+
+
+def test_nested_success_does_not_commit_the_outer_block(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            with pool.connection() as inner:
+                inner.execute("INSERT INTO t VALUES (2)")
+            raise RuntimeError
+    assert count(pool) == 0
+
+
+def test_nested_error_does_not_roll_back_the_outer_block(pool):
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+        with pytest.raises(KeyError):
+            with pool.connection() as inner:
+                inner.execute("INSERT INTO t VALUES (2)")
+                raise KeyError
+        assert conn.in_transaction
+    assert count(pool) == 2
+
+
+def test_pooled_connection_context_commits_only_at_the_outermost_level(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            with pool.acquire() as inner:
+                inner.execute("INSERT INTO t VALUES (2)")
+            raise RuntimeError
+    assert count(pool) == 0
+
+
+def test_uncommitted_work_is_rolled_back_on_release(pool):
+    conn = pool.acquire()
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.close()
+    assert count(pool) == 0
+    assert pool.stats.rollbacks == 1
+
+
+def test_full_pool_times_out(pool):
+    release = threading.Event()
+    held = threading.Barrier(3)
+
+    def hold():
+        conn = pool.acquire()
+        held.wait()
+        release.wait()
+        conn.close()
+
+    threads = [threading.Thread(target=hold) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    held.wait()
+    try:
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_repository_writes_join_an_enclosing_block(db):
+    row = ("maíz", "2024-01-01", None, None, "Franco", None)
+    with pytest.raises(RuntimeError):
+        with database.connection():
+            assert HectareaRepository.create_many([row]) == ([1], [])
+            assert HectareaRepository.create_many([row]) == ([2], [])
+            raise RuntimeError
+    assert HectareaRepository.get_next_numero() == 1
+
+    with database.connection():
+        HectareaRepository.create_many([row])
+        HectareaRepository.upsert_many([(1,) + row])
+    assert HectareaRepository.get_next_numero() == 2
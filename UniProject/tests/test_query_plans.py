@@ -0,0 +1,98 @@
+"""EXPLAIN QUERY PLAN checks over the SQL the repositories actually run.
+
+Each case calls a repository method against a migrated database while the
+pooled connections record their statements; every recorded query must be
+served by indexes, except for a scan of the table that drives the loop
+when the method lists a whole table.
+"""
+
+import pytest
+
+from data import database
+from data.repositories.catalogo_repo import CatalogoRepository
+from data.repositories.hectarea_repo import HectareaRepository
+from data.repositories.recalculo_repo import RecalculoRepository
+from data.repositories.usuario_repo import UsuarioRepository
+
+
+_QUERY_VERBS = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+def _run_chunk():
+    maiz = CatalogoRepository.find_by_nombre("tipo_cultivo", "maíz")[0][0]
+    job_id = RecalculoRepository.enqueue(maiz, (90, 30), (120, 30))
+    RecalculoRepository.run_chunk(job_id, 1)
+    RecalculoRepository.run_chunk(job_id, 1)
+
+
+# (name, call, table alias allowed to be scanned as the driving table,
+#  indexes the plans must use). "numero IS NOT NULL" lets idx_hectareas_numero
+# serve any hectareas query as a range, so filtered pages name their index.
+CASES = [
+    ("HectareaRepository.get_by_numero", lambda: HectareaRepository.get_by_numero(1), None, ()),
+    ("HectareaRepository.delete", lambda: HectareaRepository.delete(99), None, ()),
+    ("HectareaRepository.update",
+     lambda: HectareaRepository.update(1, "maíz", "2024-01-01", None, None, "Franco", 20.0), None, ()),
+    ("HectareaRepository.get_next_numero", HectareaRepository.get_next_numero, None, ()),
+    ("HectareaRepository.fetch_page por cultivo",
+     lambda: HectareaRepository.fetch_page(limit=500, tipo_de_cultivo="Maiz"), None,
+     ("idx_tipo_cultivo_nombre_clave", "idx_hectareas_cultivo_numero")),
+    ("HectareaRepository.fetch_page por suelo",
+     lambda: HectareaRepository.fetch_page(after=1, limit=500, tipo_suelo="franco"), None,
+     ("idx_tipo_suelo_nombre_clave", "idx_hectareas_suelo_numero")),
+    ("HectareaRepository.create_many",
+     lambda: HectareaRepository.create_many([("trigo", "2024-01-01", None, None, "Limoso", None)]), None, ()),
+    ("RecalculoRepository.enqueue y run_chunk", _run_chunk, None, ("idx_hectareas_cultivo_numero",)),
+    ("UsuarioRepository.get_by_username", lambda: UsuarioRepository.get_by_username("admin"), None, ()),
+    ("UsuarioRepository.get_by_email", lambda: UsuarioRepository.get_by_email("a@b.c"), None, ()),
+    ("CatalogoRepository.find_by_nombre",
+     lambda: CatalogoRepository.find_by_nombre("tipo_suelo", "FRANCO"), None, ("idx_tipo_suelo_nombre_clave",)),
+    ("CatalogoRepository.search_by_prefix",
+     lambda: CatalogoRepository.search_by_prefix("tipo_cultivo", "ma", 10), None,
+     ("idx_tipo_cultivo_nombre_clave",)),
+    ("CatalogoRepository.get_gestion_cultivo_by_id",
+     lambda: CatalogoRepository.get_gestion_cultivo_by_id(1), None, ()),
+    ("CatalogoRepository.get_all_gestion_cultivo", CatalogoRepository.get_all_gestion_cultivo, "gc", ()),
+]
+
+
+def _scanned_tables(plan):
+    """Tables (or aliases) a plan walks in full, whether or not through an index."""
+    return [detail.split()[1] for detail in plan if detail.startswith("SCAN ")]
+
+
+@pytest.fixture
+def recorded(db, monkeypatch):
+    """List that receives every statement run on pooled connections."""
+    statements = []
+    on_connect = database._on_connect
+
+    def tracing(conn, profile):
+        on_connect(conn, profile)
+        conn.set_trace_callback(statements.append)
+
+    database.close_pool()
+    monkeypatch.setattr(database, "_on_connect", tracing)
+    HectareaRepository.create_many([
+        ("maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 20.0),
+        ("maíz", "2024-01-01", "2024-03-31", "2024-04-30", "Franco", 20.0),
+    ])
+    statements.clear()
+    return statements
+
+
+@pytest.mark.parametrize("name, call, driving, indexes", CASES, ids=[case[0] for case in CASES])
+def test_repository_queries_use_indexes(recorded, name, call, driving, indexes):
+    call()
+    queries = [sql for sql in recorded if sql.lstrip().upper().startswith(_QUERY_VERBS)]
+    assert queries, f"{name} ran no queries"
+    with database.connection() as conn:
+        conn.set_trace_callback(None)
+        plans = {sql: [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)] for sql in queries}
+    for sql, plan in plans.items():
+        scans = _scanned_tables(plan)
+        allowed = [driving] if driving else []
+        assert scans in ([], allowed), f"{name} scans {scans}:\n{sql}\n" + "\n".join(plan)
+    used = " ".join(detail for plan in plans.values() for detail in plan)
+    for index in indexes:
+        assert f"INDEX {index} " in used, f"{name} does not use {index}"
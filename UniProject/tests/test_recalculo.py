@@ -0,0 +1,65 @@
+"""Tests for harvest recalculation jobs after crop cycle changes."""
+
+import json
+import sqlite3
+
+from data.migrations import migrate
+from data.repositories.hectarea_repo import HectareaRepository
+from services.catalogo_service import CatalogoService
+from services.hectarea_service import HectareaService
+from services.recalculo_service import RecalculoService
+
+
+def maiz_id():
+    return CatalogoService.find_catalog("tipo_cultivo", "maíz")[0][0]
+
+
+def test_cycle_change_rewrites_computed_dates_by_crop_id(db):
+    for numero, nombre in ((1, "maíz"), (2, "Maiz")):
+        assert HectareaService.create_hectarea(numero, nombre, "2024-01-01", "Franco", None)["success"]
+    assert HectareaService.create_hectarea(3, "maíz", "2024-01-01", "Franco", None,
+                                           "2024-02-01", "2024-03-01")["success"]
+
+    # Renaming in the same write must not lose the job
+    CatalogoService.update_tipo_cultivo(maiz_id(), "MAÍZ", 4, 1)
+    jobs = RecalculoService.get_pending()
+    assert [(job["id_tipo_cultivo"], job["tipo_de_cultivo"], job["total"]) for job in jobs] == [
+        (maiz_id(), "MAÍZ", 3)
+    ]
+
+    result = RecalculoService.run_pending(chunk_size=2)
+    assert result == {"success": True, "actualizadas": 2, "completo": True}
+    fechas = {h["numero"]: (h["primera_cosecha"], h["cosecha_rutinaria"])
+              for h in HectareaRepository.iter_all()}
+    assert fechas[1] == fechas[2] == ("2024-04-30", "2024-05-30")
+    assert fechas[3] == ("2024-02-01", "2024-03-01")
+    assert RecalculoService.get_pending() == []
+
+
+def test_enqueue_merges_pending_changes_of_one_crop(db):
+    HectareaService.create_hectarea(1, "maíz", "2024-01-01", "Franco", None)
+    first = RecalculoService.enqueue(maiz_id(), (90, 30), (120, 30))
+    second = RecalculoService.enqueue(maiz_id(), (120, 30), (60, 30))
+    assert first == second
+    job, = RecalculoService.get_pending()
+    assert json.loads(job["origenes"]) == [[90, 30], [120, 30]]
+    assert (job["dias_primera"], job["dias_rutinaria"]) == (60, 30)
+
+
+def test_migration_keys_pending_jobs_on_crop_id(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "cultivos.db"))
+    migrate(conn, target=8)
+    conn.executemany(
+        "INSERT INTO recalculo_cosechas (tipo_de_cultivo, origenes, dias_primera, dias_rutinaria, total) "
+        "VALUES (?, ?, ?, ?, 1)",
+        [("maíz", "[[90, 30]]", 100, 30), ("Maiz", "[[100, 30]]", 120, 30), ("girasol", "[[80, 20]]", 90, 20)]
+    )
+    conn.commit()
+    migrate(conn)
+
+    maiz = conn.execute("SELECT id FROM tipo_cultivo WHERE nombre = 'maíz'").fetchone()[0]
+    pending = conn.execute(
+        "SELECT id_tipo_cultivo, origenes, dias_primera FROM recalculo_cosechas WHERE terminado IS NULL"
+    ).fetchall()
+    assert pending == [(maiz, "[[90, 30], [100, 30]]", 120)]
+    conn.close()
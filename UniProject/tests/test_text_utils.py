@@ -0,0 +1,67 @@
+"""Tests for folded names: fold(), fold_sql() and the nombre_clave lookups."""
+
+import sqlite3
+
+import pytest
+
+from data.migrations import FOLDED_NAME_TABLES
+from data.repositories.catalogo_repo import CatalogoRepository
+from utils.text_utils import FOLD_MAP, fold, fold_sql
+
+
+NAMES = ["Maíz", "MAÍZ", "maiz", "  Limón ", "Cigüeña", "ÑANDÚ", "Raíces comestibles",
+         "Tubérculos", "Ärger", "straße", "İstanbul", "", "   ", "\tTrigo\t", "ÁÉÍÓÚÜÑ áéíóúüñ"]
+
+
+@pytest.fixture
+def plain():
+    """A connection with no Python functions registered, like the legacy screens use."""
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+def test_fold_ignores_spanish_accents_and_case():
+    assert fold("  Maíz ") == fold("MAIZ") == "maiz"
+    assert fold("Cigüeña") == "ciguena"
+    assert fold(None) is None
+    # Only spaces are trimmed and only ASCII letters are lowercased, as in SQL
+    assert fold("\tÄrger ") == "\tÄrger"
+
+
+@pytest.mark.parametrize("name", NAMES + sorted(FOLD_MAP))
+def test_fold_sql_matches_fold(plain, name):
+    assert plain.execute(f"SELECT {fold_sql('?')}", (name,)).fetchone()[0] == fold(name)
+    assert plain.execute(f"SELECT {fold_sql('?')}", (None,)).fetchone()[0] is None
+
+
+def test_nombre_clave_is_computed_by_sqlite(db):
+    conn = sqlite3.connect(db)
+    try:
+        conn.execute("INSERT INTO tipo_hortaliza (nombre, descripcion, imagen) VALUES ('Ñame Ácido', '', '')")
+        conn.commit()
+        for table in FOLDED_NAME_TABLES:
+            for nombre, clave in conn.execute(f"SELECT nombre, nombre_clave FROM {table}"):
+                assert clave == fold(nombre), table
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT codigo FROM tipo_hortaliza WHERE nombre_clave = ?", ("x",)
+        ).fetchall()
+        assert "idx_tipo_hortaliza_nombre_clave" in plan[0][3]
+    finally:
+        conn.close()
+
+
+def test_find_by_nombre_ignores_accents_and_case(db):
+    rows = CatalogoRepository.find_by_nombre("tipo_hortaliza", " RAICES Comestibles")
+    assert [row[1] for row in rows] == ["Raíces comestibles"]
+    assert CatalogoRepository.find_by_nombre("tipo_hortaliza", "Raices") == []
+    assert [row[1] for row in CatalogoRepository.find_by_nombre("clima", "polar")] == ["Polar"]
+
+
+def test_search_by_prefix_returns_folded_order(db):
+    CatalogoRepository.create_tipo_hortaliza("Tubérculos de invierno", "", "")
+    CatalogoRepository.create_tipo_hortaliza("Tuna", "", "")
+    names = [row[1] for row in CatalogoRepository.search_by_prefix("tipo_hortaliza", "TUB")]
+    assert names == ["Tubérculos", "Tubérculos de invierno"]
+    assert [row[1] for row in CatalogoRepository.search_by_prefix("tipo_hortaliza", "tu", limit=1)] == ["Tubérculos"]
+    assert CatalogoRepository.search_by_prefix("tipo_hortaliza", " ") == []
@@ -0,0 +1,152 @@
+"""Query executor - Run service calls off the GUI thread."""
+
+import sys
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from config.settings import QUERY_THREADS
+
+
+class CallStats:
+    """Counters and latencies for the calls submitted under one key."""
+
+    FIELDS = ("calls", "completed", "dropped", "errors")
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+        self.wait_ms = 0.0
+
+    def record(self, wait, run):
+        """Add one finished call's queue wait and run time (seconds)."""
+        run_ms = run * 1000
+        self.last_ms = run_ms
+        self.max_ms = max(self.max_ms, run_ms)
+        self.total_ms += run_ms
+        self.wait_ms += wait * 1000
+
+    def snapshot(self):
+        """Return the current counters as a dictionary."""
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data.update(last_ms=self.last_ms, max_ms=self.max_ms,
+                    total_ms=self.total_ms, wait_ms=self.wait_ms)
+        return data
+
+
+class _Relay(QObject):
+    """Carries results from worker threads to the executor's thread."""
+
+    done = pyqtSignal(object, int, object, object, float, float)
+
+
+class _Call(QRunnable):
+    """One submitted call; skips itself if superseded before it starts."""
+
+    def __init__(self, executor, key, generation, fn, args, kwargs):
+        super().__init__()
+        self._executor = executor
+        self._relay = executor._relay
+        self._key = key
+        self._generation = generation
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._queued = time.perf_counter()
+
+    def run(self):
+        start = time.perf_counter()
+        wait = start - self._queued
+        if not self._executor.is_current(self._key, self._generation):
+            self._relay.done.emit(self._key, self._generation, None, None, wait, 0.0)
+            return
+        result = error = None
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            error = e
+        self._relay.done.emit(self._key, self._generation, result, error,
+                              wait, time.perf_counter() - start)
+
+
+class QueryExecutor(QObject):
+    """Runs service calls on a thread pool and delivers results on the GUI thread.
+
+    Calls are grouped by key: submitting again under a key supersedes the
+    previous call, whose result is dropped (or which is skipped if it has
+    not started yet), so a screen only ever shows its newest data.
+    """
+
+    call_finished = pyqtSignal(object, float, float)
+
+    def __init__(self, max_threads=QUERY_THREADS, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._relay = _Relay(self)
+        self._relay.done.connect(self._on_done)
+        self._current = {}
+        self._stats = {}
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, **kwargs):
+        """Run fn(*args, **kwargs) in the pool and pass its result to on_result.
+
+        Errors go to on_error(exception), or to sys.excepthook when no
+        handler is given. Returns the generation number of this call.
+        """
+        generation = self._current.get(key, (0,))[0] + 1
+        self._current[key] = (generation, on_result, on_error)
+        self._stats.setdefault(key, CallStats()).calls += 1
+        self._pool.start(_Call(self, key, generation, fn, args, kwargs))
+        return generation
+
+    def cancel(self, key):
+        """Drop the pending result for key, skipping the call if not started."""
+        if key in self._current:
+            generation = self._current[key][0]
+            self._current[key] = (generation + 1, None, None)
+
+    def is_current(self, key, generation):
+        """Whether generation is still the newest call for key."""
+        return self._current.get(key, (0,))[0] == generation
+
+    def wait(self, msecs=-1):
+        """Block until every queued call has run; returns False on timeout."""
+        return self._pool.waitForDone(msecs)
+
+    def stats(self):
+        """Get the per-key counters and latencies."""
+        return {key: stats.snapshot() for key, stats in self._stats.items()}
+
+    def _on_done(self, key, generation, result, error, wait, run):
+        stats = self._stats[key]
+        current, on_result, on_error = self._current.get(key, (0, None, None))
+        if generation != current:
+            stats.dropped += 1
+            return
+        stats.record(wait, run)
+        self.call_finished.emit(key, wait, run)
+        if error is not None:
+            stats.errors += 1
+            if on_error is not None:
+                on_error(error)
+            else:
+                sys.excepthook(type(error), error, error.__traceback__)
+            return
+        stats.completed += 1
+        if on_result is not None:
+            on_result(result)
+
+
+_executor = None
+
+
+def query_executor():
+    """Get the application's shared executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = QueryExecutor()
+    return _executor
@@ -0,0 +1,25 @@
+"""Harvest recalculation - Background thread finishing pending jobs."""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from services.recalculo_service import RecalculoService
+
+
+class RecalculoWorker(QThread):
+    """Thread that runs RecalculoService.run_pending and reports progress."""
+
+    progress = pyqtSignal(str, int, int)
+    done = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the current chunk; the job resumes on the next run."""
+        self._cancelled = True
+
+    def run(self):
+        self.done.emit(RecalculoService.run_pending(
+            progress=self.progress.emit, cancelled=lambda: self._cancelled
+        ))
@@ -8,6 +8,8 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 from services.catalogo_service import CatalogoService
+from services.change_service import ChangeService
+from ui.executor import query_executor
 
 
 class TipoHortalizaManagementScreen(QWidget):
@@ -60,12 +62,17 @@ class TipoHortalizaManagementScreen(QWidget):
         self.setLayout(layout)
         self.cargar_hortalizas()
         self.list_hortalizas.itemClicked.connect(self.cargar_en_formulario)
+        # Unsubscribe with the widget so the tracker does not call into a deleted screen
+        self.destroyed.connect(ChangeService.subscribe("tipo_hortaliza", lambda table: self.cargar_hortalizas()))
     
     def cargar_hortalizas(self):
-        """Load vegetable types."""
+        """Load vegetable types in the background."""
+        query_executor().submit("admin_catalog.hortalizas", CatalogoService.get_tipo_hortaliza_full,
+                                on_result=self._mostrar_hortalizas)
+    
+    def _mostrar_hortalizas(self, rows):
+        """Fill the vegetable type list."""
         self.list_hortalizas.clear()
-        rows = CatalogoService.get_tipo_hortaliza_full()
-        
         for r in rows:
             self.list_hortalizas.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]}")
     
@@ -187,12 +194,16 @@ class TipoSueloManagementScreen(QWidget):
         self.setLayout(layout)
         self.cargar_suelos()
         self.list_suelos.itemClicked.connect(self.cargar_en_formulario)
+        self.destroyed.connect(ChangeService.subscribe("tipo_suelo", lambda table: self.cargar_suelos()))
     
     def cargar_suelos(self):
-        """Load soil types."""
+        """Load soil types in the background."""
+        query_executor().submit("admin_catalog.suelos", CatalogoService.get_tipo_suelo_full,
+                                on_result=self._mostrar_suelos)
+    
+    def _mostrar_suelos(self, rows):
+        """Fill the soil type list."""
         self.list_suelos.clear()
-        rows = CatalogoService.get_tipo_suelo_full()
-        
         for r in rows:
             self.list_suelos.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]}")
     
@@ -316,12 +327,16 @@ class ClimaManagementScreen(QWidget):
         self.setLayout(layout)
         self.cargar_climas()
         self.list_climas.itemClicked.connect(self.cargar_en_formulario)
+        self.destroyed.connect(ChangeService.subscribe("clima", lambda table: self.cargar_climas()))
     
     def cargar_climas(self):
-        """Load climate types."""
+        """Load climate types in the background."""
+        query_executor().submit("admin_catalog.climas", CatalogoService.get_clima_full,
+                                on_result=self._mostrar_climas)
+    
+    def _mostrar_climas(self, rows):
+        """Fill the climate type list."""
         self.list_climas.clear()
-        rows = CatalogoService.get_clima_full()
-        
         for r in rows:
             self.list_climas.addItem(f"{r[0]} | {r[1]} | {r[2]} | {r[3]} | {r[4]}")
     
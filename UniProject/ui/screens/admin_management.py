@@ -10,6 +10,8 @@ from PyQt5.QtCore import Qt
 
 from services.auth_service import AuthService
 from services.catalogo_service import CatalogoService
+from services.change_service import ChangeService
+from ui.executor import query_executor
 
 
 class UserManagementScreen(QWidget):
@@ -31,6 +33,7 @@ class UserManagementScreen(QWidget):
         self.user_list = QListWidget()
         layout.addWidget(self.user_list)
         self.refresh_user_list()
+        self.destroyed.connect(ChangeService.subscribe("usuarios", lambda table: self.refresh_user_list()))
         
         form_layout = QFormLayout()
         
@@ -65,10 +68,13 @@ class UserManagementScreen(QWidget):
         self.setLayout(layout)
     
     def refresh_user_list(self):
-        """Refresh user list."""
+        """Refresh user list in the background."""
+        query_executor().submit("admin_management.usuarios", AuthService.get_all_users_details,
+                                on_result=self._mostrar_usuarios)
+    
+    def _mostrar_usuarios(self, users):
+        """Fill the user list."""
         self.user_list.clear()
-        users = AuthService.get_all_users_details()
-        
         for user in users:
             self.user_list.addItem(f"{user[0]} - {user[1] if user[1] else ''}")
     
@@ -170,6 +176,7 @@ class GestionCultivoScreen(QWidget):
         self.gestion_list = QListWidget()
         layout.addWidget(self.gestion_list)
         self.cargar_gestiones()
+        self.destroyed.connect(ChangeService.subscribe("gestion_cultivo", lambda table: self.cargar_gestiones()))
         
         btn_editar = QPushButton("Editar Seleccionada")
         btn_editar.clicked.connect(self.editar_gestion)
@@ -186,10 +193,13 @@ class GestionCultivoScreen(QWidget):
         self.setLayout(layout)
     
     def cargar_gestiones(self):
-        """Load cultivation management records."""
+        """Load cultivation management records in the background."""
+        query_executor().submit("admin_management.gestiones", CatalogoService.get_gestion_cultivo_raw,
+                                on_result=self._mostrar_gestiones)
+    
+    def _mostrar_gestiones(self, gestiones):
+        """Fill the cultivation management list."""
         self.gestion_list.clear()
-        gestiones = CatalogoService.get_gestion_cultivo_raw()
-        
         for g in gestiones:
             self.gestion_list.addItem(
                 f"Código: {g[0]} | Persona ID: {g[1]} | Hortaliza ID: {g[2]} | "
@@ -1,10 +1,17 @@
 """Profile and reporting screens."""
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit
+import html
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit, QComboBox
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
+from services.busqueda_service import BusquedaService, SEARCH_SOURCES
 from services.catalogo_service import CatalogoService
+from services.report_service import ReportService
+from ui.executor import query_executor
+from ui.widgets.report_view import ReportView
+from ui.widgets.search_completer import IncrementalSearch
 
 
 class PerfilScreen(QWidget):
@@ -49,30 +56,27 @@ class InformeScreen(QWidget):
         title.setFont(QFont("Helvetica", 18, QFont.Bold))
         layout.addWidget(title, alignment=Qt.AlignCenter)
         
-        self.informe_area = QTextEdit()
-        self.informe_area.setReadOnly(True)
+        self.informe_area = ReportView()
         layout.addWidget(self.informe_area)
         
         btn_volver = QPushButton("Volver")
-        btn_volver.clicked.connect(lambda: self.controller.show_screen("main"))
+        btn_volver.clicked.connect(self.volver)
         layout.addWidget(btn_volver, alignment=Qt.AlignCenter)
         
         self.setLayout(layout)
     
     def cargar_informe(self):
-        """Load and display crop management report."""
-        self.informe_area.clear()
-        registros = CatalogoService.get_all_gestion_cultivo()
-        
-        if registros:
-            texto = ""
-            for r in registros:
-                texto += (f"Código: {r[0]}\nUsuario: {r[1]}\nTipo Hortaliza: {r[2]}\n"
-                         f"Tipo Suelo: {r[3]}\nClima: {r[4]}\nVideo: {r[5]}\n"
-                         f"Observaciones: {r[6]}\n" + "-" * 40 + "\n")
-            self.informe_area.setPlainText(texto)
-        else:
-            self.informe_area.setPlainText("No hay registros de gestión cultivo.")
+        """Stream the crop management report into the report area."""
+        self.informe_area.load(
+            ReportService.iter_gestion_report,
+            ReportService.count_gestion_report,
+            empty_text="No hay registros de gestión cultivo."
+        )
+    
+    def volver(self):
+        """Stop the report and go back to the main screen."""
+        self.informe_area.cancel()
+        self.controller.show_screen("main")
 
 
 class ConsultaScreen(QWidget):
@@ -91,8 +95,19 @@ class ConsultaScreen(QWidget):
         
         self.entry_consulta = QLineEdit()
         self.entry_consulta.setPlaceholderText("Ingrese el nombre del tipo de hortaliza")
+        self.entry_consulta.returnPressed.connect(self.buscar_tipo)
         layout.addWidget(self.entry_consulta)
         
+        self.combo_ambito = QComboBox()
+        self.combo_ambito.addItem("Tipos de hortaliza (nombre)", None)
+        self.combo_ambito.addItem("Todo: catálogos y observaciones", "todo")
+        self.combo_ambito.currentIndexChanged.connect(self._cambiar_ambito)
+        layout.addWidget(self.combo_ambito)
+        
+        self.busqueda = IncrementalSearch(self.entry_consulta, query_executor(), kinds=("tipo_hortaliza",))
+        self.busqueda.selected.connect(lambda kind, value: self.buscar_tipo())
+        self.busqueda.prepare()
+        
         btn_buscar = QPushButton("Buscar")
         btn_buscar.clicked.connect(self.buscar_tipo)
         layout.addWidget(btn_buscar, alignment=Qt.AlignCenter)
@@ -107,6 +122,13 @@ class ConsultaScreen(QWidget):
         
         self.setLayout(layout)
     
+    def _cambiar_ambito(self):
+        """Suggest the names the selected scope searches."""
+        if self.combo_ambito.currentData() == "todo":
+            self.busqueda.set_kinds(("tipo_hortaliza", "suelo", "clima"))
+        else:
+            self.busqueda.set_kinds(("tipo_hortaliza",))
+    
     def buscar_tipo(self):
         """Search for vegetable type."""
         from PyQt5.QtWidgets import QMessageBox
@@ -116,6 +138,10 @@ class ConsultaScreen(QWidget):
             QMessageBox.critical(self, "Error", "Ingrese un nombre para consultar.")
             return
         
+        if self.combo_ambito.currentData() == "todo":
+            self.mostrar_coincidencias(BusquedaService.search(nombre, start="\x02", end="\x03"))
+            return
+        
         registros = CatalogoService.search_hortaliza(nombre)
         
         self.result_area.clear()
@@ -127,3 +153,15 @@ class ConsultaScreen(QWidget):
             self.result_area.setPlainText(texto)
         else:
             self.result_area.setPlainText("No se encontró el tipo de cultivo.")
+    
+    def mostrar_coincidencias(self, resultados):
+        """Show ranked matches with the matched words in bold."""
+        if not resultados:
+            self.result_area.setPlainText("No se encontraron coincidencias.")
+            return
+        bloques = []
+        for tabla, codigo, titulo, fragmento, _ in resultados:
+            fragmento = html.escape(fragmento).replace("\x02", "<b>").replace("\x03", "</b>")
+            bloques.append(f"<p><i>{SEARCH_SOURCES[tabla]}</i> — <b>{html.escape(titulo)}</b> "
+                           f"(código {codigo})<br>{fragmento}</p>")
+        self.result_area.setHtml("".join(bloques))
@@ -10,6 +10,10 @@ from PyQt5.QtCore import Qt
 from core.models import Hectarea
 from services.hectarea_service import HectareaService
 from services.catalogo_service import CatalogoService
+from services.change_service import ChangeService
+from services.sugerencia_service import SUGGESTION_KINDS
+from ui.executor import query_executor
+from ui.widgets.search_completer import IncrementalSearch
 
 
 class RegistrarScreen(QWidget):
@@ -18,7 +22,10 @@ class RegistrarScreen(QWidget):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        self._opciones_pendientes = True
         self._setup_ui()
+        self.destroyed.connect(ChangeService.subscribe("tipo_cultivo", self._marcar_opciones_pendientes))
+        self.destroyed.connect(ChangeService.subscribe("tipo_suelo", self._marcar_opciones_pendientes))
     
     def _setup_ui(self):
         """Setup UI components."""
@@ -55,12 +62,18 @@ class RegistrarScreen(QWidget):
         self.setLayout(layout)
     
     def showEvent(self, event):
-        """Load options when screen is shown."""
+        """Load options the first time the screen is shown or after they changed."""
         super().showEvent(event)
-        self.cargar_opciones()
+        if self._opciones_pendientes:
+            self.cargar_opciones()
+    
+    def _marcar_opciones_pendientes(self, table):
+        """Reload options on the next show after crop or soil types change."""
+        self._opciones_pendientes = True
     
     def cargar_opciones(self):
         """Load crop and soil type options."""
+        self._opciones_pendientes = False
         self.combo_crop.clear()
         crop_types = CatalogoService.get_all_tipo_cultivo()
         crop_names = [r[1] for r in crop_types] if crop_types else ["limones", "maíz", "trigo", "tomate"]
@@ -113,9 +126,15 @@ class BuscarScreen(QWidget):
         layout.addWidget(title, alignment=Qt.AlignCenter)
         
         self.entry_numero = QLineEdit()
-        self.entry_numero.setPlaceholderText("Número de Hectárea")
+        self.entry_numero.setPlaceholderText("Número de Hectárea, cultivo o tipo de suelo")
+        self.entry_numero.returnPressed.connect(self.buscar_hectarea)
         layout.addWidget(self.entry_numero)
         
+        self.busqueda = IncrementalSearch(self.entry_numero, query_executor(),
+                                          kinds=("hectarea", "cultivo", "suelo"))
+        self.busqueda.selected.connect(self.mostrar_sugerencia)
+        self.busqueda.prepare()
+        
         btn_buscar = QPushButton("Buscar")
         btn_buscar.clicked.connect(self.buscar_hectarea)
         layout.addWidget(btn_buscar, alignment=Qt.AlignCenter)
@@ -134,7 +153,7 @@ class BuscarScreen(QWidget):
         """Handle hectarea search."""
         num_text = self.entry_numero.text().strip()
         
-        if not num_text.isdigit():
+        if not (num_text.isascii() and num_text.isdigit()):
             self.result_area.setText("Ingrese un número válido.")
             return
         
@@ -148,3 +167,17 @@ class BuscarScreen(QWidget):
             self.result_area.setText(texto)
         else:
             self.result_area.setText(f"No se encontró la Hectárea {num_text}.")
+    
+    def mostrar_sugerencia(self, kind, value):
+        """Show the hectarea, or the first hectareas with the crop/soil, picked from the suggestions."""
+        if kind == "hectarea":
+            self.buscar_hectarea()
+            return
+        filtro = {"cultivo": "tipo_de_cultivo", "suelo": "tipo_suelo"}[kind]
+        filas = HectareaService.fetch_page(limit=21, columns=("numero",), **{filtro: value})
+        numeros = ", ".join(str(fila["numero"]) for fila in filas[:20])
+        if not filas:
+            self.result_area.setText(f"No hay hectáreas con {SUGGESTION_KINDS[kind].lower()} {value}.")
+        else:
+            resto = "…" if len(filas) > 20 else ""
+            self.result_area.setText(f"Hectáreas con {SUGGESTION_KINDS[kind].lower()} {value}: {numeros}{resto}")
@@ -9,6 +9,8 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 from services.auth_service import AuthService
+from services.change_service import ChangeService
+from ui.executor import query_executor
 
 
 class LoginScreen(QWidget):
@@ -34,6 +36,7 @@ class LoginScreen(QWidget):
         self.users_list = QListWidget()
         layout.addWidget(self.users_list)
         self.refresh_users()
+        self.destroyed.connect(ChangeService.subscribe("usuarios", lambda table: self.refresh_users()))
         
         btn_recuperar = QPushButton("Recuperar Contraseña")
         btn_recuperar.clicked.connect(self.recuperar_contrasena)
@@ -43,9 +46,13 @@ class LoginScreen(QWidget):
         self.setLayout(layout)
     
     def refresh_users(self):
-        """Refresh user list."""
+        """Refresh user list in the background."""
+        query_executor().submit("login.usuarios", AuthService.get_all_users,
+                                on_result=self._mostrar_usuarios)
+    
+    def _mostrar_usuarios(self, users):
+        """Fill the user list."""
         self.users_list.clear()
-        users = AuthService.get_all_users()
         for u in users:
             self.users_list.addItem(u[1])
     
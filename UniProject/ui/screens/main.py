@@ -1,12 +1,14 @@
 """Main screen - Primary application interface."""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
 )
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
-from services.hectarea_service import HectareaService
+from services.change_service import ChangeService
+from ui.executor import query_executor
+from ui.widgets.hectarea_table import HectareaTableView
 
 
 class MainScreen(QWidget):
@@ -56,9 +58,15 @@ class MainScreen(QWidget):
         main_layout.addLayout(menu_layout)
         
         # Content area
-        self.content_area = QTextEdit()
-        self.content_area.setReadOnly(True)
-        main_layout.addWidget(self.content_area)
+        self.empty_label = QLabel("No hay hectáreas registradas.")
+        self.empty_label.hide()
+        main_layout.addWidget(self.empty_label, alignment=Qt.AlignCenter)
+        
+        self.hectareas_table = HectareaTableView(executor=query_executor())
+        self.hectareas_table.model().page_loaded.connect(self._on_page_loaded)
+        self.hectareas_table.model().load_failed.connect(self._on_load_failed)
+        main_layout.addWidget(self.hectareas_table)
+        self.destroyed.connect(ChangeService.subscribe("hectareas", self._on_hectareas_changed))
         
         self.setLayout(main_layout)
     
@@ -73,17 +81,19 @@ class MainScreen(QWidget):
             )
             self.email_label.setText("")
     
+    def _on_hectareas_changed(self, table):
+        """Reload the listing if it is on screen; otherwise it reloads when shown."""
+        if self.hectareas_table.isVisible() and self.hectareas_table.model().rowCount():
+            self.show_hectareas()
+    
     def show_hectareas(self):
-        """Display all hectareas."""
-        self.content_area.clear()
-        hectareas = HectareaService.get_all_hectareas()
-        
-        if hectareas:
-            texto = ""
-            for h in hectareas:
-                texto += (f"Hectárea {h[1]}:\n  Tipo: {h[2]}\n  Siembra: {h[3]}\n"
-                         f"  1ra Cosecha: {h[4]}\n  Cosecha Rutinaria: {h[5]}\n"
-                         f"  Tipo de Suelo: {h[6]}\n  Temperatura: {h[7]}\n\n")
-            self.content_area.setPlainText(texto)
-        else:
-            self.content_area.setPlainText("No hay hectáreas registradas.")
+        """Display all hectareas, loading rows page by page as the table scrolls."""
+        self.hectareas_table.refresh()
+    
+    def _on_page_loaded(self, rows):
+        """Show the empty message once the first page comes back empty."""
+        self.empty_label.setVisible(rows == 0)
+    
+    def _on_load_failed(self, message):
+        """Report a failed page load."""
+        QMessageBox.critical(self, "Error", f"No se pudieron cargar las hectáreas: {message}")
@@ -0,0 +1,63 @@
+"""Screen registry - Build screens the first time they are shown."""
+
+from importlib import import_module
+
+
+# Screen name -> (module, class). Modules are only imported when the screen
+# is first needed, so admin screens cost nothing for a regular user.
+SCREENS = {
+    "login": ("ui.screens.login", "LoginScreen"),
+    "main": ("ui.screens.main", "MainScreen"),
+    "registrar": ("ui.screens.hectareas.list", "RegistrarScreen"),
+    "buscar": ("ui.screens.hectareas.list", "BuscarScreen"),
+    "perfil": ("ui.screens.dashboard", "PerfilScreen"),
+    "informe": ("ui.screens.dashboard", "InformeScreen"),
+    "consulta": ("ui.screens.dashboard", "ConsultaScreen"),
+    # Not ported out of the legacy screens module yet
+    "gestionar_hectareas": ("screens", "GestionarHectareasScreen"),
+    "gestion_cultivo": ("ui.screens.admin_management", "GestionCultivoScreen"),
+    "usuarios": ("ui.screens.admin_management", "UserManagementScreen"),
+    "gestion_hortaliza": ("ui.screens.admin_catalog", "TipoHortalizaManagementScreen"),
+    "gestion_suelo": ("ui.screens.admin_catalog", "TipoSueloManagementScreen"),
+    "gestion_clima": ("ui.screens.admin_catalog", "ClimaManagementScreen"),
+}
+
+
+class ScreenRegistry:
+    """Lazily constructed screens, added to a stacked widget on first use.
+
+    Indexing by name builds the screen if needed and returns the cached
+    instance afterwards.
+    """
+
+    def __init__(self, controller, stack, screens=SCREENS):
+        self.controller = controller
+        self.stack = stack
+        self._entries = dict(screens)
+        self._screens = {}
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __getitem__(self, name):
+        screen = self._screens.get(name)
+        if screen is None:
+            module_name, class_name = self._entries[name]
+            screen_class = getattr(import_module(module_name), class_name)
+            screen = screen_class(self.controller)
+            self.stack.addWidget(screen)
+            self._screens[name] = screen
+        return screen
+
+    def is_loaded(self, name):
+        """Whether the screen has already been constructed."""
+        return name in self._screens
+
+    def loaded(self):
+        """Get the names of the screens constructed so far."""
+        return list(self._screens)
+
+    def load_all(self):
+        """Construct every registered screen (the old eager behaviour)."""
+        for name in self._entries:
+            self[name]
@@ -0,0 +1,166 @@
+"""Hectarea table - Virtualized model and view for hectarea listings."""
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+from services.hectarea_service import HectareaService
+
+
+def _format_text(value):
+    return "" if value is None else str(value)
+
+
+def _format_temperatura(value):
+    if value is None:
+        return ""
+    # The legacy edit dialog stores whatever text was typed
+    if not isinstance(value, (int, float)):
+        return str(value)
+    return f"{value:g} °C"
+
+
+class HectareaTableModel(QAbstractTableModel):
+    """Table model that pages hectareas in from the repository as the view scrolls.
+
+    Nothing is queried until refresh() is called; after that each fetchMore
+    loads one keyset page, and cells are only formatted when the view asks
+    for them. With an executor, pages are read on its worker threads and
+    appended when they arrive.
+    """
+
+    page_loaded = pyqtSignal(int)
+    load_failed = pyqtSignal(str)
+
+    COLUMNS = (
+        ("numero", "Hectárea", _format_text),
+        ("tipo_de_cultivo", "Tipo", _format_text),
+        ("siembra", "Siembra", _format_text),
+        ("primera_cosecha", "1ra Cosecha", _format_text),
+        ("cosecha_rutinaria", "Cosecha Rutinaria", _format_text),
+        ("tipo_suelo", "Tipo de Suelo", _format_text),
+        ("temperatura", "Temperatura", _format_temperatura),
+    )
+
+    def __init__(self, page_size=200, parent=None, executor=None, **filters):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.filters = filters
+        self._executor = executor
+        self._loading = False
+        self._fields = tuple(c[0] for c in self.COLUMNS)
+        self._rows = []
+        self._after = None
+        self._active = False
+        self._exhausted = True
+        self._order_by = "numero"
+        self._descending = False
+
+    def refresh(self, **filters):
+        """Drop loaded rows and start paging again, optionally with new filters."""
+        if filters:
+            self.filters = filters
+        self.beginResetModel()
+        self._rows = []
+        self._after = None
+        self._active = True
+        self._exhausted = False
+        self._loading = False
+        self.endResetModel()
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def row(self, position):
+        """Get the raw row shown at a position."""
+        return self._rows[position]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        field, _, formatter = self.COLUMNS[index.column()]
+        if role == Qt.DisplayRole:
+            return formatter(self._rows[index.row()][field])
+        if role == Qt.TextAlignmentRole and field in ("numero", "temperatura"):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (not parent.isValid() and self._active
+                and not self._exhausted and not self._loading)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        args = (self._after, self.page_size, self._fields)
+        kwargs = dict(order_by=self._order_by, descending=self._descending, **self.filters)
+        if self._executor is None:
+            self._add_page(HectareaService.fetch_page(*args, **kwargs))
+            return
+        # A refresh submits under the same key, so pages of the old listing are dropped
+        self._loading = True
+        self._executor.submit(
+            ("hectarea_table", id(self)), HectareaService.fetch_page, *args,
+            on_result=self._add_page, on_error=self._page_failed, **kwargs
+        )
+
+    def _add_page(self, page):
+        self._loading = False
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if page:
+            self._after = HectareaService.page_key(page[-1], self._order_by)
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+        self.page_loaded.emit(len(self._rows))
+
+    def _page_failed(self, error):
+        self._loading = False
+        self._exhausted = True
+        self.load_failed.emit(str(error))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Re-query in the requested order instead of sorting loaded rows."""
+        order_by = self.COLUMNS[column][0]
+        descending = order == Qt.DescendingOrder
+        if (order_by, descending) == (self._order_by, self._descending):
+            return
+        self._order_by = order_by
+        self._descending = descending
+        if self._active:
+            self.refresh()
+
+
+class HectareaTableView(QTableView):
+    """Read-only table view tuned for long hectarea listings."""
+
+    def __init__(self, parent=None, page_size=200, executor=None, **filters):
+        super().__init__(parent)
+        self.setModel(HectareaTableModel(page_size, self, executor, **filters))
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setAlternatingRowColors(True)
+        self.setWordWrap(False)
+        # Fixed row heights let the view skip measuring every row
+        vertical = self.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(self.fontMetrics().height() + 8)
+        vertical.hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.horizontalHeader().setSortIndicator(0, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+
+    def refresh(self, **filters):
+        """Reload the listing from the first page."""
+        self.model().refresh(**filters)
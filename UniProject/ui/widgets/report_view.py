@@ -0,0 +1,184 @@
+"""Report view - Text reports streamed from a worker thread."""
+
+from functools import partial
+
+from PyQt5.QtCore import QSemaphore, QThread, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import (
+    QHBoxLayout, QLabel, QPlainTextEdit, QProgressBar, QPushButton, QVBoxLayout, QWidget
+)
+
+
+class ReportWorker(QThread):
+    """Thread that pulls report chunks and hands them to the GUI thread.
+
+    At most max_pending chunks wait in the event queue at a time, so a fast
+    query cannot run far ahead of the document and pile text up in memory.
+    """
+
+    total_ready = pyqtSignal(int)
+    chunk_ready = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, chunks, count=None, max_pending=4, parent=None):
+        super().__init__(parent)
+        self._chunks = chunks
+        self._count = count
+        self._pending = QSemaphore(max_pending)
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the current chunk."""
+        self._cancelled = True
+
+    def chunk_consumed(self):
+        """Called by the view once a chunk has been appended."""
+        self._pending.release()
+
+    def run(self):
+        iterator = None
+        try:
+            if self._count is not None:
+                self.total_ready.emit(self._count())
+            iterator = iter(self._chunks())
+            for text, records in iterator:
+                while not self._pending.tryAcquire(1, 100):
+                    if self._cancelled:
+                        return
+                if self._cancelled:
+                    return
+                self.chunk_ready.emit(text, records)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            # Closing the generator releases its database connection
+            if iterator is not None and hasattr(iterator, "close"):
+                iterator.close()
+
+
+def _stop_workers(workers):
+    """Cancel report workers and wait for them to return."""
+    for worker in list(workers):
+        worker.cancel()
+    for worker in list(workers):
+        worker.wait()
+
+
+class ReportView(QWidget):
+    """Read-only report area that fills in while the report is produced."""
+
+    loaded = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.text_area = QPlainTextEdit()
+        self.text_area.setReadOnly(True)
+        self.text_area.setUndoRedoEnabled(False)
+        layout.addWidget(self.text_area)
+
+        status = QHBoxLayout()
+        self.progress = QProgressBar()
+        self.progress.setFormat("%v / %m")
+        status.addWidget(self.progress)
+        self.status_label = QLabel("")
+        status.addWidget(self.status_label)
+        self.btn_cancelar = QPushButton("Cancelar")
+        self.btn_cancelar.clicked.connect(self.cancel)
+        status.addWidget(self.btn_cancelar)
+        layout.addLayout(status)
+        self._set_running(False)
+
+        self._worker = None
+        self._workers = set()
+        self._records = 0
+        self._empty_text = ""
+        # Workers are not children of the view: Qt would delete a still
+        # running thread along with it. Stop them first instead; the partial
+        # holds the set, not the half-destroyed view.
+        self.destroyed.connect(partial(_stop_workers, self._workers))
+
+    def load(self, chunks, count=None, empty_text=""):
+        """Start streaming a report.
+
+        chunks is a callable returning an iterable of (text, records) and
+        count an optional callable returning the total number of records;
+        both run on the worker thread.
+        """
+        self.cancel()
+        self.text_area.clear()
+        self.status_label.setText("")
+        self._records = 0
+        self._empty_text = empty_text
+        self.progress.setRange(0, 0)
+        self.progress.setValue(0)
+        self._set_running(True)
+
+        worker = ReportWorker(chunks, count)
+        worker.total_ready.connect(self._on_total)
+        worker.chunk_ready.connect(self._on_chunk)
+        worker.failed.connect(self._on_failed)
+        worker.finished.connect(self._on_finished)
+        self._worker = worker
+        self._workers.add(worker)
+        worker.start()
+
+    def cancel(self):
+        """Stop the running report, keeping what was already shown."""
+        worker = self._worker
+        if worker is None:
+            return
+        self._worker = None
+        worker.cancel()
+        self._set_running(False)
+        self.status_label.setText(f"Informe cancelado ({self._records} registros)")
+
+    def is_running(self):
+        """Whether a report is still streaming in."""
+        return self._worker is not None
+
+    def setPlainText(self, text):
+        """Show fixed text, cancelling any running report."""
+        self.cancel()
+        self.status_label.setText("")
+        self.text_area.setPlainText(text)
+
+    def toPlainText(self):
+        return self.text_area.toPlainText()
+
+    def _on_total(self, total):
+        if self.sender() is self._worker:
+            self.progress.setRange(0, total)
+
+    def _on_chunk(self, text, records):
+        worker = self.sender()
+        if worker is self._worker:
+            # A separate cursor appends without moving the reader's viewport
+            cursor = QTextCursor(self.text_area.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            self._records += records
+            self.progress.setValue(self._records)
+        worker.chunk_consumed()
+
+    def _on_failed(self, message):
+        if self.sender() is self._worker:
+            self.status_label.setText(f"Error: {message}")
+
+    def _on_finished(self):
+        worker = self.sender()
+        self._workers.discard(worker)
+        worker.deleteLater()
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self._set_running(False)
+        if self._records == 0 and not self.status_label.text():
+            self.text_area.setPlainText(self._empty_text)
+        self.loaded.emit(self._records)
+
+    def _set_running(self, running):
+        self.progress.setVisible(running)
+        self.btn_cancelar.setVisible(running)
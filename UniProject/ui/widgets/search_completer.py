@@ -0,0 +1,96 @@
+"""Search completer - Search-as-you-type suggestions under a line edit."""
+
+import sys
+import time
+
+from PyQt5.QtCore import QModelIndex, QObject, QStringListModel, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QCompleter
+
+from config.settings import SUGGESTION_DEBOUNCE_MS, SUGGESTION_LIMIT
+from services.sugerencia_service import SugerenciaService
+
+
+class IncrementalSearch(QObject):
+    """Shows SugerenciaService suggestions in a popup while the user types.
+
+    Keystrokes restart a short timer and suggestions are looked up once
+    typing pauses, from the in-memory index only. The index is (re)built on
+    the executor when the data behind it has changed.
+    """
+
+    selected = pyqtSignal(str, object)
+
+    def __init__(self, line_edit, executor, kinds=None, limit=SUGGESTION_LIMIT,
+                 debounce_ms=SUGGESTION_DEBOUNCE_MS):
+        super().__init__(line_edit)
+        self._edit = line_edit
+        self._executor = executor
+        self._kinds = kinds
+        self._limit = limit
+        self._results = []
+        self._building = False
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.refresh)
+
+        self._model = QStringListModel(self)
+        self._completer = QCompleter(self._model, self)
+        self._completer.setWidget(line_edit)
+        # The index already filtered the list; don't let Qt filter it again
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.activated[QModelIndex].connect(self._on_activated)
+
+        line_edit.textEdited.connect(self._on_edited)
+
+    def refresh(self):
+        """Look up suggestions for the current text and show them."""
+        self._timer.stop()
+        self.prepare()
+        start = time.perf_counter()
+        self._results = SugerenciaService.suggest(self._edit.text(), self._limit, self._kinds)
+        self._model.setStringList([SugerenciaService.label(kind, value) for kind, value in self._results])
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.max_ms = max(self.max_ms, self.last_ms)
+        if self._results and self._edit.hasFocus():
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def set_kinds(self, kinds):
+        """Change which kinds of suggestions are listed."""
+        self._kinds = kinds
+
+    def results(self):
+        """The (kind, value) pairs listed in the popup."""
+        return list(self._results)
+
+    def prepare(self):
+        """Start building the index in the background if it is missing or stale."""
+        if self._building or not SugerenciaService.is_stale():
+            return
+        self._building = True
+        # One key per widget: a shared key would drop the other widget's result
+        self._executor.submit(f"sugerencias.indice.{id(self)}", SugerenciaService.build_index,
+                              on_result=self._on_index_built, on_error=self._on_index_failed)
+
+    def _on_edited(self, text):
+        self._timer.start()
+
+    def _on_index_built(self, size):
+        self._building = False
+        if self._edit.text().strip():
+            self.refresh()
+
+    def _on_index_failed(self, error):
+        self._building = False
+        sys.excepthook(type(error), error, error.__traceback__)
+
+    def _on_activated(self, index):
+        if 0 <= index.row() < len(self._results):
+            kind, value = self._results[index.row()]
+            self._edit.setText(str(value))
+            self.selected.emit(kind, value)
@@ -1,23 +1,102 @@
 """Date utilities - Date handling functions."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 
-def parse_date(date_string, format="%Y-%m-%d"):
+ISO_FORMAT = "%Y-%m-%d"
+
+
+def _is_iso_shape(value):
+    """Whether value looks exactly like YYYY-MM-DD (ASCII digits, dashes)."""
+    return (
+        isinstance(value, str) and len(value) == 10 and value.isascii()
+        and value[4] == "-" and value[7] == "-"
+        and (value[:4] + value[5:7] + value[8:]).isdigit()
+    )
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(value):
+    """Parse a YYYY-MM-DD string to datetime, memoized.
+
+    Well-formed strings take the fromisoformat fast path; anything else goes
+    through strptime, so results and error messages match
+    datetime.strptime(value, "%Y-%m-%d").
+    """
+    if _is_iso_shape(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, ISO_FORMAT)
+
+
+@lru_cache(maxsize=4096)
+def format_iso(date_obj):
+    """Format a date/datetime as YYYY-MM-DD, memoized."""
+    return date_obj.strftime(ISO_FORMAT)
+
+
+def parse_date(date_string, format=ISO_FORMAT):
     """Parse date string to datetime object."""
     try:
+        if format == ISO_FORMAT:
+            return parse_iso(date_string)
         return datetime.strptime(date_string, format)
     except ValueError:
         raise ValueError(f"Invalid date format: {date_string}. Expected format: {format}")
 
 
-def format_date(date_obj, format="%Y-%m-%d"):
+def format_date(date_obj, format=ISO_FORMAT):
     """Format datetime object to string."""
     if isinstance(date_obj, str):
         return date_obj
+    if format == ISO_FORMAT:
+        return format_iso(date_obj)
     return date_obj.strftime(format)
 
 
+def to_datetime64(values):
+    """Convert YYYY-MM-DD strings to a NumPy datetime64[D] array.
+
+    None and empty strings become NaT. Well-formed strings are checked and
+    converted in bulk; other values go through parse_date, which raises the
+    usual ValueError for anything strptime would reject.
+    """
+    import numpy as np
+
+    if not (isinstance(values, np.ndarray) and values.dtype.kind == "U"):
+        values = np.array(["" if v is None else v for v in values], dtype=str)
+    values = values.ravel()
+    result = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[D]")
+    if not len(values):
+        return result
+
+    empty = values == ""
+    fixed = values.astype("U10")
+    chars = fixed.view(np.uint32).reshape(len(values), 10)
+    digits = chars[:, [0, 1, 2, 3, 5, 6, 8, 9]]
+    shaped = (
+        (np.char.str_len(values) == 10)
+        & (chars[:, 4] == ord("-")) & (chars[:, 7] == ord("-"))
+        & ((digits >= ord("0")) & (digits <= ord("9"))).all(axis=1)
+        # NumPy has a year 0; datetime (and strptime) do not
+        & (chars[:, :4] != ord("0")).any(axis=1)
+    )
+    bulk = shaped & ~empty
+    try:
+        result[bulk] = fixed[bulk].astype("datetime64[D]")
+    except ValueError:
+        # An impossible day such as 2023-02-30; find it and report it by name
+        for value in fixed[bulk]:
+            parse_date(str(value))
+        raise
+    for index in np.flatnonzero(~shaped & ~empty):
+        result[index] = np.datetime64(parse_date(str(values[index])).date(), "D")
+    return result
+
+
 def add_days(date_obj, days):
     """Add days to a date."""
     if isinstance(date_obj, str):
@@ -0,0 +1,98 @@
+"""Fuzzy matching - Edit distance and a BK-tree for typo-tolerant lookups."""
+
+
+def _pattern(word):
+    """Bit mask of the positions of each character of word."""
+    masks = {}
+    for i, char in enumerate(word):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _distance(masks, length, text):
+    """Levenshtein distance between a pattern (see _pattern) and text.
+
+    Myers' bit-parallel algorithm: one column of the edit matrix is kept as
+    bit vectors and updated with a few integer operations per character of
+    text, instead of a loop over the pattern.
+    """
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, score = full, 0, length
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & full
+        vn = hp & xv & full
+    return score
+
+
+def levenshtein(a, b):
+    """Number of single-character insertions, deletions or substitutions turning a into b."""
+    return _distance(_pattern(a), len(a), b)
+
+
+class BKTree:
+    """Burkhard-Keller tree over words under the Levenshtein distance.
+
+    Each child is filed under its distance to the parent, so a search for
+    words within k of a query only descends into children filed between
+    d - k and d + k (triangle inequality) and skips the rest of the tree.
+    """
+
+    def __init__(self, words=()):
+        self._root = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return self._size
+
+    def add(self, word):
+        """Insert word; repeats are ignored."""
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+        masks, length = _pattern(word), len(word)
+        node = self._root
+        while True:
+            distance = _distance(masks, length, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """Get (distance, word) pairs within max_distance of word, closest first."""
+        if self._root is None:
+            return []
+        masks, length = _pattern(word), len(word)
+        found = []
+        pending = [self._root]
+        while pending:
+            candidate, children = pending.pop()
+            distance = _distance(masks, length, candidate)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+            for key, child in children.items():
+                if distance - max_distance <= key <= distance + max_distance:
+                    pending.append(child)
+        found.sort()
+        return found
@@ -0,0 +1,72 @@
+"""Prefix indexes - In-memory lookups for search-as-you-type.
+
+Both indexes answer a prefix query with a few binary searches, so the cost
+depends on the number of results asked for and not on how many entries are
+indexed.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .text_utils import fold
+
+
+# Sorts after every character, closing the range of keys sharing a prefix
+_PREFIX_END = "\U0010ffff"
+
+
+class NamePrefixIndex:
+    """Sorted folded names; matches ignore accents and case."""
+
+    def __init__(self, entries=()):
+        """Build from (name, payload) pairs."""
+        items = sorted((fold(nombre), nombre, payload) for nombre, payload in entries if nombre)
+        self._keys = [key for key, _, _ in items]
+        self._names = [nombre for _, nombre, _ in items]
+        self._payloads = [payload for _, _, payload in items]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def search(self, prefix, limit=20):
+        """Get up to limit (name, payload) pairs whose name starts with prefix."""
+        key = fold(prefix)
+        if not key:
+            return []
+        lo = bisect_left(self._keys, key)
+        hi = min(bisect_left(self._keys, key + _PREFIX_END, lo), lo + limit)
+        return list(zip(self._names[lo:hi], self._payloads[lo:hi]))
+
+
+class NumberPrefixIndex:
+    """Sorted non-negative integers matched on the digits they start with.
+
+    "12" matches 12, then 120-129, then 1200-1299 and so on, shortest first.
+    """
+
+    def __init__(self, numbers=()):
+        self._numbers = array("q", sorted(n for n in numbers if n is not None and n >= 0))
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def search(self, prefix, limit=20):
+        """Get up to limit numbers whose decimal form starts with prefix."""
+        prefix = prefix.strip()
+        if not (prefix.isascii() and prefix.isdigit()) or not self._numbers:
+            return []
+        start = int(prefix)
+        if prefix != str(start):
+            # Leading zeros: only 0 itself can start with "0"
+            return [0] if prefix == "0" and self._numbers[0] == 0 else []
+        found = []
+        lo, hi = start, start
+        largest = self._numbers[-1]
+        while lo <= largest and len(found) < limit:
+            first = bisect_left(self._numbers, lo)
+            last = bisect_right(self._numbers, hi, first)
+            found.extend(self._numbers[first:min(last, first + limit - len(found))])
+            if start == 0:
+                break
+            lo, hi = lo * 10, hi * 10 + 9
+        return found
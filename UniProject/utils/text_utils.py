@@ -0,0 +1,44 @@
+"""Text utilities - Accent- and case-insensitive keys for Spanish names."""
+
+
+# Folded character for every letter the key ignores accents or case of. The
+# same table drives fold() and the SQL expression from fold_sql(), so keys
+# computed in Python and by SQLite always agree. It is limited to Spanish
+# letters because each one adds a nested replace() to the SQL expression and
+# SQLite's parser stack allows only about two dozen.
+_FOLDS = {
+    "a": "áÁ",
+    "e": "éÉ",
+    "i": "íÍ",
+    "o": "óÓ",
+    "u": "úÚüÜ",
+    "n": "ñÑ",
+}
+FOLD_MAP = {accented: plain for plain, letters in _FOLDS.items() for accented in letters}
+FOLD_MAP.update({chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)})
+
+_FOLD_TABLE = str.maketrans(FOLD_MAP)
+
+
+def fold(text):
+    """Get the search key of a name: accents removed, ASCII letters lowercased.
+
+    Leading/trailing spaces are dropped, as by SQL trim(). None stays None.
+    """
+    if text is None:
+        return None
+    return text.strip(" ").translate(_FOLD_TABLE)
+
+
+def fold_sql(expression):
+    """Build an SQL expression computing fold() of another SQL expression.
+
+    Only built-in deterministic functions are used, so the result can back a
+    generated column and works on connections without Python functions.
+    """
+    sql = f"trim({expression})"
+    for accented, plain in FOLD_MAP.items():
+        if not ("A" <= accented <= "Z"):
+            sql = f"replace({sql}, '{accented}', '{plain}')"
+    # lower() folds ASCII only, exactly like the A-Z part of FOLD_MAP
+    return f"lower({sql})"